@@ -1,7 +1,11 @@
 from .register_user_use_case import RegisterUserUseCase
 from .login_use_case import LoginUseCase
+from .refresh_token_use_case import RefreshTokenUseCase
+from .logout_use_case import LogoutUseCase
 
 __all__ = [
     "RegisterUserUseCase",
-    "LoginUseCase"
+    "LoginUseCase",
+    "RefreshTokenUseCase",
+    "LogoutUseCase",
 ]
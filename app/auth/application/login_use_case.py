@@ -3,17 +3,21 @@ Login Use Case
 Handles user authentication logic.
 """
 
+from datetime import timedelta
 from typing import Optional
+from uuid import uuid4
 import logging
 
 from app.auth.domain.exeptions import (
     InvalidCredentialsException,
 )
 from app.auth.domain.ports import (
+    PasswordHasherPort,
+    RefreshTokenRepositoryPort,
     TokenServicePort,
     UserRepositoryPort,
 )
-from app.auth.domain.value_objects import Email, AccessToken
+from app.auth.domain.value_objects import Email, RefreshToken, TokenPair
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +29,21 @@ class LoginUseCase:
         self,
         user_repository: UserRepositoryPort,
         token_service: TokenServicePort,
+        password_hasher: PasswordHasherPort,
+        refresh_token_repository: RefreshTokenRepositoryPort,
+        refresh_token_ttl: timedelta,
     ):
         self.user_repository = user_repository
         self.token_service = token_service
+        self.password_hasher = password_hasher
+        self.refresh_token_repository = refresh_token_repository
+        self.refresh_token_ttl = refresh_token_ttl
 
     async def execute(
         self,
         email: str,
         password: str,
-    ) -> AccessToken:
+    ) -> TokenPair:
 
         logger.info(f"Login attempt for email: {email}")
 
@@ -46,7 +56,9 @@ class LoginUseCase:
             # Don't reveal if email exists or not
             raise InvalidCredentialsException()
 
-        if not user.password_hash.verify(password):
+        if not await self.password_hasher.verify(
+            password, user.password_hash
+        ):
             logger.warning(f"Login failed: invalid password - {str(user.id)}")
 
             raise InvalidCredentialsException()
@@ -56,8 +68,14 @@ class LoginUseCase:
             user_id=user.id
         )
 
+        # Each login starts a new refresh token family
+        refresh_token = RefreshToken.generate(self.refresh_token_ttl)
+        await self.refresh_token_repository.create_refresh_token(
+            user_id=user.id, family_id=uuid4(), token=refresh_token
+        )
+
         logger.info(
             f"Login successful for user: {user.id}"
         )
 
-        return access_token
+        return TokenPair(access_token=access_token, refresh_token=refresh_token)
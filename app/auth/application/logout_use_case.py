@@ -0,0 +1,64 @@
+"""
+Logout Use Case
+Handles revoking the tokens of a session.
+"""
+
+from typing import Optional
+import logging
+
+from app.auth.domain.ports import (
+    RefreshTokenRepositoryPort,
+    TokenRevocationPort,
+)
+from app.auth.domain.value_objects import RefreshToken, TokenClaims
+
+logger = logging.getLogger(__name__)
+
+
+class LogoutUseCase:
+    """
+    Use case for logging out.
+
+    Revokes the access token the request was made with and, when given,
+    the whole family of the session's refresh token, so neither can be
+    used again before it expires.
+    """
+
+    def __init__(
+        self,
+        token_revocation: Optional[TokenRevocationPort],
+        refresh_token_repository: RefreshTokenRepositoryPort,
+    ):
+        self.token_revocation = token_revocation
+        self.refresh_token_repository = refresh_token_repository
+
+    async def execute(
+        self, claims: TokenClaims, refresh_token: Optional[str] = None
+    ) -> None:
+        if self.token_revocation and claims.jti:
+            await self.token_revocation.revoke(claims)
+        else:
+            # Tokens issued without a jti simply run until their exp
+            logger.warning(
+                f"Access token of user {claims.user_id} cannot be revoked"
+            )
+
+        if refresh_token:
+            await self._revoke_refresh_token_family(claims, refresh_token)
+
+        logger.info(f"User logged out: {claims.user_id}")
+
+    async def _revoke_refresh_token_family(
+        self, claims: TokenClaims, refresh_token: str
+    ) -> None:
+        record = await self.refresh_token_repository.get_refresh_token(
+            RefreshToken.hash_token(refresh_token)
+        )
+        # Only the owner of a refresh token may end its session
+        if record is None or record.user_id != claims.user_id:
+            logger.warning("Logout: refresh token not found for user")
+            return
+
+        await self.refresh_token_repository.revoke_refresh_token_family(
+            record.family_id
+        )
@@ -0,0 +1,78 @@
+"""
+Refresh Token Use Case
+Handles exchanging a refresh token for a new token pair.
+"""
+
+from datetime import timedelta
+import logging
+
+from app.auth.domain.exeptions import (
+    InvalidTokenException,
+    TokenExpiredException,
+)
+from app.auth.domain.ports import (
+    RefreshTokenRepositoryPort,
+    TokenServicePort,
+)
+from app.auth.domain.value_objects import RefreshToken, TokenPair
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshTokenUseCase:
+    """
+    Use case for refreshing tokens with rotation.
+
+    Every refresh token can be used once: a successful refresh revokes it
+    and issues a replacement in the same family. Presenting a token that
+    was already rotated means it leaked (or the client raced itself), so
+    the whole family is revoked and the user has to log in again.
+    """
+
+    def __init__(
+        self,
+        refresh_token_repository: RefreshTokenRepositoryPort,
+        token_service: TokenServicePort,
+        refresh_token_ttl: timedelta,
+    ):
+        self.refresh_token_repository = refresh_token_repository
+        self.token_service = token_service
+        self.refresh_token_ttl = refresh_token_ttl
+
+    async def execute(self, token: str) -> TokenPair:
+        token_hash = RefreshToken.hash_token(token)
+        new_refresh_token = RefreshToken.generate(self.refresh_token_ttl)
+
+        # Happy path: a single indexed UPDATE ... RETURNING + INSERT
+        user_id = await self.refresh_token_repository.rotate_refresh_token(
+            token_hash, new_refresh_token
+        )
+        if user_id:
+            access_token = await self.token_service.create_access_token(
+                user_id=user_id
+            )
+            logger.info(f"Tokens refreshed for user: {user_id}")
+            return TokenPair(
+                access_token=access_token, refresh_token=new_refresh_token
+            )
+
+        # Work out why the token was not live
+        record = await self.refresh_token_repository.get_refresh_token(
+            token_hash
+        )
+        if record is None:
+            logger.warning("Refresh failed: unknown token")
+            raise InvalidTokenException("Invalid refresh token")
+
+        if record.is_revoked():
+            revoked = await self.refresh_token_repository.revoke_refresh_token_family(
+                record.family_id
+            )
+            logger.warning(
+                f"Refresh token reuse detected for user {record.user_id}: "
+                f"revoked {revoked} tokens of family {record.family_id}"
+            )
+            raise InvalidTokenException("Refresh token reuse detected")
+
+        logger.warning(f"Refresh failed: expired token for user {record.user_id}")
+        raise TokenExpiredException("Refresh token")
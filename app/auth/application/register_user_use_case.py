@@ -1,25 +1,24 @@
 import uuid
-from fastapi import Depends
-from passlib.context import CryptContext
 from app.auth.domain.entities import User
-from app.auth.domain.ports import UserRepositoryPort
+from app.auth.domain.ports import PasswordHasherPort, UserRepositoryPort
 from app.common.value_objects import EntityId
 
 from app.auth.domain.value_objects import (
     Email,
     Username,
     PasswordRaw,
-    PasswordHash,
 )
 from app.core.exceptions import DomainValidationException
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
 class RegisterUserUseCase:
-    def __init__(self, user_repository: UserRepositoryPort):
+    def __init__(
+        self,
+        user_repository: UserRepositoryPort,
+        password_hasher: PasswordHasherPort,
+    ):
         self._user_repository = user_repository
+        self._password_hasher = password_hasher
 
     async def execute(
         self,
@@ -56,8 +55,8 @@ class RegisterUserUseCase:
                 code="USERNAME_ALREADY_REGISTERED"
             )
 
-        hashed_password_vo = PasswordHash(
-            self._get_password_hash(password_vo.value)
+        hashed_password_vo = await self._password_hasher.hash(
+            password_vo.value
         )
 
         new_user_entity = User(
@@ -69,6 +68,3 @@ class RegisterUserUseCase:
 
         created_user = await self._user_repository.create_user(new_user_entity)
         return created_user
-
-    def _get_password_hash(self, password: str) -> str:
-        return pwd_context.hash(password)
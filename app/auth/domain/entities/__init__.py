@@ -1,5 +1,7 @@
 from .user import User
+from .refresh_token_record import RefreshTokenRecord
 
 __all__ = [
     "User",
+    "RefreshTokenRecord",
 ]
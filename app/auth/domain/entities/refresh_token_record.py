@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID
+
+from app.common.value_objects import EntityId
+
+
+@dataclass(frozen=True)
+class RefreshTokenRecord:
+    """
+    Stored state of a refresh token. Tokens issued by one login share a
+    family_id; each refresh revokes the presented token and records the
+    digest of the token that replaced it.
+    """
+    token_hash: str
+    user_id: EntityId
+    family_id: UUID
+    expires_at: datetime
+    revoked_at: Optional[datetime] = None
+    replaced_by: Optional[str] = None
+
+    def is_revoked(self) -> bool:
+        return self.revoked_at is not None
+
+    def is_expired(self) -> bool:
+        return datetime.now(timezone.utc) >= self.expires_at
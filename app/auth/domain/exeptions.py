@@ -33,3 +33,12 @@ class TokenExpiredException(AuthenticationException):
         super().__init__(
             message=f"{token_type} has expired", code="TOKEN_EXPIRED"
         )
+
+
+class TokenRevokedException(AuthenticationException):
+    """Raised when a token was revoked before its expiry."""
+
+    def __init__(self, token_type: str = "Token"):
+        super().__init__(
+            message=f"{token_type} has been revoked", code="TOKEN_REVOKED"
+        )
@@ -1,7 +1,15 @@
 from .user_repository_port import UserRepositoryPort
 from .token_service_port import TokenServicePort
+from .password_hasher_port import PasswordHasherPort
+from .refresh_token_repository_port import RefreshTokenRepositoryPort
+from .revoked_token_repository_port import RevokedTokenRepositoryPort
+from .token_revocation_port import TokenRevocationPort
 
 __all__ = [
     "UserRepositoryPort",
     "TokenServicePort",
+    "PasswordHasherPort",
+    "RefreshTokenRepositoryPort",
+    "RevokedTokenRepositoryPort",
+    "TokenRevocationPort",
 ]
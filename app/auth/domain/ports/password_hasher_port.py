@@ -0,0 +1,36 @@
+"""
+Password Hasher Port
+Interface for password hashing and verification.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+from app.auth.domain.value_objects import PasswordHash
+
+
+class PasswordHasherPort(ABC):
+    """Interface for CPU-bound password hashing operations."""
+
+    @abstractmethod
+    async def hash(self, plain_password: str) -> PasswordHash:
+        """
+        Hash a plain password.
+        """
+        pass
+
+    @abstractmethod
+    async def verify(
+        self, plain_password: str, password_hash: PasswordHash
+    ) -> bool:
+        """
+        Verify a plain password against a stored hash.
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """
+        Concurrency and queue-depth statistics.
+        """
+        pass
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from app.auth.domain.entities import RefreshTokenRecord
+from app.auth.domain.value_objects import RefreshToken
+from app.common.value_objects import EntityId
+
+
+class RefreshTokenRepositoryPort(ABC):
+    @abstractmethod
+    async def create_refresh_token(
+        self, user_id: EntityId, family_id: UUID, token: RefreshToken
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def rotate_refresh_token(
+        self, token_hash: str, new_token: RefreshToken
+    ) -> Optional[EntityId]:
+        """
+        Revoke the live token with token_hash and store new_token in its
+        family, atomically. Returns the owner's id, or None when no live
+        token matched (unknown, expired or already used).
+        """
+        pass
+
+    @abstractmethod
+    async def get_refresh_token(
+        self, token_hash: str
+    ) -> Optional[RefreshTokenRecord]:
+        pass
+
+    @abstractmethod
+    async def revoke_refresh_token_family(self, family_id: UUID) -> int:
+        """Revoke every live token of a family; returns how many."""
+        pass
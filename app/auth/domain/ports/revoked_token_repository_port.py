@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+
+from app.common.value_objects import EntityId
+
+
+class RevokedTokenRepositoryPort(ABC):
+    @abstractmethod
+    async def revoke_token(
+        self, jti: str, user_id: EntityId, expires_at: datetime
+    ) -> None:
+        """Record jti as revoked until expires_at; idempotent."""
+        pass
+
+    @abstractmethod
+    async def is_token_revoked(self, jti: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def get_revoked_token_ids(self) -> List[str]:
+        """jti of every revoked token that has not expired yet."""
+        pass
+
+    @abstractmethod
+    async def delete_expired_revoked_tokens(self) -> int:
+        """Drop revocations of tokens past their expiry; returns how many."""
+        pass
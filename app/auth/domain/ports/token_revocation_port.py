@@ -0,0 +1,26 @@
+"""
+Token Revocation Port
+Interface for revoking access tokens before they expire.
+"""
+
+from abc import ABC, abstractmethod
+
+from app.auth.domain.value_objects import TokenClaims
+
+
+class TokenRevocationPort(ABC):
+    """Interface for the access token deny-list."""
+
+    @abstractmethod
+    async def revoke(self, claims: TokenClaims) -> None:
+        """
+        Revoke the token described by claims until it expires.
+        """
+        pass
+
+    @abstractmethod
+    async def is_revoked(self, jti: str) -> bool:
+        """
+        Check whether the token with jti was revoked.
+        """
+        pass
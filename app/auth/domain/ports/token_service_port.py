@@ -6,6 +6,7 @@ Interface for JWT token operations.
 from abc import ABC, abstractmethod
 from app.auth.domain.value_objects import (
     AccessToken,
+    TokenClaims,
 )
 from app.common.value_objects import EntityId
 
@@ -22,6 +23,13 @@ class TokenServicePort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def decode_access_token(self, token: str) -> TokenClaims:
+        """
+        Verify access token and return its claims.
+        """
+        pass
+
     @abstractmethod
     async def verify_access_token(self, token: str) -> EntityId:
         """
@@ -3,6 +3,8 @@ from .password_hash import PasswordHash
 from .password_raw import PasswordRaw
 from .username import Username
 from .access_token import AccessToken
+from .token_claims import TokenClaims
+from .refresh_token import RefreshToken, TokenPair
 
 __all__ = [
     "Email",
@@ -10,4 +12,7 @@ __all__ = [
     "PasswordRaw",
     "Username",
     "AccessToken",
+    "TokenClaims",
+    "RefreshToken",
+    "TokenPair",
 ]
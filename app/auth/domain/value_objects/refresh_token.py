@@ -0,0 +1,68 @@
+"""
+Refresh Token Value Objects
+Represents opaque refresh tokens and the token pair issued to clients.
+"""
+
+import hashlib
+import secrets
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+
+from app.auth.domain.value_objects.access_token import AccessToken
+
+
+@dataclass(frozen=True)
+class RefreshToken:
+    """
+    Opaque refresh token value object.
+
+    Only the SHA-256 digest of the token is ever stored, so a leaked table
+    cannot be replayed.
+    """
+
+    token: str
+    expires_at: datetime  # timezone-aware UTC
+
+    @classmethod
+    def generate(cls, ttl: timedelta) -> "RefreshToken":
+        """Create a new random token valid for ttl."""
+        return cls(
+            token=secrets.token_urlsafe(32),
+            expires_at=datetime.now(timezone.utc) + ttl,
+        )
+
+    @staticmethod
+    def hash_token(token: str) -> str:
+        """Digest under which a token is stored and looked up."""
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    @property
+    def token_hash(self) -> str:
+        return self.hash_token(self.token)
+
+    def to_dict(self) -> Dict[str, Any]:
+        expires_in = int(
+            (self.expires_at - datetime.now(timezone.utc)).total_seconds()
+        )
+        return {
+            "refresh_token": self.token,
+            "refresh_expires_in": expires_in,
+        }
+
+    def __str__(self) -> str:
+        return self.token
+
+
+@dataclass(frozen=True)
+class TokenPair:
+    """Access token plus the refresh token that renews it."""
+
+    access_token: AccessToken
+    refresh_token: RefreshToken
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **self.access_token.to_dict(),
+            **self.refresh_token.to_dict(),
+        }
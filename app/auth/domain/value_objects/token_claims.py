@@ -0,0 +1,23 @@
+"""
+Token Claims Value Object
+Represents the verified claims of an access token.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.common.value_objects import EntityId
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    """Claims of a verified access token."""
+
+    user_id: EntityId
+    expires_at: datetime  # timezone-aware UTC
+    jti: Optional[str] = None  # unique token id, used for revocation
+
+    def is_expired(self) -> bool:
+        """Check if token is expired."""
+        return datetime.now(timezone.utc) >= self.expires_at
@@ -1,5 +1,15 @@
+from .key_ring import KeyRing
 from .jwt_token_service import JWTTokenService
+from .bcrypt_password_hasher import BcryptPasswordHasher
+from .caching_token_service import CachingTokenService
+from .bloom_filter import BloomFilter
+from .bloom_filter_token_revocation import BloomFilterTokenRevocation
 
 __all__ = [
+    "KeyRing",
     "JWTTokenService",
+    "BcryptPasswordHasher",
+    "CachingTokenService",
+    "BloomFilter",
+    "BloomFilterTokenRevocation",
 ]
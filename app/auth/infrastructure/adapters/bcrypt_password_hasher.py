@@ -0,0 +1,83 @@
+"""
+Bcrypt Password Hasher Implementation
+Runs bcrypt hashing and verification in a bounded thread pool so the
+event loop keeps serving other requests while a hash is computed.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, TypeVar
+
+from passlib.context import CryptContext
+
+from app.auth.domain.ports import PasswordHasherPort
+from app.auth.domain.value_objects import PasswordHash
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BcryptPasswordHasher(PasswordHasherPort):
+    """Bcrypt implementation of the password hasher port."""
+
+    def __init__(self, max_workers: int = 2, max_concurrency: int = 2):
+        # bcrypt releases the GIL, so threads give real parallelism here
+        self._pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hasher"
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_workers = max_workers
+        self._max_concurrency = max_concurrency
+
+        # Metrics
+        self._in_flight = 0
+        self._queued = 0
+        self._peak_queued = 0
+        self._completed = 0
+
+    async def hash(self, plain_password: str) -> PasswordHash:
+        hashed = await self._run(self._pwd_context.hash, plain_password)
+        return PasswordHash(hashed)
+
+    async def verify(
+        self, plain_password: str, password_hash: PasswordHash
+    ) -> bool:
+        return await self._run(
+            self._pwd_context.verify, plain_password, password_hash.value
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self._max_workers,
+            "max_concurrency": self._max_concurrency,
+            "in_flight": self._in_flight,
+            "queued": self._queued,
+            "peak_queued": self._peak_queued,
+            "completed": self._completed,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("Password hasher executor shut down")
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a hashing call in the executor under the concurrency limit."""
+        self._queued += 1
+        self._peak_queued = max(self._peak_queued, self._queued)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queued -= 1
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+            self._semaphore.release()
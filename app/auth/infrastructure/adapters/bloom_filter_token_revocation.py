@@ -0,0 +1,194 @@
+"""
+Bloom Filter Token Revocation
+Access token deny-list kept in the database and screened per worker by
+an in-memory Bloom filter.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, AsyncContextManager, Callable, Dict, Optional, Set
+
+from app.auth.domain.ports import (
+    RevokedTokenRepositoryPort,
+    TokenRevocationPort,
+)
+from app.auth.domain.value_objects import TokenClaims
+from app.auth.infrastructure.adapters.bloom_filter import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+RepositoryScope = Callable[[], AsyncContextManager[RevokedTokenRepositoryPort]]
+
+
+class BloomFilterTokenRevocation(TokenRevocationPort):
+    """
+    Revoked jtis live in the revoked_tokens table; every worker mirrors
+    them in a Bloom filter rebuilt every refresh_seconds.
+
+    A jti missing from the filter is definitely not revoked (as of the
+    last rebuild), so the common case costs a few hashes and no I/O. Only
+    probable hits are confirmed against the database, and the answers are
+    remembered until the next rebuild. Revocations made on this worker are
+    added to the filter immediately; revocations made on other workers are
+    seen after at most refresh_seconds.
+
+    Until the first rebuild succeeds every check goes to the database.
+    """
+
+    def __init__(
+        self,
+        repository_scope: RepositoryScope,
+        capacity: int,
+        error_rate: float,
+        refresh_seconds: float,
+        confirmed_max_entries: int = 10_000,
+    ):
+        self.repository_scope = repository_scope
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.refresh_seconds = refresh_seconds
+
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._loaded = False
+        self._confirmed: "OrderedDict[str, bool]" = OrderedDict()
+        self._confirmed_max_entries = confirmed_max_entries
+        # jtis revoked here while a rebuild is reading the table
+        self._pending: Optional[Set[str]] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refreshed_at: Optional[float] = None
+
+        # Metrics
+        self._checks = 0
+        self._filter_negatives = 0
+        self._store_lookups = 0
+        self._false_positives = 0
+        self._revocations = 0
+        self._refreshes = 0
+        self._refresh_errors = 0
+
+    # ------------------------------------------------------------------
+    # TokenRevocationPort
+    # ------------------------------------------------------------------
+
+    async def revoke(self, claims: TokenClaims) -> None:
+        async with self.repository_scope() as repository:
+            await repository.revoke_token(
+                claims.jti, claims.user_id, claims.expires_at
+            )
+
+        self._bloom.add(claims.jti)
+        if self._pending is not None:
+            self._pending.add(claims.jti)
+        self._remember(claims.jti, True)
+        self._revocations += 1
+
+    async def is_revoked(self, jti: str) -> bool:
+        self._checks += 1
+        if self._loaded and jti not in self._bloom:
+            self._filter_negatives += 1
+            return False
+
+        revoked = self._confirmed.get(jti)
+        if revoked is not None:
+            self._confirmed.move_to_end(jti)
+            return revoked
+
+        self._store_lookups += 1
+        async with self.repository_scope() as repository:
+            revoked = await repository.is_token_revoked(jti)
+
+        if self._loaded and not revoked:
+            self._false_positives += 1
+        self._remember(jti, revoked)
+        return revoked
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Load the filter and start refreshing it in the background."""
+        try:
+            await self.refresh()
+        except Exception as e:
+            self._refresh_errors += 1
+            logger.error(f"Token revocation list load failed: {str(e)}")
+
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        if self._refresh_task is None:
+            return
+
+        self._refresh_task.cancel()
+        try:
+            await self._refresh_task
+        except asyncio.CancelledError:
+            pass
+        self._refresh_task = None
+
+    async def refresh(self) -> None:
+        """Rebuild the filter from the live rows of revoked_tokens."""
+        self._pending = set()
+        try:
+            async with self.repository_scope() as repository:
+                await repository.delete_expired_revoked_tokens()
+                jtis = await repository.get_revoked_token_ids()
+
+            # Grow past capacity rather than let the error rate degrade
+            bloom = BloomFilter.from_items(
+                jtis, max(self.capacity, len(jtis)), self.error_rate
+            )
+            for jti in self._pending:
+                bloom.add(jti)
+        finally:
+            pending, self._pending = self._pending, None
+
+        self._bloom = bloom
+        self._confirmed.clear()
+        for jti in pending:
+            self._remember(jti, True)
+        self._loaded = True
+        self._refreshed_at = time.monotonic()
+        self._refreshes += 1
+        logger.debug(f"Token revocation list loaded: {len(jtis)} tokens")
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                await self.refresh()
+            except Exception as e:
+                self._refresh_errors += 1
+                logger.error(f"Token revocation list refresh failed: {str(e)}")
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _remember(self, jti: str, revoked: bool) -> None:
+        self._confirmed[jti] = revoked
+        self._confirmed.move_to_end(jti)
+        while len(self._confirmed) > self._confirmed_max_entries:
+            self._confirmed.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self._loaded,
+            "revoked_tokens": self._bloom.count,
+            "filter_bits": self._bloom.size,
+            "filter_hashes": self._bloom.hash_count,
+            "checks": self._checks,
+            "filter_negatives": self._filter_negatives,
+            "store_lookups": self._store_lookups,
+            "false_positives": self._false_positives,
+            "revocations": self._revocations,
+            "refreshes": self._refreshes,
+            "refresh_errors": self._refresh_errors,
+            "last_refresh_seconds_ago": (
+                round(time.monotonic() - self._refreshed_at, 1)
+                if self._refreshed_at is not None else None
+            ),
+        }
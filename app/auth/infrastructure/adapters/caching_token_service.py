@@ -0,0 +1,93 @@
+"""
+Caching Token Service
+Verification cache decorator around a TokenServicePort.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.auth.domain.ports import TokenServicePort
+from app.auth.domain.value_objects import AccessToken, TokenClaims
+from app.common.value_objects import EntityId
+
+
+class CachingTokenService(TokenServicePort):
+    """
+    Remembers the claims of verified access tokens so repeat requests
+    with the same token skip signature verification.
+
+    Entries are keyed by the SHA-256 digest of the token (the raw token is
+    never kept), bounded by max_entries in LRU order, and dropped once the
+    token's exp has passed, so an expired token always reaches the wrapped
+    service and fails there. Invalid tokens are never cached.
+    """
+
+    def __init__(self, token_service: TokenServicePort, max_entries: int):
+        self.token_service = token_service
+        self._entries: "OrderedDict[bytes, Tuple[TokenClaims, float]]" = (
+            OrderedDict()
+        )
+        self._max_entries = max_entries
+
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    async def create_access_token(self, user_id: EntityId) -> AccessToken:
+        return await self.token_service.create_access_token(user_id)
+
+    async def verify_access_token(self, token: str) -> EntityId:
+        claims = await self.decode_access_token(token)
+        return claims.user_id
+
+    async def decode_access_token(self, token: str) -> TokenClaims:
+        key = hashlib.sha256(token.encode()).digest()
+
+        claims = self._get(key)
+        if claims:
+            return claims
+
+        claims = await self.token_service.decode_access_token(token)
+        self._set(key, claims)
+        return claims
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+        }
+
+    def _get(self, key: bytes) -> Optional[TokenClaims]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        claims, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return claims
+
+    def _set(self, key: bytes, claims: TokenClaims) -> None:
+        self._entries[key] = (claims, claims.expires_at.timestamp())
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
@@ -4,7 +4,9 @@ Handles JWT creation, validation, and refresh token storage.
 """
 
 import logging
-from datetime import datetime, timedelta
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
 
 import jwt
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -16,7 +18,9 @@ from app.auth.domain.exeptions import (
 from app.auth.domain.ports import TokenServicePort
 from app.auth.domain.value_objects import (
     AccessToken,
+    TokenClaims,
 )
+from app.auth.infrastructure.adapters.key_ring import KeyRing
 from app.common.value_objects import EntityId
 from app.core.config import get_settings
 
@@ -32,11 +36,14 @@ class JWTTokenService(TokenServicePort):
     ALGORITHM = settings.JWT_ALGORITHM
     TOKEN_TYPE = settings.TOKEN_TYPE
 
-    def __init__(self):
+    def __init__(self, key_ring: Optional[KeyRing] = None):
 
         # Get secrets from settings
         self.access_secret = settings.SECRET_KEY
 
+        # Asymmetric algorithms sign and verify with the key ring instead
+        self.key_ring = key_ring
+
     async def create_access_token(
         self, user_id: EntityId
     ) -> AccessToken:
@@ -63,11 +70,21 @@ class JWTTokenService(TokenServicePort):
             "type": "access",  # Token type
             "iat": now,  # Issued at
             "exp": expires_at,  # Expiration
+            "jti": uuid.uuid4().hex,  # Token id, lets the token be revoked
         }
 
-        token = jwt.encode(
-            payload, self.access_secret, algorithm=self.ALGORITHM
-        )
+        if self.key_ring:
+            signing_key = self.key_ring.signing_key()
+            token = jwt.encode(
+                payload,
+                signing_key.private_key,
+                algorithm=self.ALGORITHM,
+                headers={"kid": signing_key.kid},
+            )
+        else:
+            token = jwt.encode(
+                payload, self.access_secret, algorithm=self.ALGORITHM
+            )
 
         return AccessToken(
             token=token,
@@ -77,17 +94,29 @@ class JWTTokenService(TokenServicePort):
 
     async def verify_access_token(self, token: str) -> EntityId:
         """Verify and decode access token."""
+        claims = await self.decode_access_token(token)
+        return claims.user_id
+
+    async def decode_access_token(self, token: str) -> TokenClaims:
+        """Verify access token signature and expiry and return its claims."""
         try:
             payload = jwt.decode(
-                token, self.access_secret, algorithms=[self.ALGORITHM]
+                token,
+                self._verification_key(token),
+                algorithms=[self.ALGORITHM],
             )
 
             # Check token type
             if payload.get("type") != "access":
                 raise InvalidTokenException("Invalid token type")
 
-            user_id = EntityId(payload["sub"])
-            return user_id
+            return TokenClaims(
+                user_id=EntityId(payload["sub"]),
+                expires_at=datetime.fromtimestamp(
+                    payload["exp"], tz=timezone.utc
+                ),
+                jti=payload.get("jti"),
+            )
 
         except jwt.ExpiredSignatureError:
             logger.warning("Access token expired")
@@ -98,3 +127,14 @@ class JWTTokenService(TokenServicePort):
         except Exception as e:
             logger.error(f"Error verifying access token: {str(e)}")
             raise InvalidTokenException("Token verification failed")
+
+    def _verification_key(self, token: str) -> Any:
+        """Secret or public key that must have signed token."""
+        if not self.key_ring:
+            return self.access_secret
+
+        kid = jwt.get_unverified_header(token).get("kid")
+        public_key = self.key_ring.verification_key(kid) if kid else None
+        if public_key is None:
+            raise jwt.InvalidTokenError(f"Unknown signing key: {kid}")
+        return public_key
@@ -0,0 +1,239 @@
+"""
+JWT Key Ring
+Asymmetric signing keys loaded from a local key directory.
+"""
+
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed448, ed25519, rsa
+from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+
+logger = logging.getLogger(__name__)
+
+PRIVATE_KEY_SUFFIX = ".pem"
+PUBLIC_KEY_SUFFIX = ".pub.pem"
+
+# Key classes accepted for each JWT algorithm, and how to publish them
+ALGORITHM_KEYS = {
+    "RS256": ((rsa.RSAPrivateKey, rsa.RSAPublicKey), RSAAlgorithm),
+    "EdDSA": (
+        (
+            ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey,
+            ed448.Ed448PrivateKey, ed448.Ed448PublicKey,
+        ),
+        OKPAlgorithm,
+    ),
+}
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    """One parsed key of the ring."""
+
+    kid: str
+    public_key: Any
+    private_key: Optional[Any] = None
+    modified_at: float = 0.0
+
+
+class KeyRing:
+    """
+    In-memory ring of RS256 or EdDSA keys read from key_dir.
+
+    Every ``<kid>.pem`` file holds a private key (sign + verify) and every
+    ``<kid>.pub.pem`` file a public key (verify only, e.g. a retired key
+    whose tokens are still alive). Keys are parsed once and cached; the
+    directory is rescanned at most every refresh_seconds, and only files
+    whose mtime changed are parsed again.
+
+    Tokens are signed with signing_kid when given. Otherwise the newest
+    private key that has been on disk for at least publish_delay_seconds
+    signs, falling back to the newest private key. Setting the delay to
+    the JWKS max-age plus refresh_seconds means every worker and every
+    downstream JWKS cache knows a new key before the first token it signs.
+    """
+
+    def __init__(
+        self,
+        key_dir: str,
+        algorithm: str,
+        refresh_seconds: float = 60,
+        publish_delay_seconds: float = 0,
+        signing_kid: Optional[str] = None,
+    ):
+        if algorithm not in ALGORITHM_KEYS:
+            raise ValueError(f"Unsupported key ring algorithm: {algorithm}")
+
+        self.key_dir = key_dir
+        self.algorithm = algorithm
+        self.refresh_seconds = refresh_seconds
+        self.publish_delay_seconds = publish_delay_seconds
+        self.signing_kid = signing_kid
+
+        self._key_types, self._jwk_algorithm = ALGORITHM_KEYS[algorithm]
+        self._keys: Dict[str, SigningKey] = {}
+        self._files: Dict[str, float] = {}
+        self._jwks_json = b'{"keys":[]}'
+        self._next_refresh = 0.0
+        self._reloads = 0
+
+        self.reload()
+        if not any(key.private_key for key in self._keys.values()):
+            raise ValueError(f"No private {algorithm} key found in {key_dir}")
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def signing_key(self) -> SigningKey:
+        """Key used to sign new tokens."""
+        self._maybe_refresh()
+
+        if self.signing_kid:
+            key = self._keys.get(self.signing_kid)
+            if key and key.private_key:
+                return key
+            logger.warning(f"Signing key {self.signing_kid} not in key ring")
+
+        private_keys = sorted(
+            (key for key in self._keys.values() if key.private_key),
+            key=lambda key: key.modified_at,
+            reverse=True,
+        )
+        published_before = time.time() - self.publish_delay_seconds
+        for key in private_keys:
+            if key.modified_at <= published_before:
+                return key
+        return private_keys[0]
+
+    def verification_key(self, kid: str) -> Optional[Any]:
+        """Public key for kid, or None for a kid not in the ring."""
+        # Unknown kids never force a rescan, so forged headers cannot make
+        # every request hit the filesystem.
+        self._maybe_refresh()
+        key = self._keys.get(kid)
+        return key.public_key if key else None
+
+    def jwks_json(self) -> bytes:
+        """Serialized JWKS document of every public key in the ring."""
+        self._maybe_refresh()
+        return self._jwks_json
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "algorithm": self.algorithm,
+            "keys": sorted(self._keys),
+            "reloads": self._reloads,
+        }
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _maybe_refresh(self) -> bool:
+        if time.monotonic() < self._next_refresh:
+            return False
+        return self.reload()
+
+    def reload(self) -> bool:
+        """Rescan key_dir; returns True when the set of keys changed."""
+        self._next_refresh = time.monotonic() + self.refresh_seconds
+
+        files = self._scan()
+        if files == self._files:
+            return False
+
+        keys: Dict[str, SigningKey] = {}
+        for kid, (path, modified_at) in self._kid_files(files).items():
+            cached = self._keys.get(kid)
+            if cached and cached.modified_at == modified_at:
+                keys[kid] = cached
+                continue
+
+            key = self._load_key(kid, path, modified_at)
+            if key:
+                keys[kid] = key
+
+        self._files = files
+        self._keys = keys
+        self._jwks_json = orjson.dumps({"keys": self._jwks()})
+        self._reloads += 1
+        logger.info(f"JWT key ring loaded: {', '.join(sorted(keys)) or 'empty'}")
+        return True
+
+    def _scan(self) -> Dict[str, float]:
+        try:
+            with os.scandir(self.key_dir) as entries:
+                return {
+                    entry.name: entry.stat().st_mtime
+                    for entry in entries
+                    if entry.is_file() and entry.name.endswith(PRIVATE_KEY_SUFFIX)
+                }
+        except OSError as e:
+            logger.error(f"Cannot read JWT key directory {self.key_dir}: {e}")
+            return self._files
+
+    def _kid_files(
+        self, files: Dict[str, float]
+    ) -> Dict[str, Tuple[str, float]]:
+        """kid -> (path, mtime); a private key wins over a public one."""
+        kid_files: Dict[str, Tuple[str, float]] = {}
+        # Public keys first so a private key with the same kid replaces them
+        for name in sorted(
+            files, key=lambda name: not name.endswith(PUBLIC_KEY_SUFFIX)
+        ):
+            suffix = (
+                PUBLIC_KEY_SUFFIX if name.endswith(PUBLIC_KEY_SUFFIX)
+                else PRIVATE_KEY_SUFFIX
+            )
+            kid = name[:-len(suffix)]
+            kid_files[kid] = (os.path.join(self.key_dir, name), files[name])
+        return kid_files
+
+    def _load_key(
+        self, kid: str, path: str, modified_at: float
+    ) -> Optional[SigningKey]:
+        try:
+            with open(path, "rb") as key_file:
+                data = key_file.read()
+
+            if path.endswith(PUBLIC_KEY_SUFFIX):
+                private_key = None
+                public_key = serialization.load_pem_public_key(data)
+            else:
+                private_key = serialization.load_pem_private_key(
+                    data, password=None
+                )
+                public_key = private_key.public_key()
+        except (OSError, ValueError, TypeError) as e:
+            logger.error(f"Cannot load JWT key {path}: {e}")
+            return None
+
+        if not isinstance(public_key, self._key_types):
+            logger.error(f"JWT key {path} is not a {self.algorithm} key")
+            return None
+
+        return SigningKey(
+            kid=kid,
+            public_key=public_key,
+            private_key=private_key,
+            modified_at=modified_at,
+        )
+
+    def _jwks(self) -> List[Dict[str, Any]]:
+        jwks = []
+        for kid in sorted(self._keys):
+            jwk = self._jwk_algorithm.to_jwk(
+                self._keys[kid].public_key, as_dict=True
+            )
+            # "use" and "key_ops" should not be combined (RFC 7517 4.3)
+            jwk.pop("key_ops", None)
+            jwk.update(kid=kid, alg=self.algorithm, use="sig")
+            jwks.append(jwk)
+        return jwks
@@ -0,0 +1,147 @@
+"""
+Auth Module Container
+Application-scoped singletons and per-request factories for the auth module.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import Any, AsyncIterator, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import Settings
+from app.core.database import async_session_factory
+from app.auth.application import (
+    RegisterUserUseCase,
+    LoginUseCase,
+    RefreshTokenUseCase,
+    LogoutUseCase,
+)
+from app.auth.domain.ports import RevokedTokenRepositoryPort, TokenServicePort
+from app.auth.infrastructure.adapters import (
+    BcryptPasswordHasher,
+    BloomFilterTokenRevocation,
+    CachingTokenService,
+    JWTTokenService,
+    KeyRing,
+)
+from app.auth.infrastructure.repositories import (
+    RefreshTokenRepository,
+    RevokedTokenRepository,
+    UserRepository,
+)
+from app.auth.infrastructure.presentation.controllers import (
+    AuthController
+)
+
+
+class AuthContainer:
+    """
+    Holds the token service, token revocation list and password hasher
+    for the lifetime of the process and builds the session-bound
+    controller for each request.
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.key_ring = self._build_key_ring()
+        self.token_cache: Optional[CachingTokenService] = None
+        self.token_service: TokenServicePort = JWTTokenService(self.key_ring)
+        if settings.TOKEN_CACHE_ENABLED:
+            self.token_cache = CachingTokenService(
+                self.token_service,
+                max_entries=settings.TOKEN_CACHE_MAX_ENTRIES,
+            )
+            self.token_service = self.token_cache
+        self.token_revocation: Optional[BloomFilterTokenRevocation] = (
+            BloomFilterTokenRevocation(
+                self.revoked_token_repository_scope,
+                capacity=settings.TOKEN_REVOCATION_BLOOM_CAPACITY,
+                error_rate=settings.TOKEN_REVOCATION_BLOOM_ERROR_RATE,
+                refresh_seconds=settings.TOKEN_REVOCATION_REFRESH_SECONDS,
+            )
+            if settings.TOKEN_REVOCATION_ENABLED else None
+        )
+        self.password_hasher = BcryptPasswordHasher(
+            max_workers=settings.PASSWORD_HASH_MAX_WORKERS,
+            max_concurrency=settings.PASSWORD_HASH_MAX_CONCURRENCY,
+        )
+
+    def auth_controller(self, session: AsyncSession) -> AuthController:
+        """AuthController with every use case bound to session."""
+        user_repository = UserRepository(session)
+        refresh_token_repository = RefreshTokenRepository(session)
+        refresh_token_ttl = timedelta(
+            days=self.settings.REFRESH_TOKEN_EXPIRE_DAYS
+        )
+        return AuthController(
+            register_use_case=RegisterUserUseCase(
+                user_repository, self.password_hasher
+            ),
+            login_use_case=LoginUseCase(
+                user_repository=user_repository,
+                token_service=self.token_service,
+                password_hasher=self.password_hasher,
+                refresh_token_repository=refresh_token_repository,
+                refresh_token_ttl=refresh_token_ttl,
+            ),
+            refresh_token_use_case=RefreshTokenUseCase(
+                refresh_token_repository=refresh_token_repository,
+                token_service=self.token_service,
+                refresh_token_ttl=refresh_token_ttl,
+            ),
+            logout_use_case=LogoutUseCase(
+                token_revocation=self.token_revocation,
+                refresh_token_repository=refresh_token_repository,
+            ),
+        )
+
+    @asynccontextmanager
+    async def revoked_token_repository_scope(
+        self,
+    ) -> AsyncIterator[RevokedTokenRepositoryPort]:
+        """
+        RevokedTokenRepository on its own session, closed when the scope
+        exits. Used by the application-scoped revocation list.
+        """
+        async with async_session_factory() as session:
+            yield RevokedTokenRepository(session)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "password_hasher": self.password_hasher.stats(),
+            "token_cache": (
+                self.token_cache.stats() if self.token_cache else None
+            ),
+            "key_ring": self.key_ring.stats() if self.key_ring else None,
+            "token_revocation": (
+                self.token_revocation.stats()
+                if self.token_revocation else None
+            ),
+        }
+
+    async def start(self) -> None:
+        if self.token_revocation:
+            await self.token_revocation.start()
+
+    async def shutdown(self) -> None:
+        if self.token_revocation:
+            await self.token_revocation.stop()
+        self.password_hasher.shutdown()
+
+    def _build_key_ring(self) -> Optional[KeyRing]:
+        """Key ring for RS256/EdDSA; HS256 signs with SECRET_KEY."""
+        if self.settings.JWT_ALGORITHM == "HS256":
+            return None
+
+        return KeyRing(
+            key_dir=self.settings.JWT_KEYS_DIR,
+            algorithm=self.settings.JWT_ALGORITHM,
+            refresh_seconds=self.settings.JWT_KEYS_REFRESH_SECONDS,
+            # A new key signs only once every worker and JWKS cache has it
+            publish_delay_seconds=(
+                self.settings.JWKS_CACHE_MAX_AGE
+                + self.settings.JWT_KEYS_REFRESH_SECONDS
+            ),
+            signing_kid=self.settings.JWT_SIGNING_KID,
+        )
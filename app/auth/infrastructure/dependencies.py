@@ -1,85 +1,45 @@
-from typing import Annotated
+from typing import Annotated, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.container import AppContainer, get_container
 from app.core.database import get_async_session
-from app.auth.application import RegisterUserUseCase, LoginUseCase
-from app.auth.infrastructure.repositories import (
-    UserRepository
-)
 from app.auth.infrastructure.presentation.controllers import (
     AuthController
 )
-from app.auth.infrastructure.adapters import JWTTokenService
-from app.auth.domain.exeptions import InvalidTokenException, TokenExpiredException
+from app.auth.infrastructure.adapters import KeyRing
+from app.auth.domain.exeptions import (
+    InvalidTokenException,
+    TokenExpiredException,
+    TokenRevokedException,
+)
+from app.auth.domain.value_objects import TokenClaims
 from app.common.value_objects import EntityId
 
 security = HTTPBearer()
 
-# ============================================================================
-# Service Dependencies
-# ============================================================================
-
-
-async def get_user_repository(
-    session: Annotated[AsyncSession, Depends(get_async_session)],
-) -> UserRepository:
-    """Get UserRepository instance."""
-    return UserRepository(session)
-
-
-async def get_token_service() -> JWTTokenService:
-    """Get JWTTokenService instance."""
-    return JWTTokenService()
-
-
-# ============================================================================
-# Service Dependencies
-# ============================================================================
-
-
-async def get_register_user_use_case(
-    user_repository: Annotated[
-        UserRepository, Depends(get_user_repository)
-    ]
-) -> RegisterUserUseCase:
-    return RegisterUserUseCase(user_repository)
-
-
-async def get_login_use_case(
-    user_repository: Annotated[
-        UserRepository, Depends(get_user_repository)
-    ],
-    token_service: Annotated[
-        JWTTokenService, Depends(get_token_service)
-    ]
-) -> LoginUseCase:
-    return LoginUseCase(
-        user_repository=user_repository,
-        token_service=token_service
-    )
-
 # ============================================================================
 # Controller Dependencies
 # ============================================================================
 
 
 async def get_auth_controller(
-    register_use_case: Annotated[
-        RegisterUserUseCase, Depends(get_register_user_use_case)
-    ],
-    login_use_case: Annotated[
-        LoginUseCase, Depends(get_login_use_case)
-    ]
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    container: Annotated[AppContainer, Depends(get_container)],
 ) -> AuthController:
     """
-    Create auth controller with all dependencies.
+    Create auth controller bound to the request session.
+    Everything else comes from the application container.
     """
-    return AuthController(
-        register_use_case=register_use_case,
-        login_use_case=login_use_case
-    )
+    return container.auth.auth_controller(session)
+
+
+async def get_key_ring(
+    container: Annotated[AppContainer, Depends(get_container)],
+) -> Optional[KeyRing]:
+    """JWT key ring, or None when tokens are signed with HS256."""
+    return container.auth.key_ring
 
 
 # ============================================================================
@@ -87,13 +47,25 @@ async def get_auth_controller(
 # ============================================================================
 
 
-async def get_current_user_id(
+async def get_current_token_claims(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    token_service: Annotated[JWTTokenService, Depends(get_token_service)]
-) -> EntityId:
+    container: Annotated[AppContainer, Depends(get_container)],
+) -> TokenClaims:
     try:
-        user_id = await token_service.verify_access_token(credentials.credentials)
-        return user_id
+        claims = await container.auth.token_service.decode_access_token(
+            credentials.credentials
+        )
+
+        # Bloom filter first; only probable hits reach the database
+        token_revocation = container.auth.token_revocation
+        if (
+            token_revocation
+            and claims.jti
+            and await token_revocation.is_revoked(claims.jti)
+        ):
+            raise TokenRevokedException("Access token")
+
+        return claims
 
     except TokenExpiredException:
         raise HTTPException(
@@ -109,6 +81,20 @@ async def get_current_user_id(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    except TokenRevokedException:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={
+                "status": "error",
+                "error": {
+                    "code": "TOKEN_REVOKED",
+                    "message": "Token revocado.",
+                    "details": "El token de autenticación fue revocado."
+                }
+            },
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     except InvalidTokenException:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -135,3 +121,9 @@ async def get_current_user_id(
                 }
             }
         )
+
+
+async def get_current_user_id(
+    claims: Annotated[TokenClaims, Depends(get_current_token_claims)],
+) -> EntityId:
+    return claims.user_id
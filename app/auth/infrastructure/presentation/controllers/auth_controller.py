@@ -3,21 +3,29 @@ Authentication Controller
 Handles HTTP layer for authentication endpoints.
 """
 
-from fastapi import Request
+from fastapi import HTTPException, Request, status
 import logging
 
 from app.core.decorators.exception_routes_handlers import handle_api_exceptions
 from app.auth.application import (
     RegisterUserUseCase,
-    LoginUseCase
+    LoginUseCase,
+    RefreshTokenUseCase,
+    LogoutUseCase,
 )
+from app.auth.domain.exeptions import AuthenticationException
 from app.auth.domain.entities.user import User
+from app.auth.domain.value_objects import TokenClaims
 from app.auth.infrastructure.presentation.dtos import (
     RegisterRequest,
     RegisterResponse,
     UserResponse,
     LoginRequest,
     LoginResponse,
+    RefreshRequest,
+    RefreshResponse,
+    LogoutRequest,
+    LogoutResponse,
     TokenResponse
 )
 
@@ -31,9 +39,13 @@ class AuthController:
         self,
         register_use_case: RegisterUserUseCase,
         login_use_case: LoginUseCase,
+        refresh_token_use_case: RefreshTokenUseCase,
+        logout_use_case: LogoutUseCase,
     ):
         self.register_use_case = register_use_case
         self.login_use_case = login_use_case
+        self.refresh_token_use_case = refresh_token_use_case
+        self.logout_use_case = logout_use_case
 
     @handle_api_exceptions
     async def register(
@@ -67,20 +79,66 @@ class AuthController:
         logger.info(f"Login request for: {request.email}")
 
         # Execute use case
-        login_result = await self.login_use_case.execute(
-            email=request.email,
-            password=request.password,
+        try:
+            token_pair = await self.login_use_case.execute(
+                email=request.email,
+                password=request.password,
+            )
+        except AuthenticationException as e:
+            raise self._unauthorized(e)
+
+        return LoginResponse(
+            message="Login successful",
+            token=TokenResponse(**token_pair.to_dict()),
         )
 
-        # Get user info for response (from token)
-        user_id = await self.login_use_case.token_service.verify_access_token(
-            str(login_result.token)
+    @handle_api_exceptions
+    async def refresh(
+        self,
+        request: RefreshRequest,
+    ) -> RefreshResponse:
+        """
+        Exchange a refresh token for a new token pair.
+        """
+        logger.info("Token refresh request")
+
+        # Execute use case
+        try:
+            token_pair = await self.refresh_token_use_case.execute(
+                request.refresh_token
+            )
+        except AuthenticationException as e:
+            raise self._unauthorized(e)
+
+        return RefreshResponse(
+            message="Tokens refreshed successfully",
+            token=TokenResponse(**token_pair.to_dict()),
         )
-        await self.login_use_case.user_repository.get_user_by_id(user_id)
 
-        return LoginResponse(
-            message="Login successful",
-            token=TokenResponse(**login_result.to_dict()),
+    @handle_api_exceptions
+    async def logout(
+        self,
+        request: LogoutRequest,
+        claims: TokenClaims,
+    ) -> LogoutResponse:
+        """
+        Revoke the current access token and, if given, the refresh token.
+        """
+        logger.info(f"Logout request for user: {claims.user_id}")
+
+        # Execute use case
+        await self.logout_use_case.execute(
+            claims, refresh_token=request.refresh_token
+        )
+
+        return LogoutResponse(message="Logout successful")
+
+    @staticmethod
+    def _unauthorized(error: AuthenticationException) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=error.to_dict(),
+            headers={"WWW-Authenticate": "Bearer"},
         )
 
     @staticmethod
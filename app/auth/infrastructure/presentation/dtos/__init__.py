@@ -2,11 +2,15 @@ from .auth_response_dto import (
     RegisterResponse,
     UserResponse,
     LoginResponse,
+    RefreshResponse,
+    LogoutResponse,
     TokenResponse
 )
 from .auth_request_dto import (
     RegisterRequest,
     LoginRequest,
+    RefreshRequest,
+    LogoutRequest,
 )
 
 __all__ = [
@@ -16,4 +20,8 @@ __all__ = [
     "LoginResponse",
     "LoginRequest",
     "TokenResponse",
+    "RefreshRequest",
+    "RefreshResponse",
+    "LogoutRequest",
+    "LogoutResponse",
 ]
@@ -39,3 +39,36 @@ class LoginRequest(BaseModel):
                 "password": "SecurePass123!",
             }
         }
+
+
+class RefreshRequest(BaseModel):
+    """Request for token refresh."""
+
+    refresh_token: str = Field(
+        ..., min_length=1, max_length=256, description="Refresh token"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "refresh_token": "Zk3q9v0mJ2c8rX1yB6tQ...",
+            }
+        }
+
+
+class LogoutRequest(BaseModel):
+    """Request for logout."""
+
+    refresh_token: Optional[str] = Field(
+        None,
+        min_length=1,
+        max_length=256,
+        description="Refresh token of the session to end as well",
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "refresh_token": "Zk3q9v0mJ2c8rX1yB6tQ...",
+            }
+        }
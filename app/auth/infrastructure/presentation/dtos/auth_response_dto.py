@@ -48,6 +48,10 @@ class TokenResponse(BaseModel):
     expires_in: int = Field(
         ..., description="Access token expiration in seconds"
     )
+    refresh_token: str = Field(..., description="Single-use refresh token")
+    refresh_expires_in: int = Field(
+        ..., description="Refresh token expiration in seconds"
+    )
 
     class Config:
         json_schema_extra = {
@@ -55,6 +59,8 @@ class TokenResponse(BaseModel):
                 "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
                 "token_type": "Bearer",
                 "expires_in": 1800,
+                "refresh_token": "Zk3q9v0mJ2c8rX1yB6tQ...",
+                "refresh_expires_in": 2592000,
             }
         }
 
@@ -73,6 +79,42 @@ class LoginResponse(BaseModel):
                     "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
                     "token_type": "Bearer",
                     "expires_in": 1800,
+                    "refresh_token": "Zk3q9v0mJ2c8rX1yB6tQ...",
+                    "refresh_expires_in": 2592000,
+                },
+            }
+        }
+
+
+class RefreshResponse(BaseModel):
+    """Token refresh success response."""
+
+    message: str = Field(..., description="Success message")
+    token: TokenResponse = Field(..., description="New authentication tokens")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "message": "Tokens refreshed successfully",
+                "token": {
+                    "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+                    "token_type": "Bearer",
+                    "expires_in": 1800,
+                    "refresh_token": "p7Wd2LxN0aV4sE9kR3mH...",
+                    "refresh_expires_in": 2592000,
                 },
             }
         }
+
+
+class LogoutResponse(BaseModel):
+    """Logout success response."""
+
+    message: str = Field(..., description="Success message")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "message": "Logout successful",
+            }
+        }
@@ -1,20 +1,36 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
 
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from app.auth.infrastructure.presentation.dtos import (
     RegisterResponse,
     RegisterRequest,
     LoginResponse,
-    LoginRequest
+    LoginRequest,
+    RefreshResponse,
+    RefreshRequest,
+    LogoutResponse,
+    LogoutRequest,
 )
 from app.auth.infrastructure.presentation.controllers import (
     AuthController
 )
-from app.auth.infrastructure.dependencies import get_auth_controller
+from app.auth.domain.value_objects import TokenClaims
+from app.auth.infrastructure.adapters import KeyRing
+from app.auth.infrastructure.dependencies import (
+    get_auth_controller,
+    get_current_token_claims,
+    get_key_ring,
+)
+from app.core.config import get_settings
+
+settings = get_settings()
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+# Served at the application root, outside API_V1_PREFIX
+well_known_router = APIRouter(prefix="/.well-known", tags=["Authentication"])
+
 
 @router.post(
     "/register",
@@ -58,3 +74,83 @@ async def login(
     Authenticate user with email and password.
     """
     return await controller.login(request, http_request)
+
+
+@router.post(
+    "/refresh",
+    response_model=RefreshResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Refresh tokens",
+    description=(
+        "Exchange a refresh token for a new access/refresh token pair. "
+        "Each refresh token is single use; reusing one revokes its family"
+    ),
+    responses={
+        200: {"description": "Tokens refreshed"},
+        401: {"description": "Invalid, expired or reused refresh token"},
+    },
+)
+async def refresh(
+    request: RefreshRequest,
+    controller: Annotated[AuthController, Depends(get_auth_controller)],
+) -> RefreshResponse:
+    """
+    Refresh the token pair.
+    """
+    return await controller.refresh(request)
+
+
+@router.post(
+    "/logout",
+    response_model=LogoutResponse,
+    status_code=status.HTTP_200_OK,
+    summary="User logout",
+    description=(
+        "Revoke the access token of the request and, when given, the "
+        "refresh token family of the session"
+    ),
+    responses={
+        200: {"description": "Logout successful"},
+        401: {"description": "Invalid, expired or revoked access token"},
+    },
+)
+async def logout(
+    claims: Annotated[TokenClaims, Depends(get_current_token_claims)],
+    controller: Annotated[AuthController, Depends(get_auth_controller)],
+    request: Optional[LogoutRequest] = None,
+) -> LogoutResponse:
+    """
+    End the current session.
+    """
+    return await controller.logout(request or LogoutRequest(), claims)
+
+
+@well_known_router.get(
+    "/jwks.json",
+    status_code=status.HTTP_200_OK,
+    summary="JSON Web Key Set",
+    description="Public keys that verify access tokens, selected by kid",
+    responses={
+        200: {"description": "JWKS document"},
+        404: {"description": "Tokens are signed with a shared secret"},
+    },
+)
+async def jwks(
+    key_ring: Annotated[Optional[KeyRing], Depends(get_key_ring)],
+) -> Response:
+    """
+    Publish the public signing keys.
+    """
+    if key_ring is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="JWKS is only available for RS256 and EdDSA tokens",
+        )
+
+    return Response(
+        content=key_ring.jwks_json(),
+        media_type="application/json",
+        headers={
+            "Cache-Control": f"public, max-age={settings.JWKS_CACHE_MAX_AGE}",
+        },
+    )
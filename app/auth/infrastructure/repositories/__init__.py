@@ -1,5 +1,9 @@
 from .user_repository import UserRepository
+from .refresh_token_repository import RefreshTokenRepository
+from .revoked_token_repository import RevokedTokenRepository
 
 __all__ = [
     "UserRepository",
+    "RefreshTokenRepository",
+    "RevokedTokenRepository",
 ]
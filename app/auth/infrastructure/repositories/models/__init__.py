@@ -1,5 +1,9 @@
 from .user_model import UserModel
+from .refresh_token_model import RefreshTokenModel
+from .revoked_token_model import RevokedTokenModel
 
 __all__ = [
     "UserModel",
+    "RefreshTokenModel",
+    "RevokedTokenModel",
 ]
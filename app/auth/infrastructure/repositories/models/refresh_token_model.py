@@ -0,0 +1,66 @@
+"""
+Refresh Token ORM Model
+SQLAlchemy model for refresh token persistence.
+"""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID as UUIDType
+from uuid import uuid4
+
+from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class RefreshTokenModel(Base):
+    """
+    Refresh token table model.
+    Maps to 'refresh_tokens' table in database. Tokens are stored as
+    SHA-256 digests and looked up through the unique token_hash index.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    # Primary key
+    id: Mapped[UUIDType] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid4
+    )
+
+    token_hash: Mapped[str] = mapped_column(
+        String(64), unique=True, index=True, nullable=False
+    )
+    user_id: Mapped[UUIDType] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        index=True,
+        nullable=False,
+    )
+
+    # Every token descending from one login shares the family id
+    family_id: Mapped[UUIDType] = mapped_column(
+        UUID(as_uuid=True), index=True, nullable=False
+    )
+
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    revoked_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    replaced_by: Mapped[Optional[str]] = mapped_column(
+        String(64), nullable=True
+    )
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=datetime.utcnow, nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<RefreshTokenModel(id={self.id}, user_id={self.user_id}, "
+            f"family_id={self.family_id})>"
+        )
@@ -0,0 +1,45 @@
+"""
+Revoked Token ORM Model
+SQLAlchemy model for the access token deny-list.
+"""
+
+from datetime import datetime
+from uuid import UUID as UUIDType
+
+from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class RevokedTokenModel(Base):
+    """
+    Revoked access token table model.
+    Maps to 'revoked_tokens' table in database. A row only matters until
+    the token's own expiry, after which the signature check rejects it
+    anyway and the row can be deleted.
+    """
+
+    __tablename__ = "revoked_tokens"
+
+    # Primary key: the token's jti claim
+    jti: Mapped[str] = mapped_column(String(64), primary_key=True)
+
+    user_id: Mapped[UUIDType] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), index=True, nullable=False
+    )
+
+    # Timestamps
+    revoked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=datetime.utcnow, nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<RevokedTokenModel(jti={self.jti}, user_id={self.user_id})>"
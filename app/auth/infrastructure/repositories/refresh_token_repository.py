@@ -0,0 +1,125 @@
+"""
+Refresh Token Repository Implementation
+Concrete implementation of RefreshTokenRepository using SQLAlchemy.
+"""
+
+from typing import Optional
+from uuid import UUID, uuid4
+import logging
+
+from app.core.decorators.exception_repository_handlers import exception_repository_handlers
+from sqlalchemy import func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import DateTime, String
+
+from app.auth.domain.entities import RefreshTokenRecord
+from app.auth.domain.ports import RefreshTokenRepositoryPort
+from app.auth.domain.value_objects import RefreshToken
+from app.auth.infrastructure.repositories.models import RefreshTokenModel
+from app.common.value_objects import EntityId
+
+logger = logging.getLogger(__name__)
+
+refresh_tokens_table = RefreshTokenModel.__table__
+
+
+class RefreshTokenRepository(RefreshTokenRepositoryPort):
+    """SQLAlchemy implementation of refresh token repository."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @exception_repository_handlers("create refresh token")
+    async def create_refresh_token(
+        self, user_id: EntityId, family_id: UUID, token: RefreshToken
+    ) -> None:
+        stmt = insert(refresh_tokens_table).values(
+            id=uuid4(),
+            token_hash=token.token_hash,
+            user_id=user_id.value,
+            family_id=family_id,
+            expires_at=token.expires_at,
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+
+    @exception_repository_handlers("rotate refresh token")
+    async def rotate_refresh_token(
+        self, token_hash: str, new_token: RefreshToken
+    ) -> Optional[EntityId]:
+        # One statement, one round trip over the token_hash index:
+        #   WITH consumed AS (UPDATE ... WHERE live RETURNING user, family)
+        #   INSERT INTO refresh_tokens SELECT ... FROM consumed RETURNING user
+        table = refresh_tokens_table
+        consumed = (
+            update(table)
+            .where(
+                table.c.token_hash == token_hash,
+                table.c.revoked_at.is_(None),
+                table.c.expires_at > func.now(),
+            )
+            .values(revoked_at=func.now(), replaced_by=new_token.token_hash)
+            .returning(table.c.user_id, table.c.family_id)
+            .cte("consumed")
+        )
+        stmt = (
+            insert(table)
+            .from_select(
+                ["id", "token_hash", "user_id", "family_id", "expires_at", "created_at"],
+                select(
+                    literal(uuid4(), PG_UUID(as_uuid=True)),
+                    literal(new_token.token_hash, String),
+                    consumed.c.user_id,
+                    consumed.c.family_id,
+                    literal(new_token.expires_at, DateTime(timezone=True)),
+                    func.now(),
+                ),
+            )
+            .returning(table.c.user_id)
+        )
+        result = await self.session.execute(stmt)
+        user_id = result.scalar_one_or_none()
+        await self.session.commit()
+
+        return EntityId(user_id) if user_id else None
+
+    @exception_repository_handlers("get refresh token")
+    async def get_refresh_token(
+        self, token_hash: str
+    ) -> Optional[RefreshTokenRecord]:
+        stmt = select(refresh_tokens_table).where(
+            refresh_tokens_table.c.token_hash == token_hash
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+
+        if row:
+            return self._to_entity(row)
+        return None
+
+    @exception_repository_handlers("revoke refresh token family")
+    async def revoke_refresh_token_family(self, family_id: UUID) -> int:
+        stmt = (
+            update(refresh_tokens_table)
+            .where(
+                refresh_tokens_table.c.family_id == family_id,
+                refresh_tokens_table.c.revoked_at.is_(None),
+            )
+            .values(revoked_at=func.now())
+        )
+        result = await self.session.execute(stmt)
+        await self.session.commit()
+
+        return result.rowcount
+
+    def _to_entity(self, row) -> RefreshTokenRecord:
+        """Convert a refresh_tokens row to domain entity."""
+        return RefreshTokenRecord(
+            token_hash=row.token_hash,
+            user_id=EntityId(row.user_id),
+            family_id=row.family_id,
+            expires_at=row.expires_at,
+            revoked_at=row.revoked_at,
+            replaced_by=row.replaced_by,
+        )
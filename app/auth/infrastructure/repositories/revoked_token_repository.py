@@ -0,0 +1,73 @@
+"""
+Revoked Token Repository Implementation
+Concrete implementation of RevokedTokenRepository using SQLAlchemy.
+"""
+
+from datetime import datetime
+from typing import List
+import logging
+
+from app.core.decorators.exception_repository_handlers import exception_repository_handlers
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.domain.ports import RevokedTokenRepositoryPort
+from app.auth.infrastructure.repositories.models import RevokedTokenModel
+from app.common.value_objects import EntityId
+
+logger = logging.getLogger(__name__)
+
+revoked_tokens_table = RevokedTokenModel.__table__
+
+
+class RevokedTokenRepository(RevokedTokenRepositoryPort):
+    """SQLAlchemy implementation of revoked token repository."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @exception_repository_handlers("revoke token")
+    async def revoke_token(
+        self, jti: str, user_id: EntityId, expires_at: datetime
+    ) -> None:
+        # Revoking twice (e.g. a retried logout) is not an error
+        stmt = (
+            insert(revoked_tokens_table)
+            .values(
+                jti=jti,
+                user_id=user_id.value,
+                expires_at=expires_at,
+                revoked_at=func.now(),
+            )
+            .on_conflict_do_nothing(index_elements=["jti"])
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+
+    @exception_repository_handlers("check revoked token")
+    async def is_token_revoked(self, jti: str) -> bool:
+        stmt = select(revoked_tokens_table.c.jti).where(
+            revoked_tokens_table.c.jti == jti,
+            revoked_tokens_table.c.expires_at > func.now(),
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    @exception_repository_handlers("get revoked token ids")
+    async def get_revoked_token_ids(self) -> List[str]:
+        stmt = select(revoked_tokens_table.c.jti).where(
+            revoked_tokens_table.c.expires_at > func.now()
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars())
+
+    @exception_repository_handlers("delete expired revoked tokens")
+    async def delete_expired_revoked_tokens(self) -> int:
+        stmt = delete(revoked_tokens_table).where(
+            revoked_tokens_table.c.expires_at <= func.now()
+        )
+        result = await self.session.execute(stmt)
+        await self.session.commit()
+
+        return result.rowcount
@@ -6,11 +6,59 @@ from functools import lru_cache
 from typing import List, Optional
 
 from dotenv import load_dotenv
-from pydantic import ConfigDict, Field
+from pydantic import ConfigDict, Field, model_validator
 from pydantic_settings import BaseSettings
 
 load_dotenv()
 
+# Bind parameters PostgreSQL accepts in one statement (Int16 in the wire
+# protocol), and how many TaskRepository binds per row of a multi-row
+# INSERT (its task_columns).
+POSTGRES_MAX_BIND_PARAMS = 32767
+TASK_INSERT_COLUMNS = 8
+
+# Pool defaults per ENVIRONMENT. Development keeps NullPool so local
+# restarts and reloads never hold idle connections; deployed environments
+# reuse warm connections instead of paying connect + auth on every request.
+POOL_ENVIRONMENT_DEFAULTS = {
+    "development": {
+        "DATABASE_POOL_MODE": "null",
+        "DATABASE_POOL_SIZE": 5,
+        "DATABASE_MAX_OVERFLOW": 0,
+        "DATABASE_POOL_RECYCLE": -1,
+        "DATABASE_POOL_TIMEOUT": 30,
+        "DATABASE_POOL_PRE_PING": False,
+        "DATABASE_POOL_WARMUP": 0,
+    },
+    "testing": {
+        "DATABASE_POOL_MODE": "null",
+        "DATABASE_POOL_SIZE": 5,
+        "DATABASE_MAX_OVERFLOW": 0,
+        "DATABASE_POOL_RECYCLE": -1,
+        "DATABASE_POOL_TIMEOUT": 30,
+        "DATABASE_POOL_PRE_PING": False,
+        "DATABASE_POOL_WARMUP": 0,
+    },
+    "staging": {
+        "DATABASE_POOL_MODE": "queue",
+        "DATABASE_POOL_SIZE": 5,
+        "DATABASE_MAX_OVERFLOW": 5,
+        "DATABASE_POOL_RECYCLE": 1800,
+        "DATABASE_POOL_TIMEOUT": 10,
+        "DATABASE_POOL_PRE_PING": True,
+        "DATABASE_POOL_WARMUP": 2,
+    },
+    "production": {
+        "DATABASE_POOL_MODE": "queue",
+        "DATABASE_POOL_SIZE": 10,
+        "DATABASE_MAX_OVERFLOW": 10,
+        "DATABASE_POOL_RECYCLE": 1800,
+        "DATABASE_POOL_TIMEOUT": 10,
+        "DATABASE_POOL_PRE_PING": False,
+        "DATABASE_POOL_WARMUP": 5,
+    },
+}
+
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
@@ -39,15 +87,68 @@ class Settings(BaseSettings):
     # =================================================================
     API_V1_PREFIX: str = Field(default="/api/v1")
 
+    # Opt-in orjson responses and precompiled serializers for list endpoints
+    FAST_JSON_RESPONSES: bool = Field(default=False)
+
+    # Task listing pagination
+    TASKS_PAGE_DEFAULT_SIZE: int = Field(default=20, ge=1)
+    TASKS_PAGE_MAX_SIZE: int = Field(default=100, ge=1)
+
+    # Task search (ranked results are paged by offset, capped to keep deep
+    # pages from re-ranking ever more rows)
+    TASKS_SEARCH_MAX_OFFSET: int = Field(default=1000, ge=0)
+
+    # Bulk task creation
+    TASKS_BULK_MAX_ITEMS: int = Field(default=1000, ge=1)
+    TASKS_BULK_COPY_THRESHOLD: int = Field(default=500, ge=1)
+
+    # Streaming export (rows fetched per server-side cursor round trip)
+    TASKS_EXPORT_FETCH_SIZE: int = Field(default=1000, ge=1)
+
+    # Streaming import (rows loaded per COPY chunk, rejected rows reported)
+    TASKS_IMPORT_CHUNK_SIZE: int = Field(default=5000, ge=1)
+    TASKS_IMPORT_MAX_REJECTED: int = Field(default=100, ge=0)
+
+    # Task read cache (GET /tasks/{id})
+    TASK_CACHE_ENABLED: bool = Field(default=True)
+    TASK_CACHE_MAX_ENTRIES: int = Field(default=10000, ge=1)
+    TASK_CACHE_TTL_SECONDS: float = Field(default=5, gt=0)
+    TASK_CACHE_SHARED_BACKEND: str = Field(
+        default="none", pattern="^(none|memory)$"
+    )
+    TASK_CACHE_SHARED_TTL_SECONDS: float = Field(default=300, gt=0)
+
     # =================================================================
     # SECURITY SETTINGS
     # =================================================================
     SECRET_KEY: str = Field(..., min_length=32)
 
-    # JWT Configuration
-    JWT_ALGORITHM: str = Field(default="HS256")
+    # JWT Configuration. HS256 signs with SECRET_KEY; RS256 and EdDSA sign
+    # with the key ring in JWT_KEYS_DIR and publish /.well-known/jwks.json
+    JWT_ALGORITHM: str = Field(default="HS256", pattern="^(HS256|RS256|EdDSA)$")
+    JWT_KEYS_DIR: Optional[str] = Field(default=None)
+    JWT_SIGNING_KID: Optional[str] = Field(default=None)
+    JWT_KEYS_REFRESH_SECONDS: float = Field(default=60, gt=0)
+    JWKS_CACHE_MAX_AGE: int = Field(default=300, ge=0)  # seconds
     TOKEN_TYPE: str = Field(default="Bearer")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=15)
+    REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=30, ge=1)
+
+    # Access token verification cache (entries expire at the token's exp)
+    TOKEN_CACHE_ENABLED: bool = Field(default=True)
+    TOKEN_CACHE_MAX_ENTRIES: int = Field(default=10000, ge=1)
+
+    # Access token revocation (logout). Revoked jtis are kept in the
+    # database and mirrored per worker in a Bloom filter rebuilt every
+    # TOKEN_REVOCATION_REFRESH_SECONDS
+    TOKEN_REVOCATION_ENABLED: bool = Field(default=True)
+    TOKEN_REVOCATION_REFRESH_SECONDS: float = Field(default=30, gt=0)
+    TOKEN_REVOCATION_BLOOM_CAPACITY: int = Field(default=100_000, ge=1)
+    TOKEN_REVOCATION_BLOOM_ERROR_RATE: float = Field(default=0.001, gt=0, lt=1)
+
+    # Password hashing (bcrypt runs off the event loop in a thread pool)
+    PASSWORD_HASH_MAX_WORKERS: int = Field(default=2, ge=1)
+    PASSWORD_HASH_MAX_CONCURRENCY: int = Field(default=2, ge=1)
 
     # =================================================================
     # CORS SETTINGS
@@ -66,6 +167,18 @@ class Settings(BaseSettings):
     DATABASE_URL: str = Field(...)
     DATABASE_ECHO: bool = Field(default=False)
 
+    # Connection pooling. Fields left as None are resolved from
+    # POOL_ENVIRONMENT_DEFAULTS according to ENVIRONMENT.
+    DATABASE_POOL_MODE: Optional[str] = Field(
+        default=None, pattern="^(null|queue)$"
+    )
+    DATABASE_POOL_SIZE: Optional[int] = Field(default=None, ge=1)
+    DATABASE_MAX_OVERFLOW: Optional[int] = Field(default=None, ge=0)
+    DATABASE_POOL_RECYCLE: Optional[int] = Field(default=None)  # seconds
+    DATABASE_POOL_TIMEOUT: Optional[int] = Field(default=None, ge=1)  # seconds
+    DATABASE_POOL_PRE_PING: Optional[bool] = Field(default=None)
+    DATABASE_POOL_WARMUP: Optional[int] = Field(default=None, ge=0)
+
     # =================================================================
     # POSTGRESQL DOCKER SETTINGS
     # =================================================================
@@ -87,6 +200,59 @@ class Settings(BaseSettings):
     RATE_LIMIT_ENABLED: bool = Field(default=True)
     RATE_LIMIT_CALLS: int = Field(default=100)
     RATE_LIMIT_PERIOD: int = Field(default=60)  # seconds
+    RATE_LIMIT_STORAGE: str = Field(default="memory", pattern="^(memory)$")
+    RATE_LIMIT_MAX_CLIENTS: int = Field(default=100_000, ge=1)
+
+    # =================================================================
+    # OBSERVABILITY SETTINGS
+    # =================================================================
+    # /metrics exposes pool, cache and key ring internals: off unless
+    # enabled, and then only served to METRICS_TOKEN as a bearer token
+    METRICS_ENABLED: bool = Field(default=False)
+    METRICS_TOKEN: Optional[str] = Field(default=None, min_length=32)
+
+    @model_validator(mode="after")
+    def _check_bulk_copy_threshold(self) -> "Settings":
+        """Batches below the threshold are one INSERT with a bind per value."""
+        if self.TASKS_BULK_COPY_THRESHOLD > self.TASKS_BULK_MAX_ITEMS:
+            raise ValueError(
+                "TASKS_BULK_COPY_THRESHOLD must not exceed TASKS_BULK_MAX_ITEMS"
+            )
+        max_threshold = (POSTGRES_MAX_BIND_PARAMS - 1) // TASK_INSERT_COLUMNS
+        if self.TASKS_BULK_COPY_THRESHOLD > max_threshold:
+            raise ValueError(
+                f"TASKS_BULK_COPY_THRESHOLD must be at most {max_threshold} "
+                f"({TASK_INSERT_COLUMNS} bind parameters per task, "
+                f"{POSTGRES_MAX_BIND_PARAMS} per statement)"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def _require_metrics_token(self) -> "Settings":
+        """/metrics is never served without authentication."""
+        if self.METRICS_ENABLED and not self.METRICS_TOKEN:
+            raise ValueError("METRICS_TOKEN is required when METRICS_ENABLED=true")
+        return self
+
+    @model_validator(mode="after")
+    def _require_jwt_keys_dir(self) -> "Settings":
+        """Asymmetric algorithms sign with the key ring, not SECRET_KEY."""
+        if self.JWT_ALGORITHM != "HS256" and not self.JWT_KEYS_DIR:
+            raise ValueError(
+                f"JWT_KEYS_DIR is required when JWT_ALGORITHM={self.JWT_ALGORITHM}"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def _apply_pool_environment_defaults(self) -> "Settings":
+        """Fill unset pool settings from the ENVIRONMENT defaults."""
+        defaults = POOL_ENVIRONMENT_DEFAULTS.get(
+            self.ENVIRONMENT, POOL_ENVIRONMENT_DEFAULTS["development"]
+        )
+        for field_name, default in defaults.items():
+            if getattr(self, field_name) is None:
+                setattr(self, field_name, default)
+        return self
 
 
 @lru_cache()
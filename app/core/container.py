@@ -0,0 +1,66 @@
+"""
+Application composition root.
+Builds the application-scoped object graph once per process; only the
+database session stays request-scoped.
+"""
+
+from typing import Any, Dict, Optional
+
+from fastapi import Request
+
+from app.core.config import Settings
+from app.core.rate_limiting import (
+    InMemoryRateLimitStorage,
+    RateLimitStoragePort,
+    TokenBucketRateLimiter,
+)
+
+
+class AppContainer:
+    """Application-scoped singletons shared by every request."""
+
+    def __init__(self, settings: Settings):
+        # Module containers are imported here so app.core does not depend
+        # on the modules at import time.
+        from app.auth.infrastructure.container import AuthContainer
+        from app.task.infrastructure.container import TaskContainer
+
+        self.settings = settings
+        self.auth = AuthContainer(settings)
+        self.task = TaskContainer(settings)
+        self.rate_limiter: Optional[TokenBucketRateLimiter] = (
+            TokenBucketRateLimiter(
+                storage=self._build_rate_limit_storage(),
+                calls=settings.RATE_LIMIT_CALLS,
+                period=settings.RATE_LIMIT_PERIOD,
+            )
+            if settings.RATE_LIMIT_ENABLED else None
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-worker runtime statistics of the application singletons."""
+        return {
+            **self.auth.stats(),
+            **self.task.stats(),
+            "rate_limiter": (
+                self.rate_limiter.stats() if self.rate_limiter else None
+            ),
+        }
+
+    async def start(self) -> None:
+        """Start background work; called once the database is ready."""
+        await self.auth.start()
+
+    async def shutdown(self) -> None:
+        await self.auth.shutdown()
+
+    def _build_rate_limit_storage(self) -> RateLimitStoragePort:
+        """Create the bucket storage selected by RATE_LIMIT_STORAGE."""
+        return InMemoryRateLimitStorage(
+            max_entries=self.settings.RATE_LIMIT_MAX_CLIENTS
+        )
+
+
+async def get_container(request: Request) -> AppContainer:
+    """Dependency returning the container built by create_app."""
+    return request.app.state.container
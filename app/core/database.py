@@ -3,8 +3,9 @@ Database configuration and session management.
 SQLAlchemy setup for PostgreSQL with async support.
 """
 
+import asyncio
 import logging
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict, Optional
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -12,7 +13,7 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 
 from app.core.config import get_settings
 
@@ -39,16 +40,40 @@ def prepare_database_url(url: str) -> str:
     return base_url
 
 
+def build_engine_options() -> Dict[str, Any]:
+    """
+    Build create_async_engine keyword arguments from the pool settings.
+
+    "null" mode opens a fresh connection per checkout (development);
+    "queue" mode keeps an AsyncAdaptedQueuePool of warm connections.
+    """
+    options: Dict[str, Any] = {
+        "echo": settings.DATABASE_ECHO,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    }
+
+    if settings.DATABASE_POOL_MODE == "null":
+        options["poolclass"] = NullPool
+        return options
+
+    options.update(
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_use_lifo=True,
+    )
+    return options
+
+
 database_url = prepare_database_url(settings.DATABASE_URL)
 
-# Development/Testing: Use NullPool (simpler, creates new connection each time)
-engine = create_async_engine(
-    database_url,
-    echo=settings.DATABASE_ECHO,
-    poolclass=NullPool,
-    pool_pre_ping=True,
+engine = create_async_engine(database_url, **build_engine_options())
+logger.info(
+    f"Database engine created with {settings.DATABASE_POOL_MODE} pool "
+    f"({settings.ENVIRONMENT} mode)"
 )
-logger.info("Database engine created with NullPool (development mode)")
 
 # Create session factory
 async_session_factory = async_sessionmaker(
@@ -131,6 +156,65 @@ async def check_database_connection() -> bool:
         return False
 
 
+async def warm_up_pool(connections: Optional[int] = None) -> int:
+    """
+    Open pooled connections ahead of the first request.
+
+    Checks out ``connections`` connections concurrently (defaults to
+    DATABASE_POOL_WARMUP, capped at the pool size) and returns them to the
+    pool, so the first requests after startup skip connect + auth.
+
+    Returns:
+        int: Number of connections warmed up
+    """
+    if connections is None:
+        connections = settings.DATABASE_POOL_WARMUP
+
+    pool = engine.pool
+    if not isinstance(pool, QueuePool) or connections <= 0:
+        return 0
+
+    connections = min(connections, pool.size())
+
+    async def _checkout() -> None:
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql("SELECT 1")
+
+    try:
+        await asyncio.gather(*(_checkout() for _ in range(connections)))
+        logger.info(f"Database pool warmed up with {connections} connections")
+        return connections
+    except Exception as e:
+        logger.error(f"Database pool warm-up failed: {str(e)}")
+        return 0
+
+
+def get_pool_status() -> Dict[str, Any]:
+    """
+    Current connection pool statistics.
+
+    Returns:
+        dict: Pool mode and, for queue pools, size, checked in/out
+        connections and overflow in use
+    """
+    pool = engine.pool
+    status: Dict[str, Any] = {
+        "mode": settings.DATABASE_POOL_MODE,
+        "pool_class": type(pool).__name__,
+    }
+
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+            timeout=pool.timeout(),
+        )
+    return status
+
+
 async def close_database_connection() -> None:
     """Close database connection pool."""
     try:
@@ -1,6 +1,7 @@
 from functools import wraps
 from typing import Callable, Any, Optional
 import asyncio
+import inspect
 from sqlalchemy.exc import SQLAlchemyError
 from app.core.exceptions import DatabaseOperationError
 
@@ -51,6 +52,30 @@ def exception_repository_handlers(
                     code="UNEXPECTED_DATABASE_ERROR",
                 )
 
+        @wraps(func)
+        async def async_gen_wrapper(self, *args, **kwargs) -> Any:
+            try:
+                async for item in func(self, *args, **kwargs):
+                    yield item
+
+            except SQLAlchemyError as e:
+                raise DatabaseOperationError(
+                    message=(
+                        f"Fallo al crear {operation_name} en base de datos."
+                    ),
+                    detail=str(e),
+                    code="DATABASE_OPERATION_ERROR",
+                )
+
+            except Exception as e:
+                raise DatabaseOperationError(
+                    message=f"Error inesperado en {operation_name}",
+                    detail=str(e),
+                    code="UNEXPECTED_DATABASE_ERROR",
+                )
+
+        if inspect.isasyncgenfunction(func):
+            return async_gen_wrapper
         if asyncio.iscoroutinefunction(func):
             return async_wrapper
         return sync_wrapper
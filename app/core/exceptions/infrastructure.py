@@ -43,7 +43,9 @@ class DatabaseOperationError(InfrastructureException):
 class RateLimitException(InfrastructureException):
     """Raised when rate limit is exceeded."""
 
-    def __init__(self, message: str = "Rate limit exceeded", **kwargs):
-        kwargs.setdefault("status_code", 429)
-        kwargs.setdefault("error_code", "RATE_LIMIT_ERROR")
-        super().__init__(message, **kwargs)
+    def __init__(
+            self,
+            message: str = "Rate limit exceeded",
+            detail: Exception = None
+            ):
+        super().__init__(message, detail, code="RATE_LIMIT_ERROR")
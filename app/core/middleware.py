@@ -2,93 +2,119 @@
 Security and utility middleware for the FastAPI application.
 """
 
+import logging
+import re
 import time
 import uuid
-import logging
-from typing import Callable
 
-from fastapi import Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.exceptions import RateLimitException
 from app.core.config import get_settings
+from app.core.rate_limiting import TokenBucketRateLimiter
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+RATE_LIMIT_EXEMPT_PATHS = frozenset(
+    {"/health", "/docs", "/.well-known/jwks.json"}
+)
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Basic rate limiting middleware (in-memory)."""
+# Incoming X-Request-ID values are echoed back only if they look sane
+REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
 
-    def __init__(self, app, calls: int = 100, period: int = 60):
-        super().__init__(app)
-        self.calls = calls
-        self.period = period
-        self.clients = {}  # In production, use Redis or similar
 
-    async def dispatch(
-        self, request: Request, call_next: Callable
-    ) -> Response:
-        # Skip rate limiting for health checks
-        if request.url.path in ["/health", "/docs"]:
-            return await call_next(request)
-
-        # Get client IP
-        client_ip = request.client.host
-        current_time = time.time()
-
-        # Clean old entries
-        self._cleanup_old_entries(current_time)
-
-        # Check rate limit
-        if client_ip in self.clients:
-            requests = self.clients[client_ip]
-            recent_requests = [
-                req_time
-                for req_time in requests
-                if current_time - req_time < self.period
-            ]
-
-            if len(recent_requests) >= self.calls:
-                from fastapi.responses import JSONResponse
-
-                logger.warning(
-                    "Rate limit exceeded",
-                    client_ip=client_ip,
-                    requests_count=len(recent_requests),
-                    limit=self.calls,
-                )
-                raise RateLimitException(
-                    f"Rate limit exceeded. Maximum {self.calls} requests per {self.period} seconds."
+class RequestContextMiddleware:
+    """
+    Tags every HTTP response with X-Request-ID and X-Process-Time.
+
+    The request id is taken from the incoming X-Request-ID header when
+    present and valid, otherwise generated, and is stored in
+    ``request.state.request_id``. X-Process-Time is the time in seconds
+    until the response headers were sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        request_id = Headers(scope=scope).get("x-request-id", "")
+        if not REQUEST_ID_PATTERN.match(request_id):
+            request_id = uuid.uuid4().hex
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                headers["X-Process-Time"] = (
+                    f"{time.perf_counter() - started:.6f}"
                 )
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
-            self.clients[client_ip] = recent_requests + [current_time]
-        else:
-            self.clients[client_ip] = [current_time]
 
-        return await call_next(request)
+class RateLimitMiddleware:
+    """Token bucket rate limiting per client IP."""
 
-    def _cleanup_old_entries(self, current_time: float):
-        """Remove old entries to prevent memory leak."""
-        for client_ip in list(self.clients.keys()):
-            self.clients[client_ip] = [
-                req_time
-                for req_time in self.clients[client_ip]
-                if current_time - req_time < self.period
-            ]
-            if not self.clients[client_ip]:
-                del self.clients[client_ip]
+    def __init__(self, app: ASGIApp, limiter: TokenBucketRateLimiter):
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip rate limiting for health checks
+        if scope["type"] != "http" or scope["path"] in RATE_LIMIT_EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        decision = await self.limiter.hit(client_ip)
+
+        if not decision.allowed:
+            logger.warning(f"Rate limit exceeded for client: {client_ip}")
+            exception = RateLimitException(
+                f"Rate limit exceeded. Maximum {self.limiter.calls} "
+                f"requests per {self.limiter.period} seconds."
+            )
+            response = JSONResponse(
+                status_code=429,
+                content=exception.to_dict(),
+                headers={"Retry-After": str(int(decision.retry_after) + 1)},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
 
 
 def setup_middleware(app):
     """
     Configure all middleware for the application.
-    Order matters - middleware is executed top to bottom for requests
-    and bottom to top for responses.
+    Order matters - each add_middleware call wraps the previous ones, so
+    the last middleware added is the first to see a request. CORS is
+    outermost so every response (including 429s) carries CORS headers,
+    then request context, then rate limiting.
     """
 
+    if settings.RATE_LIMIT_ENABLED:
+        app.add_middleware(
+            RateLimitMiddleware,
+            limiter=app.state.container.rate_limiter,
+        )
+
+    app.add_middleware(RequestContextMiddleware)
+
     if settings.BACKEND_CORS_ORIGINS:
         app.add_middleware(
             CORSMiddleware,
@@ -96,12 +122,7 @@ def setup_middleware(app):
             allow_credentials=True,
             allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
             allow_headers=["*"],
-            expose_headers=["X-Request-ID", "X-Process-Time"],
-        )
-
-    if settings.RATE_LIMIT_ENABLED:
-        app.add_middleware(
-            RateLimitMiddleware,
-            calls=settings.RATE_LIMIT_CALLS,
-            period=settings.RATE_LIMIT_PERIOD,
+            expose_headers=[
+                "X-Request-ID", "X-Process-Time", "ETag", "Last-Modified",
+            ],
         )
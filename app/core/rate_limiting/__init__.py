@@ -0,0 +1,13 @@
+from .storage import (
+    RateLimitDecision,
+    RateLimitStoragePort,
+    InMemoryRateLimitStorage,
+)
+from .limiter import TokenBucketRateLimiter
+
+__all__ = [
+    "RateLimitDecision",
+    "RateLimitStoragePort",
+    "InMemoryRateLimitStorage",
+    "TokenBucketRateLimiter",
+]
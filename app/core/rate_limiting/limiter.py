@@ -0,0 +1,45 @@
+"""
+Token bucket rate limiter.
+"""
+
+import time
+from typing import Any, Dict
+
+from app.core.rate_limiting.storage import (
+    RateLimitDecision,
+    RateLimitStoragePort,
+)
+
+
+class TokenBucketRateLimiter:
+    """
+    Allows ``calls`` requests per ``period`` seconds per key.
+
+    Each key owns a bucket of ``calls`` tokens refilled continuously at
+    calls / period tokens per second; a request costs one token. Bursts up
+    to the bucket size are allowed and the sustained rate matches the
+    configured limit. Every check is O(1).
+    """
+
+    def __init__(self, storage: RateLimitStoragePort, calls: int, period: int):
+        self.storage = storage
+        self.calls = calls
+        self.period = period
+        self._refill_per_second = calls / period
+
+    async def hit(self, key: str) -> RateLimitDecision:
+        """Consume one request for key."""
+        return await self.storage.consume(
+            key,
+            capacity=self.calls,
+            refill_per_second=self._refill_per_second,
+            # Monotonic: a wall clock step must not drain or refill buckets
+            now=time.monotonic(),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "period": self.period,
+            "storage": self.storage.stats(),
+        }
@@ -0,0 +1,125 @@
+"""
+Rate limit storage.
+Port for the bucket store shared by all workers plus an in-process
+implementation.
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Result of consuming one token from a client's bucket."""
+    allowed: bool
+    remaining: int
+    retry_after: float
+
+
+class RateLimitStoragePort(ABC):
+    """
+    Interface for token bucket storage.
+
+    consume() must refill and take a token atomically, so a shared
+    implementation (e.g. a Redis script) can serve every worker.
+    """
+
+    @abstractmethod
+    async def consume(
+        self,
+        key: str,
+        capacity: int,
+        refill_per_second: float,
+        now: float,
+    ) -> RateLimitDecision:
+        """
+        Refill the bucket for key up to now and take one token if available.
+        now is in seconds on a monotonic clock (time.monotonic()), only
+        ever compared with earlier values of the same clock.
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """
+        Storage size and expiry counters.
+        """
+        pass
+
+
+class InMemoryRateLimitStorage(RateLimitStoragePort):
+    """
+    Token buckets kept in an OrderedDict ordered by last access.
+
+    A bucket idle for capacity / refill_per_second seconds is full again,
+    which is the same as having no bucket, so it can be dropped. Because the
+    dict is ordered by last access, expired buckets are always at the front:
+    each consume() inspects at most ``sweep_batch`` of them, keeping expiry
+    amortized O(1) with no full scans. ``max_entries`` bounds memory.
+    """
+
+    def __init__(self, max_entries: int = 100_000, sweep_batch: int = 2):
+        # key -> [tokens, last_refill_timestamp]
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._max_entries = max_entries
+        self._sweep_batch = sweep_batch
+
+        # Metrics
+        self._expired = 0
+        self._evicted = 0
+
+    async def consume(
+        self,
+        key: str,
+        capacity: int,
+        refill_per_second: float,
+        now: float,
+    ) -> RateLimitDecision:
+        self._sweep(now, capacity / refill_per_second)
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = [float(capacity), now]
+            self._buckets[key] = bucket
+            if len(self._buckets) > self._max_entries:
+                self._buckets.popitem(last=False)
+                self._evicted += 1
+        else:
+            tokens, last = bucket
+            bucket[0] = min(capacity, tokens + (now - last) * refill_per_second)
+            bucket[1] = now
+            self._buckets.move_to_end(key)
+
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return RateLimitDecision(
+                allowed=True, remaining=int(bucket[0]), retry_after=0.0
+            )
+
+        return RateLimitDecision(
+            allowed=False,
+            remaining=0,
+            retry_after=(1 - bucket[0]) / refill_per_second,
+        )
+
+    def _sweep(self, now: float, full_after: float) -> None:
+        """Drop up to sweep_batch buckets that have refilled completely."""
+        for _ in range(self._sweep_batch):
+            if not self._buckets:
+                return
+            key, (_, last) = next(iter(self._buckets.items()))
+            if now - last < full_after:
+                return
+            del self._buckets[key]
+            self._expired += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "memory",
+            "clients": len(self._buckets),
+            "max_entries": self._max_entries,
+            "expired": self._expired,
+            "evicted": self._evicted,
+        }
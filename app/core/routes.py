@@ -4,13 +4,20 @@ Centralizes all route registration for the FastAPI application.
 """
 
 import logging
-from fastapi import FastAPI, Request, status
+import secrets
+from typing import Annotated, Optional
+
+from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.core.config import get_settings
+from app.core.database import get_pool_status
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+metrics_security = HTTPBearer(auto_error=False)
+
 
 def setup_routes(app: FastAPI) -> None:
     """
@@ -65,6 +72,48 @@ def _register_system_endpoints(app: FastAPI) -> None:
             "health_url": "/health",
         }
 
+    if settings.METRICS_ENABLED:
+
+        @app.get(
+            "/metrics",
+            status_code=status.HTTP_200_OK,
+            dependencies=[Depends(_require_metrics_token)],
+        )
+        async def metrics(request: Request):
+            """
+            Runtime metrics endpoint.
+
+            Exposes per-worker statistics used to size pools and caches.
+            Requires METRICS_TOKEN as a bearer token.
+            """
+            return {
+                "database_pool": get_pool_status(),
+                **request.app.state.container.stats(),
+            }
+
+
+async def _require_metrics_token(
+    credentials: Annotated[
+        Optional[HTTPAuthorizationCredentials], Depends(metrics_security)
+    ],
+) -> None:
+    """Reject requests without the METRICS_TOKEN bearer token."""
+    if credentials is None or not secrets.compare_digest(
+        credentials.credentials.encode(), settings.METRICS_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={
+                "status": "error",
+                "error": {
+                    "code": "INVALID_TOKEN",
+                    "message": "Token inválido.",
+                    "details": "Se requiere el token de métricas."
+                }
+            },
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
 
 def _register_auth_routes(app: FastAPI) -> None:
     """Register authentication and authorization routes."""
@@ -72,6 +121,7 @@ def _register_auth_routes(app: FastAPI) -> None:
     # Authentication routes
     from app.auth.infrastructure.presentation.routes.auth_routes import (
         router as auth_router,
+        well_known_router,
     )
 
     app.include_router(
@@ -80,6 +130,9 @@ def _register_auth_routes(app: FastAPI) -> None:
         tags=["Authentication"],
     )
 
+    # JWKS for downstream token verification
+    app.include_router(well_known_router)
+
 
 def _register_task_routes(app: FastAPI) -> None:
     """Register tasks routes."""
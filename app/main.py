@@ -3,15 +3,22 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.core.config import get_settings
+from app.core.container import AppContainer
 from app.core.database import (
     check_database_connection,
     close_database_connection,
     init_database,
+    warm_up_pool,
 )
 # Import models to register them with SQLAlchemy
-from app.auth.infrastructure.repositories.models import UserModel  # noqa: F401
+from app.auth.infrastructure.repositories.models import (  # noqa: F401
+    RefreshTokenModel,
+    RevokedTokenModel,
+    UserModel,
+)
 from app.core.middleware import (
     setup_middleware,
 )
@@ -44,10 +51,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize database tables
     await init_database()
 
+    # Open pooled connections before serving traffic
+    await warm_up_pool()
+
+    # Load the token revocation list and keep it refreshed
+    await app.state.container.start()
+
     yield
 
     # Shutdown
     logger.info("Shutting down application")
+    await app.state.container.shutdown()
     await close_database_connection()
     logger.info("Application shutdown completed")
 
@@ -64,8 +78,14 @@ def create_app() -> FastAPI:
         docs_url="/docs" if settings.DEBUG else None,
         redoc_url="/redoc" if settings.DEBUG else None,
         lifespan=lifespan,
+        default_response_class=(
+            ORJSONResponse if settings.FAST_JSON_RESPONSES else JSONResponse
+        ),
     )
 
+    # Application-scoped dependencies, built once per process
+    app.state.container = AppContainer(settings)
+
     # Middleware setup
     setup_middleware(app)
 
@@ -3,6 +3,23 @@ from .get_all_tasks_use_case import GetAllTasksUseCase
 from .get_task_use_case import GetTaskUseCase
 from .delete_task_use_case import DeleteTaskUseCase
 from .update_task_use_case import UpdateTaskUseCase
+from .register_tasks_bulk_use_case import (
+    RegisterTasksBulkUseCase,
+    BulkTaskResult,
+)
+from .export_tasks_use_case import ExportTasksUseCase
+from .import_tasks_use_case import (
+    ImportTasksUseCase,
+    ImportRejection,
+    ImportRow,
+    TasksImportResult,
+)
+from .update_tasks_state_use_case import (
+    UpdateTasksStateUseCase,
+    TasksStateUpdateResult,
+)
+from .search_tasks_use_case import SearchTasksUseCase
+from .get_task_stats_use_case import GetTaskStatsUseCase
 
 __all__ = [
     "RegisterTaskUseCase",
@@ -10,4 +27,15 @@ __all__ = [
     "GetTaskUseCase",
     "DeleteTaskUseCase",
     "UpdateTaskUseCase",
+    "RegisterTasksBulkUseCase",
+    "BulkTaskResult",
+    "ExportTasksUseCase",
+    "ImportTasksUseCase",
+    "ImportRejection",
+    "ImportRow",
+    "TasksImportResult",
+    "UpdateTasksStateUseCase",
+    "TasksStateUpdateResult",
+    "SearchTasksUseCase",
+    "GetTaskStatsUseCase",
 ]
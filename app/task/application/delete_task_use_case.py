@@ -20,11 +20,12 @@ class DeleteTaskUseCase:
     ):
         self.task_repository = task_repository
 
-    async def execute(self, task_id: str) -> bool:
+    async def execute(self, owner_id: EntityId, task_id: str) -> bool:
         """
         Delete a task by ID.
 
         Args:
+            owner_id: The user the task must belong to
             task_id: The task ID
 
         Returns:
@@ -33,7 +34,7 @@ class DeleteTaskUseCase:
         logger.info(f"Deleting task with id: {task_id}")
 
         task_id_vo = EntityId(value=task_id)
-        task_deleted = await self.task_repository.delete_task(task_id_vo)
+        task_deleted = await self.task_repository.delete_task(owner_id, task_id_vo)
 
         if task_deleted:
             logger.info(f"Task deleted: {task_id}")
@@ -0,0 +1,49 @@
+"""
+Export Tasks Use Case
+Handles streaming every task of a user out of the repository.
+"""
+
+import logging
+from typing import AsyncContextManager, AsyncIterator, Callable
+
+from app.common.value_objects import EntityId
+from app.task.domain.entities import Task
+from app.task.domain.ports import TaskRepositoryPort
+
+logger = logging.getLogger(__name__)
+
+# Opens a repository whose session lives as long as the returned context
+RepositoryScope = Callable[[], AsyncContextManager[TaskRepositoryPort]]
+
+
+class ExportTasksUseCase:
+    """
+    Use case for exporting all tasks of a user.
+
+    The export is consumed while the response body is being sent, after
+    the request-scoped session has been closed, so the use case opens its
+    own repository scope for the lifetime of the stream.
+    """
+
+    def __init__(
+        self,
+        repository_scope: RepositoryScope,
+        fetch_size: int
+    ):
+        self.repository_scope = repository_scope
+        self.fetch_size = fetch_size
+
+    async def execute(self, owner_id: EntityId) -> AsyncIterator[Task]:
+        logger.info(
+            f"Exporting tasks of user {owner_id} (fetch_size={self.fetch_size})"
+        )
+
+        exported = 0
+        async with self.repository_scope() as task_repository:
+            async for task in task_repository.stream_tasks(
+                owner_id, self.fetch_size
+            ):
+                exported += 1
+                yield task
+
+        logger.info(f"Exported {exported} tasks")
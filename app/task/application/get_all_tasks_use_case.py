@@ -4,10 +4,13 @@ Handles retrieving all tasks.
 """
 
 import logging
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
-from app.task.domain.entities import Task
+from app.common.value_objects import EntityId
+from app.task.domain.entities import Task, TaskPage, TaskStampPage
 from app.task.domain.ports import TaskRepositoryPort
+from app.core.exceptions import DomainValidationException
+from app.task.domain.value_objects import PageCursor, TaskQuery
 
 logger = logging.getLogger(__name__)
 
@@ -21,11 +24,74 @@ class GetAllTasksUseCase:
     ):
         self.task_repository = task_repository
 
-    async def execute(self) -> List[Task]:
-        logger.info("Retrieving all tasks")
+    async def execute(self, owner_id: EntityId) -> List[Task]:
+        logger.info(f"Retrieving all tasks of user: {owner_id}")
 
-        tasks = await self.task_repository.get_all_tasks()
+        tasks = await self.task_repository.get_all_tasks(owner_id)
 
         logger.info(f"Retrieved {len(tasks)} tasks")
 
         return tasks
+
+    async def execute_page(
+        self,
+        owner_id: EntityId,
+        limit: int,
+        cursor: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> TaskPage:
+        """
+        Retrieve one page of the owner's tasks.
+
+        Args:
+            owner_id: The user whose tasks are listed
+            limit: Maximum number of tasks in the page
+            cursor: Opaque cursor returned by the previous page
+            filters: Optional states, created_from/created_to,
+                updated_from/updated_to and sort (newest first by default)
+
+        Returns:
+            TaskPage: The tasks and the cursor for the next page, if any
+        """
+        query, cursor_vo = self._parse(cursor, filters)
+        logger.info(f"Retrieving tasks page (limit={limit}, sort={query.sort})")
+
+        page = await self.task_repository.get_tasks_page(
+            owner_id, limit, cursor_vo, query
+        )
+
+        logger.info(f"Retrieved {len(page.tasks)} tasks")
+
+        return page
+
+    async def execute_page_stamps(
+        self,
+        owner_id: EntityId,
+        limit: int,
+        cursor: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> TaskStampPage:
+        """
+        Which versions of the tasks execute_page would return, without
+        loading them. Takes the same arguments as execute_page.
+        """
+        query, cursor_vo = self._parse(cursor, filters)
+        return await self.task_repository.get_tasks_page_stamps(
+            owner_id, limit, cursor_vo, query
+        )
+
+    @staticmethod
+    def _parse(
+        cursor: Optional[str], filters: Optional[Dict[str, Any]]
+    ) -> Tuple[TaskQuery, Optional[PageCursor]]:
+        query = TaskQuery.from_dict(filters or {})
+
+        cursor_vo = PageCursor.decode(cursor) if cursor else None
+        if cursor_vo and cursor_vo.sort != query.sort:
+            raise DomainValidationException(
+                message="Cursor de paginación inválido.",
+                detail="El cursor pertenece a otro criterio de ordenación.",
+                code="INVALID_CURSOR"
+            )
+
+        return query, cursor_vo
@@ -0,0 +1,30 @@
+"""
+Get Task Stats Use Case
+Handles retrieving task counts per state.
+"""
+
+import logging
+
+from app.common.value_objects import EntityId
+from app.task.domain.entities import TaskStats
+from app.task.domain.ports import TaskRepositoryPort
+
+logger = logging.getLogger(__name__)
+
+
+class GetTaskStatsUseCase:
+    """Use case for retrieving the number of tasks in each state."""
+
+    def __init__(
+        self,
+        task_repository: TaskRepositoryPort
+    ):
+        self.task_repository = task_repository
+
+    async def execute(self, owner_id: EntityId) -> TaskStats:
+        logger.info("Retrieving task stats")
+
+        stats = await self.task_repository.count_tasks_by_state(owner_id)
+
+        logger.info(f"Task stats retrieved: {stats.total} tasks")
+        return stats
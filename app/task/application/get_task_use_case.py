@@ -7,7 +7,7 @@ import logging
 from typing import Optional
 
 from app.common.value_objects import EntityId
-from app.task.domain.entities import Task
+from app.task.domain.entities import Task, TaskStamp
 from app.task.domain.ports import TaskRepositoryPort
 
 logger = logging.getLogger(__name__)
@@ -22,11 +22,13 @@ class GetTaskUseCase:
     ):
         self.task_repository = task_repository
 
-    async def execute(self, task_id: str) -> Optional[Task]:
+    async def execute(
+        self, owner_id: EntityId, task_id: str
+    ) -> Optional[Task]:
         logger.info(f"Retrieving task with id: {task_id}")
 
         task_id_vo = EntityId(value=task_id)
-        task = await self.task_repository.get_task_by_id(task_id_vo)
+        task = await self.task_repository.get_task_by_id(owner_id, task_id_vo)
 
         if task:
             logger.info(f"Task found: {task_id}")
@@ -34,3 +36,10 @@ class GetTaskUseCase:
             logger.warning(f"Task not found: {task_id}")
 
         return task
+
+    async def execute_stamp(
+        self, owner_id: EntityId, task_id: str
+    ) -> Optional[TaskStamp]:
+        """Which version of the task is current, without loading it."""
+        task_id_vo = EntityId(value=task_id)
+        return await self.task_repository.get_task_stamp(owner_id, task_id_vo)
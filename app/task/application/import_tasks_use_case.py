@@ -0,0 +1,128 @@
+"""
+Import Tasks Use Case
+Handles loading a stream of task rows in chunks.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from app.common.value_objects import EntityId
+from app.core.exceptions import DomainValidationException
+from app.task.domain.entities import Task
+from app.task.domain.ports import TaskRepositoryPort
+from app.task.domain.value_objects import Title, Description, State, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+# (row number, parsed row) pairs; None marks a row that could not be parsed
+ImportRow = Tuple[int, Optional[Dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class ImportRejection:
+    """A row that was not imported and why."""
+    row: int
+    error: DomainValidationException
+
+
+@dataclass
+class TasksImportResult:
+    """Counts of an import plus the first rejected rows."""
+    imported: int = 0
+    rejected: int = 0
+    rejections: List[ImportRejection] = field(default_factory=list)
+
+
+class ImportTasksUseCase:
+    """
+    Use case for importing tasks from a stream of rows.
+
+    Rows are validated with the task value objects as they arrive and
+    valid tasks are loaded chunk_size at a time, each chunk committed on
+    its own, so memory stays bounded by the chunk size. Chunks committed
+    before a failure stay imported.
+    """
+
+    def __init__(
+        self,
+        task_repository: TaskRepositoryPort,
+        chunk_size: int,
+        max_rejections: int
+    ):
+        self.task_repository = task_repository
+        self.chunk_size = chunk_size
+        self.max_rejections = max_rejections
+
+    async def execute(
+        self, owner_id: EntityId, rows: AsyncIterator[ImportRow]
+    ) -> TasksImportResult:
+        """
+        Validate and load every row of the stream.
+
+        Args:
+            owner_id: The user the tasks are imported for
+            rows: (row number, data) pairs with title, description and
+                optional state; data is None for unparseable rows
+
+        Returns:
+            TasksImportResult: Imported and rejected counts, with at most
+            max_rejections rejected rows
+        """
+        logger.info(f"Importing tasks (chunk_size={self.chunk_size})")
+
+        result = TasksImportResult()
+        chunk: List[Task] = []
+
+        async for row_number, data in rows:
+            try:
+                chunk.append(self._to_task(data, owner_id))
+            except DomainValidationException as e:
+                result.rejected += 1
+                if len(result.rejections) < self.max_rejections:
+                    result.rejections.append(
+                        ImportRejection(row=row_number, error=e)
+                    )
+                continue
+
+            if len(chunk) >= self.chunk_size:
+                result.imported += await self.task_repository.copy_tasks(chunk)
+                chunk = []
+
+        if chunk:
+            result.imported += await self.task_repository.copy_tasks(chunk)
+
+        logger.info(
+            f"Import finished: {result.imported} imported, "
+            f"{result.rejected} rejected"
+        )
+
+        return result
+
+    @staticmethod
+    def _to_task(
+        data: Optional[Dict[str, Any]], owner_id: EntityId
+    ) -> Task:
+        if data is None:
+            raise DomainValidationException(
+                message="Fila con formato inválido.",
+                detail="La fila no se pudo interpretar en el formato indicado.",
+                code="INVALID_FORMAT"
+            )
+
+        title = data.get("title")
+        description = data.get("description") or ""
+        state = data.get("state") or TaskStatus.PENDING.value
+        if not all(isinstance(value, str) for value in (title or "", description, state)):
+            raise DomainValidationException(
+                message="Fila con formato inválido.",
+                detail="title, description y state deben ser texto.",
+                code="INVALID_FORMAT"
+            )
+
+        return Task(
+            title=Title(value=title),
+            description=Description(value=description),
+            state=State(value=state),
+            owner_id=owner_id
+        )
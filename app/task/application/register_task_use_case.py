@@ -6,6 +6,7 @@ Handles task creation logic.
 import logging
 from typing import Dict, Any
 
+from app.common.value_objects import EntityId
 from app.task.domain.entities import Task
 from app.task.domain.ports import TaskRepositoryPort
 from app.task.domain.value_objects import Title, Description, State, TaskStatus
@@ -22,7 +23,7 @@ class RegisterTaskUseCase:
     ):
         self.task_repository = task_repository
 
-    async def execute(self, data: Dict[str, Any]) -> Task:
+    async def execute(self, owner_id: EntityId, data: Dict[str, Any]) -> Task:
         logger.info(f"Creating new task with title: {data.get('title')}")
 
         title = Title(value=data["title"])
@@ -32,7 +33,8 @@ class RegisterTaskUseCase:
         task = Task(
             title=title,
             description=description,
-            state=state
+            state=state,
+            owner_id=owner_id
         )
 
         created_task = await self.task_repository.create_task(task)
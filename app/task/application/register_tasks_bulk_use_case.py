@@ -0,0 +1,90 @@
+"""
+Register Tasks Bulk Use Case
+Handles creating many tasks in a single transaction.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from app.common.value_objects import EntityId
+from app.core.exceptions import DomainValidationException
+from app.task.domain.entities import Task
+from app.task.domain.ports import TaskRepositoryPort
+from app.task.domain.value_objects import Title, Description, State, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BulkTaskResult:
+    """Outcome of one item of a bulk creation request."""
+    index: int
+    task: Optional[Task] = None
+    error: Optional[DomainValidationException] = None
+
+
+class RegisterTasksBulkUseCase:
+    """Use case for creating many tasks at once."""
+
+    def __init__(
+        self,
+        task_repository: TaskRepositoryPort,
+        max_items: int
+    ):
+        self.task_repository = task_repository
+        self.max_items = max_items
+
+    async def execute(
+        self, owner_id: EntityId, items: List[Dict[str, Any]]
+    ) -> List[BulkTaskResult]:
+        """
+        Validate every item and persist the valid ones together.
+
+        Args:
+            owner_id: The user the tasks are created for
+            items: Task data dicts (title, description)
+
+        Returns:
+            List[BulkTaskResult]: One result per item, in request order
+        """
+        if len(items) > self.max_items:
+            raise DomainValidationException(
+                message="Demasiadas tareas en la solicitud.",
+                detail=f"Se permiten como máximo {self.max_items} tareas por solicitud.",
+                code="TOO_MANY_ITEMS"
+            )
+
+        logger.info(f"Creating {len(items)} tasks in bulk")
+
+        results: Dict[int, BulkTaskResult] = {}
+        valid_tasks: List[Task] = []
+        index_by_id: Dict[Any, int] = {}
+
+        for index, data in enumerate(items):
+            try:
+                task = Task(
+                    title=Title(value=data.get("title")),
+                    description=Description(value=data.get("description")),
+                    state=State(value=TaskStatus.PENDING.value),
+                    owner_id=owner_id
+                )
+            except DomainValidationException as e:
+                results[index] = BulkTaskResult(index=index, error=e)
+                continue
+
+            valid_tasks.append(task)
+            index_by_id[task.id.value] = index
+
+        if valid_tasks:
+            created_tasks = await self.task_repository.create_tasks(valid_tasks)
+            for task in created_tasks:
+                index = index_by_id[task.id.value]
+                results[index] = BulkTaskResult(index=index, task=task)
+
+        logger.info(
+            f"Bulk creation finished: {len(valid_tasks)} created, "
+            f"{len(items) - len(valid_tasks)} rejected"
+        )
+
+        return [results[index] for index in range(len(items))]
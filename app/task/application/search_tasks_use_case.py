@@ -0,0 +1,44 @@
+"""
+Search Tasks Use Case
+Handles ranked text search over an owner's tasks.
+"""
+
+import logging
+
+from app.common.value_objects import EntityId
+from app.core.exceptions import RequiredFieldException
+from app.task.domain.entities import TaskSearchPage
+from app.task.domain.ports import TaskSearchPort
+
+logger = logging.getLogger(__name__)
+
+
+class SearchTasksUseCase:
+    """Use case for searching tasks by title and description."""
+
+    def __init__(
+        self,
+        task_search: TaskSearchPort
+    ):
+        self.task_search = task_search
+
+    async def execute(
+        self, owner_id: EntityId, text: str, limit: int, offset: int = 0
+    ) -> TaskSearchPage:
+        text = text.strip()
+        if not text:
+            raise RequiredFieldException(
+                message="El texto de búsqueda es requerido.",
+                detail="El texto de búsqueda no puede estar vacío."
+            )
+
+        logger.info(
+            f"Searching tasks (limit={limit}, offset={offset}): {text!r}"
+        )
+
+        page = await self.task_search.search_tasks(
+            owner_id, text, limit, offset
+        )
+
+        logger.info(f"Search matched {len(page.hits)} tasks")
+        return page
@@ -7,9 +7,10 @@ import logging
 from typing import Dict, Any, Optional
 
 from app.task.domain.entities import Task
+from app.task.domain.exceptions import TaskVersionConflictException
 from app.common.value_objects import EntityId
 from app.task.domain.ports import TaskRepositoryPort
-from app.task.domain.value_objects import Title, Description, State
+from app.task.domain.value_objects import TaskUpdate
 
 logger = logging.getLogger(__name__)
 
@@ -25,47 +26,111 @@ class UpdateTaskUseCase:
 
     async def execute(
         self,
+        owner_id: EntityId,
         task_id: str,
-        data: Dict[str, Any]
+        data: Dict[str, Any],
+        expected_version: Optional[int] = None
     ) -> Optional[Task]:
         """
         Update a task.
 
         Args:
+            owner_id: The user the task must belong to
             task_id: The task ID to update
             data: Dictionary with updated task data (title, description, state)
+            expected_version: Only update while the task is at this version
 
         Returns:
             Task: The updated task entity if found, None otherwise
+
+        Raises:
+            TaskVersionConflictException: The task exists at another version
         """
         logger.info(f"Updating task with id: {task_id}")
+        return await self._apply(
+            owner_id, task_id, data, expected_version, only_changed=False
+        )
 
-        task_id_vo = EntityId(value=task_id)
-
-        existing_task = await self.task_repository.get_task_by_id(task_id_vo)
-
-        if not existing_task:
-            logger.warning(f"Task not found for update: {task_id}")
-            return None
-
-        # Create value objects with updated data or keep existing
-        title = Title(value=data.get("title", existing_task.title.value))
-        description = Description(value=data.get("description", existing_task.description.value))
-        state = State(value=data.get("state", existing_task.state.value))
-
-        # Create updated task entity
-        updated_task = Task(
-            title=title,
-            description=description,
-            state=state,
-            id=existing_task.id,
-            created_at=existing_task.created_at,
-            updated_at=existing_task.updated_at
+    async def execute_patch(
+        self,
+        owner_id: EntityId,
+        task_id: str,
+        data: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> Optional[Task]:
+        """
+        Update a task only where data differs from what is stored.
+        Values equal to the stored ones are not written, and a request
+        that changes nothing writes nothing: the task keeps its
+        updated_at and version. Arguments and result as in execute.
+        """
+        logger.info(f"Patching task with id: {task_id}")
+        return await self._apply(
+            owner_id, task_id, data, expected_version, only_changed=True
         )
 
-        # Save updated task
-        result = await self.task_repository.update_task(updated_task)
+    async def _apply(
+        self,
+        owner_id: EntityId,
+        task_id: str,
+        data: Dict[str, Any],
+        expected_version: Optional[int],
+        only_changed: bool
+    ) -> Optional[Task]:
+        task_id_vo = EntityId(value=task_id)
+
+        # Each field is validated by its own value object and no invariant
+        # spans fields, so the new values never depend on the stored row:
+        # validate first and write with a single UPDATE ... RETURNING.
+        changes = TaskUpdate.from_dict(data)
+
+        if changes.is_empty():
+            # Nothing to write, answer with the current state
+            return await self._current(owner_id, task_id_vo, expected_version)
+
+        if only_changed:
+            result = await self.task_repository.update_changed_task_fields(
+                owner_id, task_id_vo, changes, expected_version
+            )
+            if not result:
+                # Missing, at another version, or already holding the values
+                logger.info(f"No changes written for task: {task_id}")
+                return await self._current(owner_id, task_id_vo, expected_version)
+        else:
+            # Compare-and-set on the version: no read, no row lock held
+            result = await self.task_repository.update_task_fields(
+                owner_id, task_id_vo, changes, expected_version
+            )
+            if not result:
+                # Told apart only on failure: gone, or moved to another version
+                if expected_version is not None and (
+                    await self.task_repository.get_task_stamp(owner_id, task_id_vo)
+                ):
+                    logger.warning(f"Task version conflict on update: {task_id}")
+                    raise TaskVersionConflictException(task_id)
+
+                logger.warning(f"Task not found for update: {task_id}")
+                return None
 
         logger.info(f"Task updated successfully: {task_id}")
 
         return result
+
+    async def _current(
+        self,
+        owner_id: EntityId,
+        task_id: EntityId,
+        expected_version: Optional[int]
+    ) -> Optional[Task]:
+        """The stored task, which must still be at expected_version."""
+        if expected_version is not None:
+            # From the database, not a possibly stale cached copy
+            stamp = await self.task_repository.get_task_stamp(owner_id, task_id)
+            if stamp and stamp.version != expected_version:
+                logger.warning(f"Task version conflict on update: {task_id}")
+                raise TaskVersionConflictException(str(task_id))
+
+        task = await self.task_repository.get_task_by_id(owner_id, task_id)
+        if not task:
+            logger.warning(f"Task not found for update: {task_id}")
+        return task
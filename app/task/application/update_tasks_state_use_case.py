@@ -0,0 +1,89 @@
+"""
+Update Tasks State Use Case
+Handles moving many tasks to the same state at once.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import List
+
+from app.common.value_objects import EntityId
+from app.core.exceptions import DomainValidationException
+from app.task.domain.ports import TaskRepositoryPort
+from app.task.domain.value_objects import State
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TasksStateUpdateResult:
+    """Ids that were updated and ids that matched no task."""
+    state: State
+    updated_ids: List[EntityId]
+    not_found_ids: List[EntityId]
+
+
+class UpdateTasksStateUseCase:
+    """Use case for changing the state of many tasks."""
+
+    def __init__(
+        self,
+        task_repository: TaskRepositoryPort,
+        max_items: int
+    ):
+        self.task_repository = task_repository
+        self.max_items = max_items
+
+    async def execute(
+        self,
+        owner_id: EntityId,
+        task_ids: List[str],
+        state: str
+    ) -> TasksStateUpdateResult:
+        """
+        Set the state of every given task in one statement.
+
+        Args:
+            owner_id: The user the tasks must belong to
+            task_ids: The task IDs to update
+            state: Target state (pending, completed)
+
+        Returns:
+            TasksStateUpdateResult: Updated and not found ids
+        """
+        state_vo = State(value=state)
+
+        # Deduplicate while keeping request order
+        task_id_vos = list(dict.fromkeys(
+            EntityId(value=task_id) for task_id in task_ids
+        ))
+
+        if len(task_id_vos) > self.max_items:
+            raise DomainValidationException(
+                message="Demasiadas tareas en la solicitud.",
+                detail=f"Se permiten como máximo {self.max_items} tareas por solicitud.",
+                code="TOO_MANY_ITEMS"
+            )
+
+        logger.info(
+            f"Updating state of {len(task_id_vos)} tasks to {state_vo.value}"
+        )
+
+        updated_ids = set(
+            await self.task_repository.update_tasks_state(
+                owner_id, task_id_vos, state_vo
+            )
+        )
+        updated = [task_id for task_id in task_id_vos if task_id in updated_ids]
+        not_found = [
+            task_id for task_id in task_id_vos if task_id not in updated_ids
+        ]
+
+        if not_found:
+            logger.warning(f"Tasks not found for state update: {len(not_found)}")
+
+        return TasksStateUpdateResult(
+            state=state_vo,
+            updated_ids=updated,
+            not_found_ids=not_found,
+        )
@@ -16,9 +16,12 @@ class Task:
     description: Description
     state: State
 
+    owner_id: Optional[EntityId] = None
     id: Optional[EntityId] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    # Incremented by every write; conditional writes compare-and-set on it
+    version: int = 1
 
     def __post_init__(self):
         if self.id is None:
@@ -33,6 +36,8 @@ class Task:
             "title": self.title.value,
             "description": self.description.value,
             "state": self.state.value,
+            "owner_id": self.owner_id.value if self.owner_id else None,
             "created_at": self.created_at,
-            "updated_at": self.updated_at
+            "updated_at": self.updated_at,
+            "version": self.version
         }
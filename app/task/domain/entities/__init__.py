@@ -1,5 +1,15 @@
 from .Task import Task
+from .task_page import TaskPage
+from .task_search_page import TaskSearchHit, TaskSearchPage
+from .task_stats import TaskStats
+from .task_stamp import TaskStamp, TaskStampPage
 
 __all__ = [
-    "Task"
+    "Task",
+    "TaskPage",
+    "TaskSearchHit",
+    "TaskSearchPage",
+    "TaskStats",
+    "TaskStamp",
+    "TaskStampPage",
 ]
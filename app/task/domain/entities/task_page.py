@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from app.task.domain.entities.Task import Task
+from app.task.domain.value_objects import PageCursor
+
+
+@dataclass(frozen=True)
+class TaskPage:
+    """A page of tasks plus the cursor to fetch the next one."""
+    tasks: List[Task]
+    next_cursor: Optional[PageCursor] = None
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from app.task.domain.entities.Task import Task
+
+
+@dataclass(frozen=True)
+class TaskSearchHit:
+    """A task matching a search and how well it matches."""
+    task: Task
+    rank: float
+
+
+@dataclass(frozen=True)
+class TaskSearchPage:
+    """A page of search hits, best first, plus the offset of the next page."""
+    hits: List[TaskSearchHit]
+    next_offset: Optional[int] = None
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
+from app.common.value_objects import EntityId
+from app.task.domain.entities.Task import Task
+from app.task.domain.entities.task_page import TaskPage
+
+
+@dataclass(frozen=True)
+class TaskStamp:
+    """Id, last modification time and version of a task, without content."""
+    id: EntityId
+    updated_at: datetime
+    version: int = 1
+
+    @classmethod
+    def of(cls, task: Task) -> "TaskStamp":
+        return cls(id=task.id, updated_at=task.updated_at, version=task.version)
+
+
+@dataclass(frozen=True)
+class TaskStampPage:
+    """Stamps of the tasks in a page, and whether a next page exists."""
+    stamps: List[TaskStamp]
+    has_more: bool = False
+
+    @classmethod
+    def of(cls, page: TaskPage) -> "TaskStampPage":
+        return cls(
+            stamps=[TaskStamp.of(task) for task in page.tasks],
+            has_more=page.next_cursor is not None,
+        )
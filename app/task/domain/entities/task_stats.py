@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Dict
+
+
+@dataclass(frozen=True)
+class TaskStats:
+    """Number of an owner's tasks in each state, every state present."""
+    by_state: Dict[str, int]
+
+    @property
+    def total(self) -> int:
+        return sum(self.by_state.values())
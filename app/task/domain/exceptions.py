@@ -0,0 +1,11 @@
+from app.core.exceptions import BaseApplicationException
+
+
+class TaskVersionConflictException(BaseApplicationException):
+    """Raised when a conditional write finds the task at another version."""
+
+    def __init__(self, task_id: str):
+        super().__init__(
+            message=f"Task with id {task_id} was modified by another request",
+            code="VERSION_CONFLICT",
+        )
@@ -1,5 +1,9 @@
 from .task_repository_port import TaskRepositoryPort
+from .task_cache_port import TaskCachePort
+from .task_search_port import TaskSearchPort
 
 __all__ = [
-    "TaskRepositoryPort"
+    "TaskRepositoryPort",
+    "TaskCachePort",
+    "TaskSearchPort",
 ]
@@ -0,0 +1,54 @@
+"""
+Task Cache Port
+Interface for a cache of task entities, local to a worker or shared.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from app.common.value_objects import EntityId
+from app.task.domain.entities import Task
+
+
+class TaskCachePort(ABC):
+    """Interface for a task cache backend."""
+
+    @abstractmethod
+    async def get(self, task_id: EntityId) -> Optional[Task]:
+        """
+        Return the cached task or None on a miss.
+        """
+        pass
+
+    @abstractmethod
+    async def set(
+        self, task: Task, ttl_seconds: float, generation: Optional[int] = None
+    ) -> None:
+        """
+        Cache a task for ttl_seconds. With a generation from generation(),
+        skip it if the task was invalidated since then: it was read before
+        a write that has already been invalidated, and is stale.
+        """
+        pass
+
+    @abstractmethod
+    async def generation(self) -> int:
+        """
+        Current invalidation generation; read it before loading a task
+        that will be passed to set().
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, task_ids: List[EntityId]) -> None:
+        """
+        Invalidate the given tasks.
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit, miss and size counters.
+        """
+        pass
@@ -1,26 +1,133 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
-from app.task.domain.entities import Task
+from typing import AsyncIterator, Optional, List
+from app.task.domain.entities import (
+    Task,
+    TaskPage,
+    TaskStamp,
+    TaskStampPage,
+    TaskStats,
+)
+from app.task.domain.value_objects import (
+    PageCursor,
+    State,
+    TaskQuery,
+    TaskUpdate,
+)
 from app.common.value_objects import EntityId
 
 
 class TaskRepositoryPort(ABC):
+    """
+    Tasks are scoped to their owner: every read and write takes the
+    owner's id (or a task carrying it) and never sees other users' tasks.
+    """
+
     @abstractmethod
     async def create_task(self, task: Task) -> Task:
         pass
 
     @abstractmethod
-    async def get_task_by_id(self, task_id: EntityId) -> Optional[Task]:
+    async def create_tasks(self, tasks: List[Task]) -> List[Task]:
+        pass
+
+    @abstractmethod
+    async def copy_tasks(self, tasks: List[Task]) -> int:
+        """Bulk-load tasks without returning them; returns the row count."""
+        pass
+
+    @abstractmethod
+    async def get_task_by_id(
+        self, owner_id: EntityId, task_id: EntityId
+    ) -> Optional[Task]:
+        pass
+
+    @abstractmethod
+    async def get_all_tasks(self, owner_id: EntityId) -> List[Task]:
+        pass
+
+    @abstractmethod
+    async def get_tasks_page(
+        self,
+        owner_id: EntityId,
+        limit: int,
+        cursor: Optional[PageCursor] = None,
+        query: Optional[TaskQuery] = None
+    ) -> TaskPage:
+        """Page of the owner's tasks matching query (default: all, newest first)."""
+        pass
+
+    @abstractmethod
+    async def get_task_stamp(
+        self, owner_id: EntityId, task_id: EntityId
+    ) -> Optional[TaskStamp]:
+        """Id and updated_at of the task, without loading its content."""
         pass
 
     @abstractmethod
-    async def get_all_tasks(self) -> List[Task]:
+    async def get_tasks_page_stamps(
+        self,
+        owner_id: EntityId,
+        limit: int,
+        cursor: Optional[PageCursor] = None,
+        query: Optional[TaskQuery] = None
+    ) -> TaskStampPage:
+        """Stamps of the tasks get_tasks_page would return, in the same order."""
+        pass
+
+    @abstractmethod
+    def stream_tasks(
+        self, owner_id: EntityId, fetch_size: int
+    ) -> AsyncIterator[Task]:
+        """Iterate over the owner's tasks, oldest first, fetch_size rows at a time."""
         pass
 
     @abstractmethod
     async def update_task(self, task: Task) -> Optional[Task]:
+        """
+        Write every field of task if the stored row is still at
+        task.version; None if the task is gone or was modified since.
+        """
+        pass
+
+    @abstractmethod
+    async def update_task_fields(
+        self,
+        owner_id: EntityId,
+        task_id: EntityId,
+        changes: TaskUpdate,
+        expected_version: Optional[int] = None
+    ) -> Optional[Task]:
+        """
+        Apply changes, only while the task is at expected_version when one
+        is given; None if the task is gone or is at another version.
+        """
+        pass
+
+    @abstractmethod
+    async def update_changed_task_fields(
+        self,
+        owner_id: EntityId,
+        task_id: EntityId,
+        changes: TaskUpdate,
+        expected_version: Optional[int] = None
+    ) -> Optional[Task]:
+        """
+        Like update_task_fields, but writes nothing when every change
+        already matches the stored value; None in that case too.
+        """
+        pass
+
+    @abstractmethod
+    async def update_tasks_state(
+        self, owner_id: EntityId, task_ids: List[EntityId], state: State
+    ) -> List[EntityId]:
+        pass
+
+    @abstractmethod
+    async def delete_task(self, owner_id: EntityId, task_id: EntityId) -> bool:
         pass
 
     @abstractmethod
-    async def delete_task(self, task_id: EntityId) -> bool:
+    async def count_tasks_by_state(self, owner_id: EntityId) -> TaskStats:
+        """The owner's task counts per state, without scanning tasks."""
         pass
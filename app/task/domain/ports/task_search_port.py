@@ -0,0 +1,24 @@
+"""
+Task Search Port
+Interface for ranked text search over a user's tasks.
+"""
+
+from abc import ABC, abstractmethod
+
+from app.common.value_objects import EntityId
+from app.task.domain.entities import TaskSearchPage
+
+
+class TaskSearchPort(ABC):
+    """Interface for a task search backend."""
+
+    @abstractmethod
+    async def search_tasks(
+        self, owner_id: EntityId, text: str, limit: int, offset: int = 0
+    ) -> TaskSearchPage:
+        """
+        Tasks of owner_id whose title or description match text, best
+        match first. Matches title and description words, plus titles
+        that are a close (fuzzy) match for the text.
+        """
+        pass
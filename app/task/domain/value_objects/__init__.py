@@ -1,10 +1,17 @@
 from .description import Description
 from .state import State, TaskStatus
 from .title import Title
+from .page_cursor import PageCursor
+from .task_update import TaskUpdate
+from .task_query import TaskQuery, SORT_KEYS
 
 __all__ = [
     "Title",
     "State",
     "TaskStatus",
-    "Description"
+    "Description",
+    "PageCursor",
+    "TaskUpdate",
+    "TaskQuery",
+    "SORT_KEYS",
 ]
@@ -0,0 +1,68 @@
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Union
+from app.core.exceptions import DomainValidationException
+
+# Sort fields whose cursor value is a timestamp; the rest are strings
+TIMESTAMP_SORT_FIELDS = ("created_at", "updated_at")
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """
+    Keyset position of the last task returned in a page: the value of the
+    sort column plus the id that breaks ties, under the sort it came from.
+    """
+    value: Union[datetime, str]
+    id: uuid.UUID
+    sort: str = "-created_at"
+
+    def encode(self) -> str:
+        """Serialize the cursor as an opaque URL-safe token."""
+        value = (
+            self.value.isoformat() if isinstance(self.value, datetime)
+            else self.value
+        )
+        payload = json.dumps(
+            {"s": self.sort, "v": value, "i": str(self.id)},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """Parse a token produced by encode()."""
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if "c" in payload:
+                # Cursors issued before sorting existed: newest first
+                payload = {"s": "-created_at", "v": payload["c"], "i": payload["i"]}
+
+            sort = payload["s"]
+            value = payload["v"]
+            if not isinstance(sort, str) or not isinstance(value, str):
+                raise TypeError("cursor fields must be strings")
+            if sort.lstrip("-") in TIMESTAMP_SORT_FIELDS:
+                value = datetime.fromisoformat(value)
+                if value.tzinfo is None:
+                    # Compared with timestamptz columns: naive is taken as UTC
+                    value = value.replace(tzinfo=timezone.utc)
+
+            return cls(value=value, id=uuid.UUID(payload["i"]), sort=sort)
+        except (
+            binascii.Error,
+            UnicodeDecodeError,
+            ValueError,
+            KeyError,
+            TypeError,
+        ):
+            raise DomainValidationException(
+                message="Cursor de paginación inválido.",
+                detail="El cursor no tiene un formato válido.",
+                code="INVALID_CURSOR"
+            )
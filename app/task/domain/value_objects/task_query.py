@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+from app.core.exceptions import DomainValidationException
+from app.task.domain.value_objects.state import State, TaskStatus
+
+# Sort keys a client may ask for; a leading "-" sorts descending. Each
+# one is backed by an (owner_id, <column>, id) index.
+SORT_FIELDS = ("created_at", "updated_at", "title")
+SORT_KEYS = tuple(
+    key for field in SORT_FIELDS for key in (field, f"-{field}")
+)
+DEFAULT_SORT = "-created_at"
+
+
+@dataclass(frozen=True)
+class TaskQuery:
+    """
+    Validated filters and sort order of a task listing.
+    Unset filters do not restrict the result; date bounds are inclusive.
+    """
+    states: Tuple[State, ...] = ()
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    updated_from: Optional[datetime] = None
+    updated_to: Optional[datetime] = None
+    sort: str = DEFAULT_SORT
+
+    def __post_init__(self):
+        if self.sort not in SORT_KEYS:
+            raise DomainValidationException(
+                message="Criterio de ordenación inválido.",
+                detail=f"El orden debe ser uno de: {', '.join(SORT_KEYS)}.",
+                code="INVALID_SORT"
+            )
+
+        for name, start, end in (
+            ("creación", self.created_from, self.created_to),
+            ("actualización", self.updated_from, self.updated_to),
+        ):
+            if start and end and start > end:
+                raise DomainValidationException(
+                    message="Rango de fechas inválido.",
+                    detail=f"La fecha inicial de {name} es posterior a la final.",
+                    code="INVALID_DATE_RANGE"
+                )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TaskQuery":
+        """Build the query validating only the filters present in data."""
+        states = tuple(dict.fromkeys(
+            State(value=state) for state in data.get("states") or ()
+        ))
+        # Every state selected is the same as no state filter
+        if len(states) == len(TaskStatus):
+            states = ()
+
+        return cls(
+            states=states,
+            created_from=cls._aware(data.get("created_from")),
+            created_to=cls._aware(data.get("created_to")),
+            updated_from=cls._aware(data.get("updated_from")),
+            updated_to=cls._aware(data.get("updated_to")),
+            sort=data.get("sort") or DEFAULT_SORT,
+        )
+
+    @property
+    def sort_field(self) -> str:
+        return self.sort.lstrip("-")
+
+    @property
+    def descending(self) -> bool:
+        return self.sort.startswith("-")
+
+    @staticmethod
+    def _aware(value: Optional[datetime]) -> Optional[datetime]:
+        """Naive datetimes are taken as UTC."""
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
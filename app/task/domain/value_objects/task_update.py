@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from app.task.domain.value_objects.title import Title
+from app.task.domain.value_objects.description import Description
+from app.task.domain.value_objects.state import State
+
+
+@dataclass(frozen=True)
+class TaskUpdate:
+    """
+    Validated set of task fields to change.
+    Fields left as None are not modified.
+    """
+    title: Optional[Title] = None
+    description: Optional[Description] = None
+    state: Optional[State] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TaskUpdate":
+        """Build the update validating only the fields present in data."""
+        return cls(
+            title=Title(value=data["title"]) if "title" in data else None,
+            description=(
+                Description(value=data["description"])
+                if "description" in data else None
+            ),
+            state=State(value=data["state"]) if "state" in data else None,
+        )
+
+    def is_empty(self) -> bool:
+        return not self.to_dict()
+
+    def to_dict(self) -> Dict[str, str]:
+        """Primitive values of the fields to change, keyed by field name."""
+        fields = {
+            "title": self.title,
+            "description": self.description,
+            "state": self.state,
+        }
+        return {
+            name: value_object.value
+            for name, value_object in fields.items()
+            if value_object is not None
+        }
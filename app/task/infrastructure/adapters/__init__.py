@@ -0,0 +1,9 @@
+from .lru_task_cache import LRUTaskCache
+from .in_memory_task_cache import InMemoryTaskCache
+from .in_memory_task_search import InMemoryTaskSearch
+
+__all__ = [
+    "LRUTaskCache",
+    "InMemoryTaskCache",
+    "InMemoryTaskSearch",
+]
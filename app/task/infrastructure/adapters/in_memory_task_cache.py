@@ -0,0 +1,59 @@
+"""
+In-Memory Task Cache
+Process-local stand-in for a shared task cache backend (e.g. Redis).
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.common.value_objects import EntityId
+from app.task.domain.entities import Task
+from app.task.domain.ports import TaskCachePort
+from app.task.infrastructure.adapters.invalidation_log import InvalidationLog
+
+
+class InMemoryTaskCache(TaskCachePort):
+    """Dictionary-backed implementation of the task cache port."""
+
+    def __init__(self, max_invalidations: int = 10_000):
+        self._entries: Dict[UUID, Tuple[Task, float]] = {}
+        self._invalidations = InvalidationLog(max_invalidations)
+        self._hits = 0
+        self._misses = 0
+        self._stale_skips = 0
+
+    async def get(self, task_id: EntityId) -> Optional[Task]:
+        entry = self._entries.get(task_id.value)
+        if entry is None or entry[1] <= time.monotonic():
+            self._entries.pop(task_id.value, None)
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return entry[0]
+
+    async def set(
+        self, task: Task, ttl_seconds: float, generation: Optional[int] = None
+    ) -> None:
+        if self._invalidations.is_stale(task.id, generation):
+            self._stale_skips += 1
+            return
+        self._entries[task.id.value] = (task, time.monotonic() + ttl_seconds)
+
+    async def generation(self) -> int:
+        return self._invalidations.generation
+
+    async def delete(self, task_ids: List[EntityId]) -> None:
+        self._invalidations.record(task_ids)
+        for task_id in task_ids:
+            self._entries.pop(task_id.value, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "memory",
+            "size": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "stale_skips": self._stale_skips,
+        }
@@ -0,0 +1,127 @@
+"""
+In-Memory Task Search
+Inverted-index stand-in for the PostgreSQL task search (e.g. in tests).
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+from uuid import UUID
+
+from app.common.value_objects import EntityId
+from app.task.domain.entities import Task, TaskSearchHit, TaskSearchPage
+from app.task.domain.ports import TaskSearchPort
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# Relative weight of a word in the title and in the description, like the
+# 'A' and 'B' weights of search_vector
+TITLE_WEIGHT = 1.0
+DESCRIPTION_WEIGHT = 0.4
+
+# pg_trgm's default word_similarity_threshold
+FUZZY_THRESHOLD = 0.6
+
+
+def _words(text: str) -> List[str]:
+    return WORD_PATTERN.findall(text.lower())
+
+
+def _trigrams(words: Iterable[str]) -> Set[str]:
+    """Trigrams of each word padded like pg_trgm does."""
+    trigrams: Set[str] = set()
+    for word in words:
+        padded = f"  {word} "
+        trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+class InMemoryTaskSearch(TaskSearchPort):
+    """
+    Word -> {task id: weight} inverted index plus per-task title trigrams.
+
+    Ranks like PostgresTaskSearch, approximately: the summed weight of the
+    query words found in the task, plus the best trigram similarity of
+    the query to a word of the title. Tasks have to be indexed explicitly
+    with index() and dropped with remove().
+    """
+
+    def __init__(self):
+        self._tasks: Dict[UUID, Task] = {}
+        self._postings: Dict[str, Dict[UUID, float]] = defaultdict(dict)
+        self._title_trigrams: Dict[UUID, List[Set[str]]] = {}
+
+    def index(self, task: Task) -> None:
+        task_id = task.id.value
+        self.remove(task.id)
+        self._tasks[task_id] = task
+
+        for weight, text in (
+            (TITLE_WEIGHT, task.title.value),
+            (DESCRIPTION_WEIGHT, task.description.value),
+        ):
+            for word in _words(text):
+                postings = self._postings[word]
+                postings[task_id] = postings.get(task_id, 0.0) + weight
+
+        self._title_trigrams[task_id] = [
+            _trigrams([word]) for word in _words(task.title.value)
+        ]
+
+    def remove(self, task_id: EntityId) -> None:
+        if self._tasks.pop(task_id.value, None) is None:
+            return
+
+        for word in list(self._postings):
+            postings = self._postings[word]
+            postings.pop(task_id.value, None)
+            if not postings:
+                del self._postings[word]
+        self._title_trigrams.pop(task_id.value, None)
+
+    async def search_tasks(
+        self, owner_id: EntityId, text: str, limit: int, offset: int = 0
+    ) -> TaskSearchPage:
+        words = _words(text)
+        ranks: Dict[UUID, float] = defaultdict(float)
+
+        for word in words:
+            for task_id, weight in self._postings.get(word, {}).items():
+                ranks[task_id] += weight
+
+        query_trigrams = _trigrams(words)
+        for task_id, title_words in self._title_trigrams.items():
+            similarity = self._word_similarity(query_trigrams, title_words)
+            if task_id in ranks or similarity >= FUZZY_THRESHOLD:
+                ranks[task_id] += similarity
+
+        matches: List[Tuple[float, Task]] = sorted(
+            (
+                (rank, self._tasks[task_id])
+                for task_id, rank in ranks.items()
+                if self._tasks[task_id].owner_id == owner_id
+            ),
+            key=lambda match: (-match[0], match[1].id.value),
+        )
+
+        page = matches[offset:offset + limit]
+        next_offset = offset + limit if len(matches) > offset + limit else None
+        return TaskSearchPage(
+            hits=[TaskSearchHit(task=task, rank=rank) for rank, task in page],
+            next_offset=next_offset,
+        )
+
+    @staticmethod
+    def _word_similarity(
+        query_trigrams: Set[str], title_words: List[Set[str]]
+    ) -> float:
+        """Share of the query's trigrams found in its best-matching title word."""
+        if not query_trigrams:
+            return 0.0
+        return max(
+            (
+                len(query_trigrams & word) / len(query_trigrams)
+                for word in title_words
+            ),
+            default=0.0,
+        )
@@ -0,0 +1,49 @@
+"""
+Invalidation Log
+Per-task invalidation generations backing TaskCachePort.generation().
+"""
+
+from collections import OrderedDict
+from typing import List, Optional
+from uuid import UUID
+
+from app.common.value_objects import EntityId
+
+
+class InvalidationLog:
+    """
+    Stamps every invalidated task with a new generation, so a cache can
+    refuse to store a task read before its last invalidation.
+
+    Only the most recent max_entries stamps are kept. A generation older
+    than the newest stamp dropped is treated as stale for every task:
+    such a store is skipped rather than risked.
+    """
+
+    def __init__(self, max_entries: int):
+        self._stamps: "OrderedDict[UUID, int]" = OrderedDict()
+        self._max_entries = max_entries
+        self._generation = 0
+        self._floor = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def record(self, task_ids: List[EntityId]) -> None:
+        self._generation += 1
+        for task_id in task_ids:
+            self._stamps[task_id.value] = self._generation
+            self._stamps.move_to_end(task_id.value)
+
+        while len(self._stamps) > self._max_entries:
+            _, stamp = self._stamps.popitem(last=False)
+            self._floor = max(self._floor, stamp)
+
+    def is_stale(self, task_id: EntityId, generation: Optional[int]) -> bool:
+        """Whether task_id was invalidated after generation was read."""
+        if generation is None:
+            return False
+        if generation < self._floor:
+            return True
+        return self._stamps.get(task_id.value, 0) > generation
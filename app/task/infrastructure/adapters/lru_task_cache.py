@@ -0,0 +1,90 @@
+"""
+LRU Task Cache
+In-process LRU cache of task entities with a per-entry TTL.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.common.value_objects import EntityId
+from app.task.domain.entities import Task
+from app.task.domain.ports import TaskCachePort
+from app.task.infrastructure.adapters.invalidation_log import InvalidationLog
+
+
+class LRUTaskCache(TaskCachePort):
+    """
+    Bounded LRU of task entities local to one worker process.
+
+    Entries expire after the ttl_seconds they were set with, so updates
+    made by other workers are picked up within that window.
+    """
+
+    def __init__(self, max_entries: int):
+        self._entries: "OrderedDict[UUID, Tuple[Task, float]]" = OrderedDict()
+        self._max_entries = max_entries
+        self._invalidation_log = InvalidationLog(max_entries)
+
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        self._stale_skips = 0
+
+    async def get(self, task_id: EntityId) -> Optional[Task]:
+        entry = self._entries.get(task_id.value)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        task, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[task_id.value]
+            self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(task_id.value)
+        self._hits += 1
+        return task
+
+    async def set(
+        self, task: Task, ttl_seconds: float, generation: Optional[int] = None
+    ) -> None:
+        if self._invalidation_log.is_stale(task.id, generation):
+            self._stale_skips += 1
+            return
+
+        self._entries[task.id.value] = (task, time.monotonic() + ttl_seconds)
+        self._entries.move_to_end(task.id.value)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    async def generation(self) -> int:
+        return self._invalidation_log.generation
+
+    async def delete(self, task_ids: List[EntityId]) -> None:
+        self._invalidation_log.record(task_ids)
+        for task_id in task_ids:
+            if self._entries.pop(task_id.value, None) is not None:
+                self._invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "invalidations": self._invalidations,
+            "stale_skips": self._stale_skips,
+        }
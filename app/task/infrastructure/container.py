@@ -0,0 +1,120 @@
+"""
+Task Module Container
+Application-scoped singletons and per-request factories for the task module.
+"""
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import Settings
+from app.core.database import async_session_factory
+from app.task.application import (
+    RegisterTaskUseCase,
+    GetAllTasksUseCase,
+    GetTaskUseCase,
+    DeleteTaskUseCase,
+    UpdateTaskUseCase,
+    RegisterTasksBulkUseCase,
+    UpdateTasksStateUseCase,
+    ExportTasksUseCase,
+    ImportTasksUseCase,
+    SearchTasksUseCase,
+    GetTaskStatsUseCase,
+)
+from app.task.domain.ports import TaskCachePort, TaskRepositoryPort
+from app.task.infrastructure.adapters import InMemoryTaskCache, LRUTaskCache
+from app.task.infrastructure.repositories import (
+    CachedTaskRepository,
+    PostgresTaskSearch,
+    TaskRepository
+)
+from app.task.infrastructure.presentation.controllers import (
+    TaskController
+)
+
+
+class TaskContainer:
+    """
+    Holds the task caches for the lifetime of the process and builds the
+    session-bound repository, use cases and controller for each request.
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.local_task_cache = LRUTaskCache(
+            max_entries=settings.TASK_CACHE_MAX_ENTRIES,
+        )
+        self.shared_task_cache = self._build_shared_task_cache()
+        self.export_tasks_use_case = ExportTasksUseCase(
+            self.task_repository_scope,
+            fetch_size=settings.TASKS_EXPORT_FETCH_SIZE,
+        )
+
+    def task_repository(self, session: AsyncSession) -> TaskRepositoryPort:
+        """TaskRepository bound to session, wrapped by the read cache if enabled."""
+        repository = TaskRepository(session)
+        if not self.settings.TASK_CACHE_ENABLED:
+            return repository
+
+        return CachedTaskRepository(
+            repository,
+            local_cache=self.local_task_cache,
+            shared_cache=self.shared_task_cache,
+            local_ttl_seconds=self.settings.TASK_CACHE_TTL_SECONDS,
+            shared_ttl_seconds=self.settings.TASK_CACHE_SHARED_TTL_SECONDS,
+        )
+
+    @asynccontextmanager
+    async def task_repository_scope(self) -> AsyncIterator[TaskRepositoryPort]:
+        """
+        TaskRepository on its own session, closed when the scope exits.
+        Used by streams that outlive the request-scoped session.
+        """
+        async with async_session_factory() as session:
+            yield TaskRepository(session)
+
+    def task_controller(self, session: AsyncSession) -> TaskController:
+        """TaskController with every use case bound to session."""
+        task_repository = self.task_repository(session)
+        return TaskController(
+            register_task_use_case=RegisterTaskUseCase(task_repository),
+            get_all_tasks_use_case=GetAllTasksUseCase(task_repository),
+            get_task_use_case=GetTaskUseCase(task_repository),
+            delete_task_use_case=DeleteTaskUseCase(task_repository),
+            update_task_use_case=UpdateTaskUseCase(task_repository),
+            register_tasks_bulk_use_case=RegisterTasksBulkUseCase(
+                task_repository, max_items=self.settings.TASKS_BULK_MAX_ITEMS
+            ),
+            update_tasks_state_use_case=UpdateTasksStateUseCase(
+                task_repository, max_items=self.settings.TASKS_BULK_MAX_ITEMS
+            ),
+            export_tasks_use_case=self.export_tasks_use_case,
+            import_tasks_use_case=ImportTasksUseCase(
+                task_repository,
+                chunk_size=self.settings.TASKS_IMPORT_CHUNK_SIZE,
+                max_rejections=self.settings.TASKS_IMPORT_MAX_REJECTED,
+            ),
+            search_tasks_use_case=SearchTasksUseCase(
+                PostgresTaskSearch(session)
+            ),
+            get_task_stats_use_case=GetTaskStatsUseCase(task_repository),
+            fast_json=self.settings.FAST_JSON_RESPONSES,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "task_cache": {
+                "local": self.local_task_cache.stats(),
+                "shared": (
+                    self.shared_task_cache.stats()
+                    if self.shared_task_cache else None
+                ),
+            },
+        }
+
+    def _build_shared_task_cache(self) -> Optional[TaskCachePort]:
+        if self.settings.TASK_CACHE_SHARED_BACKEND == "memory":
+            return InMemoryTaskCache()
+        return None
@@ -1,108 +1,51 @@
-from typing import Annotated
-from fastapi import Depends
+from typing import Annotated, Optional
+from fastapi import Depends, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.container import AppContainer, get_container
 from app.core.database import get_async_session
-from app.task.application import (
-    RegisterTaskUseCase,
-    GetAllTasksUseCase,
-    GetTaskUseCase,
-    DeleteTaskUseCase,
-    UpdateTaskUseCase,
-)
-from app.task.infrastructure.repositories import (
-    TaskRepository
-)
 from app.task.infrastructure.presentation.controllers import (
     TaskController
 )
+from app.task.infrastructure.presentation.conditional_requests import (
+    ReadPreconditions,
+    WritePreconditions,
+)
 
 # ============================================================================
-# Service Dependencies
+# Controller Dependencies
 # ============================================================================
 
 
-async def get_task_repository(
+async def get_task_controller(
     session: Annotated[AsyncSession, Depends(get_async_session)],
-) -> TaskRepository:
-    """Get TaskRepository instance."""
-    return TaskRepository(session)
+    container: Annotated[AppContainer, Depends(get_container)],
+) -> TaskController:
+    """
+    Create task controller bound to the request session.
+    Everything else comes from the application container.
+    """
+    return container.task.task_controller(session)
 
 
 # ============================================================================
-# Service Dependencies
+# Conditional Request Dependencies
 # ============================================================================
 
 
-async def get_register_task_use_case(
-    task_repository: Annotated[
-        TaskRepository, Depends(get_task_repository)
-    ]
-) -> RegisterTaskUseCase:
-    return RegisterTaskUseCase(task_repository)
-
-
-async def get_get_all_tasks_use_case(
-    task_repository: Annotated[
-        TaskRepository, Depends(get_task_repository)
-    ]
-) -> GetAllTasksUseCase:
-    return GetAllTasksUseCase(task_repository)
-
-
-async def get_get_task_use_case(
-    task_repository: Annotated[
-        TaskRepository, Depends(get_task_repository)
-    ]
-) -> GetTaskUseCase:
-    return GetTaskUseCase(task_repository)
-
-
-async def get_delete_task_use_case(
-    task_repository: Annotated[
-        TaskRepository, Depends(get_task_repository)
-    ]
-) -> DeleteTaskUseCase:
-    return DeleteTaskUseCase(task_repository)
-
-
-async def get_update_task_use_case(
-    task_repository: Annotated[
-        TaskRepository, Depends(get_task_repository)
-    ]
-) -> UpdateTaskUseCase:
-    return UpdateTaskUseCase(task_repository)
-
-
-# ============================================================================
-# Controller Dependencies
-# ============================================================================
+async def get_read_preconditions(
+    if_none_match: Annotated[Optional[str], Header()] = None,
+    if_modified_since: Annotated[Optional[str], Header()] = None,
+) -> ReadPreconditions:
+    """Validators a client sent to revalidate its copy of a resource."""
+    return ReadPreconditions(
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since,
+    )
 
 
-async def get_task_controller(
-    register_task_use_case: Annotated[
-        RegisterTaskUseCase, Depends(get_register_task_use_case)
-    ],
-    get_all_tasks_use_case: Annotated[
-        GetAllTasksUseCase, Depends(get_get_all_tasks_use_case)
-    ],
-    get_task_use_case: Annotated[
-        GetTaskUseCase, Depends(get_get_task_use_case)
-    ],
-    delete_task_use_case: Annotated[
-        DeleteTaskUseCase, Depends(get_delete_task_use_case)
-    ],
-    update_task_use_case: Annotated[
-        UpdateTaskUseCase, Depends(get_update_task_use_case)
-    ]
-) -> TaskController:
-    """
-    Create auth controller with all dependencies.
-    """
-    return TaskController(
-        register_task_use_case=register_task_use_case,
-        get_all_tasks_use_case=get_all_tasks_use_case,
-        get_task_use_case=get_task_use_case,
-        delete_task_use_case=delete_task_use_case,
-        update_task_use_case=update_task_use_case
-    )
+async def get_write_preconditions(
+    if_match: Annotated[Optional[str], Header()] = None,
+) -> WritePreconditions:
+    """ETags a client expects a resource to still have before writing it."""
+    return WritePreconditions(if_match=if_match)
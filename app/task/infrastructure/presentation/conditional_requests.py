@@ -0,0 +1,135 @@
+"""
+Conditional Requests
+ETag and Last-Modified validators for task responses, and evaluation of
+If-None-Match / If-Modified-Since on GET and If-Match on writes
+(RFC 9110, section 13).
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Response, status
+
+from app.task.domain.entities import TaskStamp, TaskStampPage
+
+# Responses belong to one user: clients may store them but must
+# revalidate before reuse, which is what the validators are for.
+CACHE_CONTROL = "private, no-cache"
+
+
+def task_etag(stamp: TaskStamp) -> str:
+    """Strong ETag of one task: changes with every write to it."""
+    digest = hashlib.blake2b(digest_size=16)
+    _add_stamp(digest, stamp)
+    return f'"{digest.hexdigest()}"'
+
+
+def page_etag(page: TaskStampPage) -> str:
+    """
+    Strong ETag of a page of tasks: changes when a task in the page is
+    modified, when tasks enter, leave or move within it, and when a next
+    page appears or disappears.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for stamp in page.stamps:
+        _add_stamp(digest, stamp)
+    digest.update(b"+" if page.has_more else b".")
+    return f'"{digest.hexdigest()}"'
+
+
+def validator_headers(
+    etag: str, last_modified: Optional[datetime] = None
+) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            _utc(last_modified), usegmt=True
+        )
+    return headers
+
+
+def not_modified_response(
+    etag: str, last_modified: Optional[datetime] = None
+) -> Response:
+    """304 carrying the same validators a 200 would have."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=validator_headers(etag, last_modified),
+    )
+
+
+@dataclass(frozen=True)
+class ReadPreconditions:
+    """If-None-Match and If-Modified-Since headers of a GET, as sent."""
+    if_none_match: Optional[str] = None
+    if_modified_since: Optional[str] = None
+
+    @property
+    def present(self) -> bool:
+        return self.if_none_match is not None or self.if_modified_since is not None
+
+    def not_modified(
+        self, etag: str, last_modified: Optional[datetime] = None
+    ) -> bool:
+        """
+        Whether the client's copy is current. If-None-Match decides when
+        sent (weak comparison, so W/ tags match too); otherwise
+        If-Modified-Since is compared with last_modified at the one-second
+        precision of HTTP dates. An unparseable date is ignored.
+        """
+        if self.if_none_match is not None:
+            tags = {tag.strip() for tag in self.if_none_match.split(",")}
+            if "*" in tags:
+                return True
+            return etag in {tag.removeprefix("W/") for tag in tags}
+
+        if self.if_modified_since is None or last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(self.if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return _utc(last_modified).replace(microsecond=0) <= _utc(since)
+
+
+@dataclass(frozen=True)
+class WritePreconditions:
+    """If-Match header of a write, as sent."""
+    if_match: Optional[str] = None
+
+    @property
+    def present(self) -> bool:
+        return self.if_match is not None
+
+    def matches(self, etag: str) -> bool:
+        """
+        Whether the client's copy is the current one, so the write may
+        go ahead. Strong comparison: a W/ tag never matches.
+        """
+        if self.if_match is None or self.any_version:
+            return True
+        return etag in self._tags()
+
+    @property
+    def any_version(self) -> bool:
+        """If-Match: * only requires the resource to exist."""
+        return self.if_match is not None and "*" in self._tags()
+
+    def _tags(self) -> set:
+        return {tag.strip() for tag in self.if_match.split(",")}
+
+
+def _add_stamp(digest, stamp: TaskStamp) -> None:
+    digest.update(stamp.id.value.bytes)
+    digest.update(_utc(stamp.updated_at).isoformat().encode())
+    digest.update(stamp.version.to_bytes(8, "big"))
+
+
+def _utc(value: datetime) -> datetime:
+    """Naive datetimes are taken as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
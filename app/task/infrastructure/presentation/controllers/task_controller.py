@@ -3,16 +3,35 @@ Authentication Controller
 Handles HTTP layer for authentication endpoints.
 """
 
-from fastapi import HTTPException, status
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Union,
+)
+from fastapi import HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 import logging
 
+from app.common.value_objects import EntityId
 from app.core.decorators.exception_routes_handlers import handle_api_exceptions
 from app.task.application import (
     RegisterTaskUseCase,
     GetAllTasksUseCase,
     GetTaskUseCase,
     DeleteTaskUseCase,
-    UpdateTaskUseCase
+    UpdateTaskUseCase,
+    RegisterTasksBulkUseCase,
+    BulkTaskResult,
+    UpdateTasksStateUseCase,
+    ExportTasksUseCase,
+    ImportTasksUseCase,
+    ImportRejection,
+    SearchTasksUseCase,
+    GetTaskStatsUseCase,
 )
 from app.task.infrastructure.presentation.dtos import (
     RegisterTaskResponse,
@@ -22,7 +41,33 @@ from app.task.infrastructure.presentation.dtos import (
     GetTaskResponse,
     DeleteTaskResponse,
     UpdateTaskRequest,
-    UpdateTaskResponse
+    UpdateTaskResponse,
+    RegisterTasksBulkRequest,
+    RegisterTasksBulkResponse,
+    BulkTaskItemResponse,
+    UpdateTasksStateRequest,
+    UpdateTasksStateResponse,
+    ImportRejectedRowResponse,
+    ImportTasksResponse,
+    TaskSearchResultResponse,
+    SearchTasksResponse,
+    TaskStatsResponse,
+)
+from app.task.domain.entities import Task, TaskStamp, TaskStampPage
+from app.task.domain.exceptions import TaskVersionConflictException
+from app.task.infrastructure.presentation.conditional_requests import (
+    ReadPreconditions,
+    WritePreconditions,
+    not_modified_response,
+    page_etag,
+    task_etag,
+    validator_headers,
+)
+from app.task.infrastructure.presentation.parsers import IMPORT_PARSERS
+from app.task.infrastructure.presentation.serializers import (
+    EXPORT_ENCODERS,
+    EXPORT_MEDIA_TYPES,
+    render_tasks_page,
 )
 
 logger = logging.getLogger(__name__)
@@ -37,17 +82,32 @@ class TaskController:
         get_all_tasks_use_case: GetAllTasksUseCase,
         get_task_use_case: GetTaskUseCase,
         delete_task_use_case: DeleteTaskUseCase,
-        update_task_use_case: UpdateTaskUseCase
+        update_task_use_case: UpdateTaskUseCase,
+        register_tasks_bulk_use_case: RegisterTasksBulkUseCase,
+        update_tasks_state_use_case: UpdateTasksStateUseCase,
+        export_tasks_use_case: ExportTasksUseCase,
+        import_tasks_use_case: ImportTasksUseCase,
+        search_tasks_use_case: SearchTasksUseCase,
+        get_task_stats_use_case: GetTaskStatsUseCase,
+        fast_json: bool = False
     ):
         self.register_task_use_case = register_task_use_case
         self.get_all_tasks_use_case = get_all_tasks_use_case
         self.get_task_use_case = get_task_use_case
         self.delete_task_use_case = delete_task_use_case
         self.update_task_use_case = update_task_use_case
+        self.register_tasks_bulk_use_case = register_tasks_bulk_use_case
+        self.update_tasks_state_use_case = update_tasks_state_use_case
+        self.export_tasks_use_case = export_tasks_use_case
+        self.import_tasks_use_case = import_tasks_use_case
+        self.search_tasks_use_case = search_tasks_use_case
+        self.get_task_stats_use_case = get_task_stats_use_case
+        self.fast_json = fast_json
 
     @handle_api_exceptions
     async def register(
         self,
+        owner_id: EntityId,
         request: RegisterTaskRequest,
     ) -> RegisterTaskResponse:
         """
@@ -55,7 +115,7 @@ class TaskController:
         """
         logger.info("Task registration request")
         # Execute use case
-        task = await self.register_task_use_case.execute({
+        task = await self.register_task_use_case.execute(owner_id, {
             "title": request.title,
             "description": request.description,
         })
@@ -66,35 +126,213 @@ class TaskController:
             task=self._task_to_response(task),
         )
 
+    @handle_api_exceptions
+    async def register_bulk(
+        self,
+        owner_id: EntityId,
+        request: RegisterTasksBulkRequest,
+    ) -> RegisterTasksBulkResponse:
+        """
+        Register many tasks at once.
+        """
+        logger.info(f"Bulk task registration request ({len(request.tasks)} items)")
+        # Execute use case
+        results = await self.register_tasks_bulk_use_case.execute(owner_id, [
+            {"title": item.title, "description": item.description}
+            for item in request.tasks
+        ])
+
+        # Convert to response
+        items = [self._bulk_result_to_response(result) for result in results]
+        created = sum(1 for item in items if item.status == "created")
+        return RegisterTasksBulkResponse(
+            message="Bulk registration processed.",
+            created=created,
+            failed=len(items) - created,
+            results=items,
+        )
+
     @handle_api_exceptions
     async def get_all(
-        self
-    ) -> GetAllTasksResponse:
+        self,
+        owner_id: EntityId,
+        limit: int,
+        cursor: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        response: Optional[Response] = None,
+        preconditions: Optional[ReadPreconditions] = None
+    ) -> Union[GetAllTasksResponse, Response]:
         """
-        Get all task.
+        Get a page of tasks, filtered and sorted.
+        304 if the client's ETag still matches the page.
         """
         logger.info("Tasks retrieved request")
+
+        # A page has no Last-Modified (a task leaving it would not move the
+        # newest updated_at), so only If-None-Match can make it a 304
+        if preconditions and preconditions.if_none_match is not None:
+            # (id, updated_at) read of the same page
+            stamps = await self.get_all_tasks_use_case.execute_page_stamps(
+                owner_id, limit, cursor, filters
+            )
+            etag = page_etag(stamps)
+            if preconditions.not_modified(etag):
+                return not_modified_response(etag)
+
         # Execute use case
-        tasks = await self.get_all_tasks_use_case.execute()
+        page = await self.get_all_tasks_use_case.execute_page(
+            owner_id, limit, cursor, filters
+        )
+        next_cursor = page.next_cursor.encode() if page.next_cursor else None
+        headers = validator_headers(page_etag(TaskStampPage.of(page)))
+
+        if self.fast_json:
+            # Already-serialized body: FastAPI skips response_model validation
+            return Response(
+                content=render_tasks_page(
+                    "Tasks retrieved successfully", page.tasks, next_cursor
+                ),
+                media_type="application/json",
+                headers=headers,
+            )
+
+        if response is not None:
+            response.headers.update(headers)
 
         # Convert to response
         return GetAllTasksResponse(
             message="Tasks retrieved successfully",
-            tasks=[self._task_to_response(task) for task in tasks],
+            tasks=[self._task_to_response(task) for task in page.tasks],
+            next_cursor=next_cursor,
+        )
+
+    @handle_api_exceptions
+    async def search(
+        self,
+        owner_id: EntityId,
+        text: str,
+        limit: int,
+        offset: int = 0
+    ) -> SearchTasksResponse:
+        """
+        Search tasks by title and description, most relevant first.
+        """
+        logger.info("Tasks search request")
+        # Execute use case
+        page = await self.search_tasks_use_case.execute(
+            owner_id, text, limit, offset
+        )
+
+        # Convert to response
+        return SearchTasksResponse(
+            message="Tasks search completed.",
+            tasks=[
+                TaskSearchResultResponse(
+                    **self._task_to_response(hit.task).model_dump(),
+                    rank=hit.rank,
+                )
+                for hit in page.hits
+            ],
+            next_offset=page.next_offset,
+        )
+
+    @handle_api_exceptions
+    async def stats(
+        self,
+        owner_id: EntityId
+    ) -> TaskStatsResponse:
+        """
+        Get the number of tasks in each state.
+        """
+        logger.info("Task stats request")
+        # Execute use case
+        stats = await self.get_task_stats_use_case.execute(owner_id)
+
+        # Convert to response
+        return TaskStatsResponse(
+            message="Task stats retrieved successfully.",
+            total=stats.total,
+            states=stats.by_state,
+        )
+
+    @handle_api_exceptions
+    async def export_tasks(
+        self,
+        owner_id: EntityId,
+        export_format: str
+    ) -> StreamingResponse:
+        """
+        Stream every task of the user as NDJSON or CSV.
+        """
+        logger.info(f"Tasks export request (format={export_format})")
+
+        encoder = EXPORT_ENCODERS[export_format]
+        return StreamingResponse(
+            encoder(
+                self.export_tasks_use_case.execute(owner_id),
+                self.export_tasks_use_case.fetch_size,
+            ),
+            media_type=EXPORT_MEDIA_TYPES[export_format],
+            headers={
+                "Content-Disposition": (
+                    f'attachment; filename="tasks.{export_format}"'
+                ),
+            },
+        )
+
+    @handle_api_exceptions
+    async def import_tasks(
+        self,
+        owner_id: EntityId,
+        import_format: str,
+        body: AsyncIterator[bytes]
+    ) -> ImportTasksResponse:
+        """
+        Import tasks from an NDJSON or CSV body, parsed as it arrives.
+        """
+        logger.info(f"Tasks import request (format={import_format})")
+
+        parser = IMPORT_PARSERS[import_format]
+        result = await self.import_tasks_use_case.execute(
+            owner_id, parser(body)
+        )
+
+        return ImportTasksResponse(
+            message="Tasks import processed.",
+            imported=result.imported,
+            rejected=result.rejected,
+            rejected_rows=[
+                self._rejection_to_response(rejection)
+                for rejection in result.rejections
+            ],
         )
 
     @handle_api_exceptions
     async def get_task(
         self,
-        task_id: str
-    ) -> GetTaskResponse:
+        owner_id: EntityId,
+        task_id: str,
+        response: Optional[Response] = None,
+        preconditions: Optional[ReadPreconditions] = None
+    ) -> Union[GetTaskResponse, Response]:
         """
         Get task by ID.
+        304 if the client's ETag or Last-Modified is still current.
         """
         logger.info(f"Task retrieve request for id: {task_id}")
 
+        if preconditions and preconditions.present:
+            # (id, updated_at, version) lookup before loading the task
+            stamp = await self.get_task_use_case.execute_stamp(
+                owner_id, task_id
+            )
+            if stamp:
+                etag = task_etag(stamp)
+                if preconditions.not_modified(etag, stamp.updated_at):
+                    return not_modified_response(etag, stamp.updated_at)
+
         # Execute use case
-        task = await self.get_task_use_case.execute(task_id)
+        task = await self.get_task_use_case.execute(owner_id, task_id)
 
         if not task:
             raise HTTPException(
@@ -102,6 +340,11 @@ class TaskController:
                 detail=f"Task with id {task_id} not found"
             )
 
+        if response is not None:
+            response.headers.update(
+                validator_headers(task_etag(TaskStamp.of(task)), task.updated_at)
+            )
+
         # Convert to response
         return GetTaskResponse(
             message="Task retrieved successfully",
@@ -111,13 +354,69 @@ class TaskController:
     @handle_api_exceptions
     async def update_task(
         self,
+        owner_id: EntityId,
         task_id: str,
         request: UpdateTaskRequest,
+        response: Optional[Response] = None,
+        preconditions: Optional[WritePreconditions] = None
     ) -> UpdateTaskResponse:
         """
         Update task by ID.
+        412 if If-Match no longer matches the task, or the task changes
+        between that check and the write.
         """
         logger.info(f"Task update by id: {task_id}")
+        return await self._write_task(
+            owner_id, task_id, request, response, preconditions,
+            self.update_task_use_case.execute,
+        )
+
+    @handle_api_exceptions
+    async def patch_task(
+        self,
+        owner_id: EntityId,
+        task_id: str,
+        request: UpdateTaskRequest,
+        response: Optional[Response] = None,
+        preconditions: Optional[WritePreconditions] = None
+    ) -> UpdateTaskResponse:
+        """
+        Partially update task by ID, writing only if a value changes.
+        Same preconditions as update_task.
+        """
+        logger.info(f"Task patch by id: {task_id}")
+        return await self._write_task(
+            owner_id, task_id, request, response, preconditions,
+            self.update_task_use_case.execute_patch,
+        )
+
+    async def _write_task(
+        self,
+        owner_id: EntityId,
+        task_id: str,
+        request: UpdateTaskRequest,
+        response: Optional[Response],
+        preconditions: Optional[WritePreconditions],
+        execute: Callable[..., Awaitable[Optional[Task]]]
+    ) -> UpdateTaskResponse:
+        expected_version = None
+        if preconditions and preconditions.present:
+            # Lookup of the version the client's ETag refers to
+            stamp = await self.get_task_use_case.execute_stamp(
+                owner_id, task_id
+            )
+            if not stamp:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Task with id {task_id} not found"
+                )
+            if not preconditions.matches(task_etag(stamp)):
+                raise HTTPException(
+                    status_code=status.HTTP_412_PRECONDITION_FAILED,
+                    detail=f"Task with id {task_id} does not match If-Match"
+                )
+            if not preconditions.any_version:
+                expected_version = stamp.version
 
         # Prepare data dict from request
         data = {}
@@ -129,7 +428,15 @@ class TaskController:
             data["state"] = request.state
 
         # Execute use case
-        task_updated = await self.update_task_use_case.execute(task_id, data)
+        try:
+            task_updated = await execute(
+                owner_id, task_id, data, expected_version
+            )
+        except TaskVersionConflictException as e:
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail=e.message
+            )
 
         if not task_updated:
             raise HTTPException(
@@ -137,15 +444,45 @@ class TaskController:
                 detail=f"Task with id {task_id} not found"
             )
 
+        if response is not None:
+            response.headers.update(validator_headers(
+                task_etag(TaskStamp.of(task_updated)), task_updated.updated_at
+            ))
+
         # Convert to response
         return UpdateTaskResponse(
             message="Task updated successfully.",
             task=self._task_to_response(task_updated),
         )
 
+    @handle_api_exceptions
+    async def update_tasks_state(
+        self,
+        owner_id: EntityId,
+        request: UpdateTasksStateRequest,
+    ) -> UpdateTasksStateResponse:
+        """
+        Set the state of many tasks.
+        """
+        logger.info(f"Tasks state update request ({len(request.ids)} ids)")
+
+        # Execute use case
+        result = await self.update_tasks_state_use_case.execute(
+            owner_id, request.ids, request.state
+        )
+
+        # Convert to response
+        return UpdateTasksStateResponse(
+            message="Tasks state updated.",
+            state=result.state.value,
+            updated=[str(task_id) for task_id in result.updated_ids],
+            not_found=[str(task_id) for task_id in result.not_found_ids],
+        )
+
     @handle_api_exceptions
     async def delete_task(
         self,
+        owner_id: EntityId,
         task_id: str
     ) -> DeleteTaskResponse:
         """
@@ -154,7 +491,7 @@ class TaskController:
         logger.info(f"Task deleting by id: {task_id}")
 
         # Execute use case
-        task_deleted = await self.delete_task_use_case.execute(task_id)
+        task_deleted = await self.delete_task_use_case.execute(owner_id, task_id)
 
         if not task_deleted:
             raise HTTPException(
@@ -168,6 +505,31 @@ class TaskController:
             task_id=task_id,
         )
 
+    @classmethod
+    def _bulk_result_to_response(
+        cls, result: BulkTaskResult
+    ) -> BulkTaskItemResponse:
+        if result.error:
+            return BulkTaskItemResponse(
+                index=result.index,
+                status="error",
+                error=result.error.to_dict()["error"],
+            )
+        return BulkTaskItemResponse(
+            index=result.index,
+            status="created",
+            task=cls._task_to_response(result.task),
+        )
+
+    @staticmethod
+    def _rejection_to_response(
+        rejection: ImportRejection
+    ) -> ImportRejectedRowResponse:
+        return ImportRejectedRowResponse(
+            row=rejection.row,
+            error=rejection.error.to_dict()["error"],
+        )
+
     @staticmethod
     def _task_to_response(task) -> TaskResponse:
         return TaskResponse(
@@ -1,13 +1,43 @@
-from .task_request_dto import RegisterTaskRequest, UpdateTaskRequest
-from .task_response_dto import RegisterTaskResponse, TaskResponse, GetAllTasksResponse, GetTaskResponse, DeleteTaskResponse, UpdateTaskResponse
+from .task_request_dto import (
+    RegisterTaskRequest,
+    RegisterTasksBulkRequest,
+    UpdateTaskRequest,
+    UpdateTasksStateRequest,
+)
+from .task_response_dto import (
+    RegisterTaskResponse,
+    TaskResponse,
+    GetAllTasksResponse,
+    GetTaskResponse,
+    DeleteTaskResponse,
+    UpdateTaskResponse,
+    BulkTaskItemResponse,
+    RegisterTasksBulkResponse,
+    UpdateTasksStateResponse,
+    ImportRejectedRowResponse,
+    ImportTasksResponse,
+    TaskSearchResultResponse,
+    SearchTasksResponse,
+    TaskStatsResponse,
+)
 
 __all__ = [
     "RegisterTaskRequest",
+    "RegisterTasksBulkRequest",
     "UpdateTaskRequest",
     "RegisterTaskResponse",
     "TaskResponse",
     "GetAllTasksResponse",
     "GetTaskResponse",
     "DeleteTaskResponse",
-    "UpdateTaskResponse"
+    "UpdateTaskResponse",
+    "BulkTaskItemResponse",
+    "RegisterTasksBulkResponse",
+    "UpdateTasksStateRequest",
+    "UpdateTasksStateResponse",
+    "ImportRejectedRowResponse",
+    "ImportTasksResponse",
+    "TaskSearchResultResponse",
+    "SearchTasksResponse",
+    "TaskStatsResponse",
 ]
@@ -1,6 +1,10 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
+from app.core.config import get_settings
+
+settings = get_settings()
+
 
 class RegisterTaskRequest(BaseModel):
     """Request for task registration."""
@@ -20,6 +24,34 @@ class RegisterTaskRequest(BaseModel):
         }
 
 
+class RegisterTasksBulkRequest(BaseModel):
+    """Request for bulk task registration."""
+
+    # Oversized batches are rejected before their items are validated
+    tasks: List[RegisterTaskRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.TASKS_BULK_MAX_ITEMS,
+        description="tasks to register",
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "tasks": [
+                    {
+                        "title": "first title",
+                        "description": "This is the first description"
+                    },
+                    {
+                        "title": "second title",
+                        "description": "This is the second description"
+                    }
+                ]
+            }
+        }
+
+
 class UpdateTaskRequest(BaseModel):
     """Request for task update."""
 
@@ -35,3 +67,21 @@ class UpdateTaskRequest(BaseModel):
                 "state": "completed"
             }
         }
+
+
+class UpdateTasksStateRequest(BaseModel):
+    """Request for changing the state of many tasks."""
+
+    ids: List[str] = Field(..., min_length=1, description="task ids")
+    state: str = Field(..., description="target state (pending, completed)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "ids": [
+                    "123e4567-e89b-12d3-a456-426614174000",
+                    "987fcdeb-51a2-43d7-9abc-123456789def"
+                ],
+                "state": "completed"
+            }
+        }
@@ -1,3 +1,4 @@
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 from uuid import UUID
 
@@ -42,11 +43,68 @@ class RegisterTaskResponse(BaseModel):
         }
 
 
+class BulkTaskItemResponse(BaseModel):
+    """Result of one item in a bulk registration."""
+
+    index: int = Field(..., description="Position of the item in the request")
+    status: str = Field(..., description="created or error")
+    task: Optional[TaskResponse] = Field(None, description="Created task")
+    error: Optional[Dict[str, Any]] = Field(
+        None, description="Validation error for rejected items"
+    )
+
+
+class RegisterTasksBulkResponse(BaseModel):
+    """Bulk registration response."""
+
+    message: str = Field(..., description="Success message")
+    created: int = Field(..., description="Number of tasks created")
+    failed: int = Field(..., description="Number of items rejected")
+    results: List[BulkTaskItemResponse] = Field(
+        ..., description="Per-item results in request order"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "message": "Bulk registration processed.",
+                "created": 1,
+                "failed": 1,
+                "results": [
+                    {
+                        "index": 0,
+                        "status": "created",
+                        "task": {
+                            "id": "123e4567-e89b-12d3-a456-426614174000",
+                            "title": "first title",
+                            "description": "This is the first description",
+                            "state": "pending"
+                        },
+                        "error": None
+                    },
+                    {
+                        "index": 1,
+                        "status": "error",
+                        "task": None,
+                        "error": {
+                            "code": "REQUIRED_FIELD",
+                            "message": "El campo de título es requerido.",
+                            "details": "El campo de título no puede ser nulo o vacío."
+                        }
+                    }
+                ],
+            }
+        }
+
+
 class GetAllTasksResponse(BaseModel):
     """Get all tasks response."""
 
     message: str = Field(..., description="Success message")
     tasks: list[TaskResponse] = Field(..., description="List of tasks")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, null on the last page"
+    )
 
     class Config:
         json_schema_extra = {
@@ -60,6 +118,7 @@ class GetAllTasksResponse(BaseModel):
                         "state": "pending"
                     }
                 ],
+                "next_cursor": "eyJjIjoiMjAyNS0wMS0wMVQwMDowMDowMCIsImkiOiIxMjMifQ",
             }
         }
 
@@ -117,3 +176,113 @@ class UpdateTaskResponse(BaseModel):
                 },
             }
         }
+
+
+class UpdateTasksStateResponse(BaseModel):
+    """Bulk state update response."""
+
+    message: str = Field(..., description="Success message")
+    state: str = Field(..., description="State applied")
+    updated: List[str] = Field(..., description="Task ids updated")
+    not_found: List[str] = Field(..., description="Task ids that do not exist")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "message": "Tasks state updated.",
+                "state": "completed",
+                "updated": ["123e4567-e89b-12d3-a456-426614174000"],
+                "not_found": ["987fcdeb-51a2-43d7-9abc-123456789def"],
+            }
+        }
+
+
+class ImportRejectedRowResponse(BaseModel):
+    """One row rejected by an import."""
+
+    row: int = Field(..., description="1-based position of the row in the body")
+    error: Dict[str, Any] = Field(..., description="Validation error")
+
+
+class ImportTasksResponse(BaseModel):
+    """Task import response."""
+
+    message: str = Field(..., description="Success message")
+    imported: int = Field(..., description="Number of tasks imported")
+    rejected: int = Field(..., description="Number of rows rejected")
+    rejected_rows: List[ImportRejectedRowResponse] = Field(
+        ..., description="First rejected rows, capped at TASKS_IMPORT_MAX_REJECTED"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "message": "Tasks import processed.",
+                "imported": 2,
+                "rejected": 1,
+                "rejected_rows": [
+                    {
+                        "row": 2,
+                        "error": {
+                            "code": "REQUIRED_FIELD",
+                            "message": "El campo de título es requerido.",
+                            "details": "El campo de título no puede ser nulo o vacío."
+                        }
+                    }
+                ],
+            }
+        }
+
+
+class TaskSearchResultResponse(TaskResponse):
+    """Task matched by a search, with its relevance."""
+
+    rank: float = Field(..., description="Relevance, higher first")
+
+
+class SearchTasksResponse(BaseModel):
+    """Task search response."""
+
+    message: str = Field(..., description="Success message")
+    tasks: List[TaskSearchResultResponse] = Field(
+        ..., description="Matching tasks, most relevant first"
+    )
+    next_offset: Optional[int] = Field(
+        None, description="Offset of the next page, null on the last page"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "message": "Tasks search completed.",
+                "tasks": [
+                    {
+                        "id": "123e4567-e89b-12d3-a456-426614174000",
+                        "title": "quarterly report",
+                        "description": "Send the report to finance",
+                        "state": "pending",
+                        "rank": 1.4
+                    }
+                ],
+                "next_offset": 20,
+            }
+        }
+
+
+class TaskStatsResponse(BaseModel):
+    """Task counts response."""
+
+    message: str = Field(..., description="Success message")
+    total: int = Field(..., description="Number of tasks")
+    states: Dict[str, int] = Field(
+        ..., description="Number of tasks in each state, every state listed"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "message": "Task stats retrieved successfully.",
+                "total": 12,
+                "states": {"pending": 5, "completed": 7},
+            }
+        }
@@ -0,0 +1,142 @@
+"""
+Task Parsers
+Incremental NDJSON/CSV parsers for the task import request body.
+"""
+
+import codecs
+import csv
+from typing import AsyncIterator, List
+
+import orjson
+
+from app.core.exceptions import DomainValidationException
+from app.task.application import ImportRow
+
+# Longest single row accepted; guards the line buffer against bodies
+# without line breaks.
+MAX_ROW_BYTES = 1024 * 1024
+
+IMPORT_COLUMNS = ("title", "description", "state")
+
+
+def _row_too_large() -> DomainValidationException:
+    return DomainValidationException(
+        message="Fila demasiado grande.",
+        detail=f"Cada fila puede ocupar como máximo {MAX_ROW_BYTES} bytes.",
+        code="ROW_TOO_LARGE"
+    )
+
+
+async def parse_ndjson_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportRow]:
+    """
+    Split a byte stream into NDJSON rows as it arrives. Blank lines are
+    skipped; lines that are not a JSON object are yielded as None.
+    """
+    buffer = b""
+    row_number = 0
+
+    def _rows(lines: List[bytes]):
+        nonlocal row_number
+        for line in lines:
+            if not line.strip():
+                continue
+            row_number += 1
+            try:
+                data = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                data = None
+            yield row_number, data if isinstance(data, dict) else None
+
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        if len(buffer) > MAX_ROW_BYTES:
+            raise _row_too_large()
+        for row in _rows(lines):
+            yield row
+
+    for row in _rows([buffer]):
+        yield row
+
+
+async def parse_csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportRow]:
+    """
+    Split a byte stream into CSV rows as it arrives. The first record is
+    the header and must name a title column; rows whose field count does
+    not match the header are yielded as None.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    text = ""
+    record = ""
+    header = None
+    row_number = 0
+
+    def _complete_records(lines: List[str]):
+        # A quoted field may span lines: a record is complete once its
+        # quotes are balanced ("" escapes keep the count even).
+        nonlocal record
+        for line in lines:
+            record += line
+            if record.count('"') % 2 == 0:
+                complete, record = record, ""
+                yield complete
+        if len(record) > MAX_ROW_BYTES:
+            raise _row_too_large()
+
+    def _rows(records):
+        nonlocal header, row_number
+        for raw in records:
+            if not raw.strip():
+                continue
+            try:
+                values = next(csv.reader([raw]))
+            except csv.Error:
+                values = None
+
+            if header is None:
+                header = [name.strip().lower() for name in values or []]
+                if "title" not in header:
+                    raise DomainValidationException(
+                        message="Cabecera CSV inválida.",
+                        detail=(
+                            "La primera fila debe nombrar las columnas "
+                            f"{', '.join(IMPORT_COLUMNS)}."
+                        ),
+                        code="INVALID_FORMAT"
+                    )
+                continue
+
+            row_number += 1
+            if values is None or len(values) != len(header):
+                yield row_number, None
+            else:
+                yield row_number, dict(zip(header, values))
+
+    try:
+        async for chunk in chunks:
+            text += decoder.decode(chunk)
+            *lines, text = text.split("\n")
+            if len(text) > MAX_ROW_BYTES:
+                raise _row_too_large()
+            for row in _rows(_complete_records([line + "\n" for line in lines])):
+                yield row
+
+        text += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as e:
+        raise DomainValidationException(
+            message="Codificación inválida.",
+            detail=f"El archivo CSV debe estar en UTF-8: {e.reason}",
+            code="INVALID_FORMAT"
+        )
+
+    for row in _rows(_complete_records([text] if text else [])):
+        yield row
+    if record:
+        row_number += 1
+        yield row_number, None
+
+
+IMPORT_PARSERS = {
+    "ndjson": parse_ndjson_rows,
+    "csv": parse_csv_rows,
+}
@@ -1,7 +1,9 @@
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, List, Optional
 
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from app.task.infrastructure.presentation.dtos import (
     RegisterTaskResponse,
     RegisterTaskRequest,
@@ -9,14 +11,33 @@ from app.task.infrastructure.presentation.dtos import (
     GetTaskResponse,
     DeleteTaskResponse,
     UpdateTaskResponse,
-    UpdateTaskRequest
+    UpdateTaskRequest,
+    RegisterTasksBulkRequest,
+    RegisterTasksBulkResponse,
+    UpdateTasksStateRequest,
+    UpdateTasksStateResponse,
+    ImportTasksResponse,
+    SearchTasksResponse,
+    TaskStatsResponse,
 )
 from app.task.infrastructure.presentation.controllers import (
     TaskController
 )
-from app.task.infrastructure.dependencies import get_task_controller
+from app.task.infrastructure.dependencies import (
+    get_read_preconditions,
+    get_task_controller,
+    get_write_preconditions,
+)
+from app.task.infrastructure.presentation.conditional_requests import (
+    ReadPreconditions,
+    WritePreconditions,
+)
 from app.auth.infrastructure.dependencies import get_current_user_id
 from app.common.value_objects import EntityId
+from app.core.config import get_settings
+from app.task.domain.value_objects import SORT_KEYS
+
+settings = get_settings()
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
@@ -41,7 +62,30 @@ async def register(
     """
     Register a new task.
     """
-    return await controller.register(request)
+    return await controller.register(current_user_id, request)
+
+
+@router.post(
+    "/bulk",
+    response_model=RegisterTasksBulkResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Register many tasks",
+    description="Register up to TASKS_BULK_MAX_ITEMS tasks in one transaction",
+    responses={
+        200: {"description": "Bulk registration processed, see per-item results"},
+        400: {"description": "Too many items"},
+        401: {"description": "Unauthorized"},
+    },
+)
+async def register_bulk(
+    request: RegisterTasksBulkRequest,
+    controller: Annotated[TaskController, Depends(get_task_controller)],
+    current_user_id: Annotated[EntityId, Depends(get_current_user_id)],
+) -> RegisterTasksBulkResponse:
+    """
+    Register many tasks at once.
+    """
+    return await controller.register_bulk(current_user_id, request)
 
 
 @router.get(
@@ -49,20 +93,214 @@ async def register(
     response_model=GetAllTasksResponse,
     status_code=status.HTTP_200_OK,
     summary="Get all tasks",
-    description="Retrieve all tasks",
+    description=(
+        "Retrieve your tasks, optionally filtered by state and by created/"
+        "updated date range, sorted by an allowed key and paginated with a "
+        "cursor. Sends an ETag; a request whose If-None-Match still "
+        "matches gets 304 without a body"
+    ),
     responses={
         200: {"description": "Tasks retrieved successfully"},
+        304: {"description": "Page unchanged since the ETag sent"},
+        400: {"description": "Invalid cursor, state, date range or sort"},
         401: {"description": "Unauthorized"},
     },
 )
 async def get_all(
+    response: Response,
     controller: Annotated[TaskController, Depends(get_task_controller)],
     current_user_id: Annotated[EntityId, Depends(get_current_user_id)],
+    preconditions: Annotated[
+        ReadPreconditions, Depends(get_read_preconditions)
+    ],
+    limit: Annotated[int, Query(
+        ge=1,
+        le=settings.TASKS_PAGE_MAX_SIZE,
+        description="Maximum number of tasks to return",
+    )] = settings.TASKS_PAGE_DEFAULT_SIZE,
+    cursor: Annotated[Optional[str], Query(
+        description="next_cursor value from the previous page",
+    )] = None,
+    state: Annotated[Optional[List[str]], Query(
+        description="Only tasks in these states (repeat the parameter)",
+    )] = None,
+    created_from: Annotated[Optional[datetime], Query(
+        description="Created at or after this instant",
+    )] = None,
+    created_to: Annotated[Optional[datetime], Query(
+        description="Created at or before this instant",
+    )] = None,
+    updated_from: Annotated[Optional[datetime], Query(
+        description="Updated at or after this instant",
+    )] = None,
+    updated_to: Annotated[Optional[datetime], Query(
+        description="Updated at or before this instant",
+    )] = None,
+    sort: Annotated[Optional[str], Query(
+        description=f"One of {', '.join(SORT_KEYS)}; '-' means descending",
+    )] = None,
 ) -> GetAllTasksResponse:
     """
-    Get all tasks.
+    Get a page of tasks.
+    """
+    filters = {
+        "states": state,
+        "created_from": created_from,
+        "created_to": created_to,
+        "updated_from": updated_from,
+        "updated_to": updated_to,
+        "sort": sort,
+    }
+    return await controller.get_all(
+        current_user_id, limit, cursor, filters, response, preconditions
+    )
+
+
+@router.get(
+    "/search",
+    response_model=SearchTasksResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Search tasks",
+    description=(
+        "Full-text search over your task titles and descriptions, tolerant "
+        "of typos in titles, most relevant first"
+    ),
+    responses={
+        200: {"description": "Search completed"},
+        400: {"description": "Empty search text"},
+        401: {"description": "Unauthorized"},
+    },
+)
+async def search_tasks(
+    controller: Annotated[TaskController, Depends(get_task_controller)],
+    current_user_id: Annotated[EntityId, Depends(get_current_user_id)],
+    q: Annotated[str, Query(
+        min_length=1,
+        max_length=200,
+        description="Words to look for; supports \"quoted phrases\", or, -word",
+    )],
+    limit: Annotated[int, Query(
+        ge=1,
+        le=settings.TASKS_PAGE_MAX_SIZE,
+        description="Maximum number of tasks to return",
+    )] = settings.TASKS_PAGE_DEFAULT_SIZE,
+    offset: Annotated[int, Query(
+        ge=0,
+        le=settings.TASKS_SEARCH_MAX_OFFSET,
+        description="next_offset value from the previous page",
+    )] = 0,
+) -> SearchTasksResponse:
+    """
+    Search tasks.
     """
-    return await controller.get_all()
+    return await controller.search(current_user_id, q, limit, offset)
+
+
+@router.get(
+    "/stats",
+    response_model=TaskStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get task stats",
+    description=(
+        "Number of your tasks in each state, read from counters kept up to "
+        "date on every task write"
+    ),
+    responses={
+        200: {"description": "Task stats retrieved successfully"},
+        401: {"description": "Unauthorized"},
+    },
+)
+async def get_stats(
+    controller: Annotated[TaskController, Depends(get_task_controller)],
+    current_user_id: Annotated[EntityId, Depends(get_current_user_id)],
+) -> TaskStatsResponse:
+    """
+    Get task stats.
+    """
+    return await controller.stats(current_user_id)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Export all tasks",
+    description="Stream every task you own as NDJSON or CSV through a server-side cursor",
+    responses={
+        200: {
+            "description": "Tasks streamed",
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+        },
+        401: {"description": "Unauthorized"},
+    },
+)
+async def export_tasks(
+    controller: Annotated[TaskController, Depends(get_task_controller)],
+    current_user_id: Annotated[EntityId, Depends(get_current_user_id)],
+    format: Annotated[str, Query(
+        pattern="^(ndjson|csv)$",
+        description="Export format",
+    )] = "ndjson",
+) -> StreamingResponse:
+    """
+    Export all tasks.
+    """
+    return await controller.export_tasks(current_user_id, format)
+
+
+@router.post(
+    "/import",
+    response_model=ImportTasksResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Import tasks",
+    description=(
+        "Load tasks from an NDJSON or CSV body, parsed as a stream and "
+        "written with COPY in chunks of TASKS_IMPORT_CHUNK_SIZE"
+    ),
+    responses={
+        200: {"description": "Import processed, see counts and rejected rows"},
+        400: {"description": "Invalid CSV header, encoding or oversized row"},
+        401: {"description": "Unauthorized"},
+    },
+)
+async def import_tasks(
+    request: Request,
+    controller: Annotated[TaskController, Depends(get_task_controller)],
+    current_user_id: Annotated[EntityId, Depends(get_current_user_id)],
+    format: Annotated[str, Query(
+        pattern="^(ndjson|csv)$",
+        description="Body format",
+    )] = "ndjson",
+) -> ImportTasksResponse:
+    """
+    Import tasks.
+    """
+    return await controller.import_tasks(
+        current_user_id, format, request.stream()
+    )
+
+
+@router.patch(
+    "/state",
+    response_model=UpdateTasksStateResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Update the state of many tasks",
+    description="Set one state on a list of tasks with a single statement",
+    responses={
+        200: {"description": "State applied, unknown ids listed in not_found"},
+        400: {"description": "Invalid ids or state"},
+        401: {"description": "Unauthorized"},
+    },
+)
+async def update_tasks_state(
+    request: UpdateTasksStateRequest,
+    controller: Annotated[TaskController, Depends(get_task_controller)],
+    current_user_id: Annotated[EntityId, Depends(get_current_user_id)],
+) -> UpdateTasksStateResponse:
+    """
+    Update the state of many tasks.
+    """
+    return await controller.update_tasks_state(current_user_id, request)
 
 
 @router.get(
@@ -70,22 +308,33 @@ async def get_all(
     response_model=GetTaskResponse,
     status_code=status.HTTP_200_OK,
     summary="Get task by id",
-    description="Retrieve task by id",
+    description=(
+        "Retrieve task by id. Sends ETag and Last-Modified; a request whose "
+        "If-None-Match or If-Modified-Since is still current gets 304 "
+        "without a body"
+    ),
     responses={
         200: {"description": "Task retrieved successfully"},
+        304: {"description": "Task unchanged since the validator sent"},
         401: {"description": "Unauthorized"},
         404: {"description": "Task not found"},
     },
 )
 async def get_task(
     task_id: str,
+    response: Response,
     controller: Annotated[TaskController, Depends(get_task_controller)],
     current_user_id: Annotated[EntityId, Depends(get_current_user_id)],
+    preconditions: Annotated[
+        ReadPreconditions, Depends(get_read_preconditions)
+    ],
 ) -> GetTaskResponse:
     """
     Get task by id.
     """
-    return await controller.get_task(task_id)
+    return await controller.get_task(
+        current_user_id, task_id, response, preconditions
+    )
 
 
 @router.put(
@@ -93,23 +342,69 @@ async def get_task(
     response_model=UpdateTaskResponse,
     status_code=status.HTTP_200_OK,
     summary="Update task by id",
-    description="Update task by id",
+    description=(
+        "Update task by id. With If-Match set to the task's ETag the update "
+        "only applies if nobody changed the task since, otherwise 412"
+    ),
     responses={
         200: {"description": "Task Update successfully"},
         401: {"description": "Unauthorized"},
         404: {"description": "Task not found"},
+        412: {"description": "Task changed since the ETag in If-Match"},
     },
 )
 async def update_task(
     task_id: str,
     request: UpdateTaskRequest,
+    response: Response,
     controller: Annotated[TaskController, Depends(get_task_controller)],
     current_user_id: Annotated[EntityId, Depends(get_current_user_id)],
+    preconditions: Annotated[
+        WritePreconditions, Depends(get_write_preconditions)
+    ],
 ) -> UpdateTaskResponse:
     """
     Update task by id.
     """
-    return await controller.update_task(task_id, request)
+    return await controller.update_task(
+        current_user_id, task_id, request, response, preconditions
+    )
+
+
+@router.patch(
+    "/{task_id}",
+    response_model=UpdateTaskResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Partially update task by id",
+    description=(
+        "Update the fields sent; fields equal to the stored values are not "
+        "written and a request that changes nothing writes nothing. "
+        "Supports If-Match like PUT"
+    ),
+    responses={
+        200: {"description": "Task updated, or already up to date"},
+        400: {"description": "Invalid field values"},
+        401: {"description": "Unauthorized"},
+        404: {"description": "Task not found"},
+        412: {"description": "Task changed since the ETag in If-Match"},
+    },
+)
+async def patch_task(
+    task_id: str,
+    request: UpdateTaskRequest,
+    response: Response,
+    controller: Annotated[TaskController, Depends(get_task_controller)],
+    current_user_id: Annotated[EntityId, Depends(get_current_user_id)],
+    preconditions: Annotated[
+        WritePreconditions, Depends(get_write_preconditions)
+    ],
+) -> UpdateTaskResponse:
+    """
+    Partially update task by id.
+    """
+    return await controller.patch_task(
+        current_user_id, task_id, request, response, preconditions
+    )
 
 
 @router.delete(
@@ -132,4 +427,4 @@ async def delete_task(
     """
     Delete task by id.
     """
-    return await controller.delete_task(task_id)
+    return await controller.delete_task(current_user_id, task_id)
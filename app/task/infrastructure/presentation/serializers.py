@@ -0,0 +1,115 @@
+"""
+Task Serializers
+JSON serializers for the task list fast path and the task exports.
+"""
+
+import csv
+import io
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import orjson
+
+from app.task.domain.entities import Task
+
+
+def task_to_row(task: Task) -> Dict[str, Any]:
+    """
+    Map a task to the TaskResponse shape as a plain dict. The entity's
+    value objects already enforced every constraint, so no model is
+    built; orjson encodes the UUID natively.
+    """
+    return {
+        "id": task.id.value,
+        "title": task.title.value,
+        "description": task.description.value,
+        "state": task.state.value,
+    }
+
+
+def render_tasks_page(
+    message: str,
+    tasks: List[Task],
+    next_cursor: Optional[str] = None,
+) -> bytes:
+    """
+    Serialize a GetAllTasksResponse body straight to JSON bytes,
+    skipping TaskResponse construction, response_model validation and
+    jsonable_encoder.
+    """
+    return orjson.dumps({
+        "message": message,
+        "tasks": [task_to_row(task) for task in tasks],
+        "next_cursor": next_cursor,
+    })
+
+
+# =============================================================================
+# Export encoders
+# =============================================================================
+
+EXPORT_COLUMNS = ("id", "title", "description", "state", "created_at", "updated_at")
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def task_to_export_row(task: Task) -> Dict[str, Any]:
+    """Map a task to the flat row written by the exports."""
+    return {
+        **task_to_row(task),
+        "created_at": task.created_at,
+        "updated_at": task.updated_at,
+    }
+
+
+async def encode_tasks_ndjson(
+    tasks: AsyncIterator[Task], batch_size: int
+) -> AsyncIterator[bytes]:
+    """Encode tasks as NDJSON, one chunk per batch_size tasks."""
+    lines: List[bytes] = []
+    async for task in tasks:
+        lines.append(orjson.dumps(task_to_export_row(task)))
+        if len(lines) >= batch_size:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+async def encode_tasks_csv(
+    tasks: AsyncIterator[Task], batch_size: int
+) -> AsyncIterator[bytes]:
+    """Encode tasks as CSV with a header row, one chunk per batch_size tasks."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+
+    pending = 0
+    async for task in tasks:
+        writer.writerow((
+            task.id.value,
+            task.title.value,
+            task.description.value,
+            task.state.value,
+            task.created_at.isoformat(),
+            task.updated_at.isoformat(),
+        ))
+        pending += 1
+        if pending >= batch_size:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    # An empty export still flushes the header row
+    remainder = buffer.getvalue()
+    if remainder:
+        yield remainder.encode()
+
+
+EXPORT_ENCODERS = {
+    "ndjson": encode_tasks_ndjson,
+    "csv": encode_tasks_csv,
+}
@@ -1,5 +1,9 @@
 from .task_repository import TaskRepository
+from .cached_task_repository import CachedTaskRepository
+from .postgres_task_search import PostgresTaskSearch
 
 __all__ = [
-    "TaskRepository"
+    "TaskRepository",
+    "CachedTaskRepository",
+    "PostgresTaskSearch",
 ]
@@ -0,0 +1,208 @@
+"""
+Cached Task Repository
+Read-through caching decorator around a TaskRepositoryPort.
+"""
+
+from typing import AsyncIterator, List, Optional
+import logging
+
+from app.common.value_objects import EntityId
+from app.task.domain.entities import (
+    Task as DomainTask,
+    TaskPage,
+    TaskStamp,
+    TaskStampPage,
+    TaskStats,
+)
+from app.task.domain.ports import TaskCachePort, TaskRepositoryPort
+from app.task.domain.value_objects import (
+    PageCursor,
+    State,
+    TaskQuery,
+    TaskUpdate,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CachedTaskRepository(TaskRepositoryPort):
+    """
+    Serves get_task_by_id from a local LRU, then an optional shared cache,
+    then the wrapped repository. Every write path invalidates the tasks it
+    touched in both cache levels after the wrapped call returns.
+
+    Entries are keyed by task id alone; a cached task is only returned to
+    its owner, any other user gets None exactly as from the database.
+
+    A read races with writes: a row read just before a concurrent write
+    commits and is invalidated would otherwise be stored after it, and
+    served stale until it expires. Each level's invalidation generation
+    is read before the lookup and the store is skipped for a task
+    invalidated since.
+    """
+
+    def __init__(
+        self,
+        repository: TaskRepositoryPort,
+        local_cache: TaskCachePort,
+        shared_cache: Optional[TaskCachePort] = None,
+        local_ttl_seconds: float = 5,
+        shared_ttl_seconds: float = 300,
+    ):
+        self.repository = repository
+        self.local_cache = local_cache
+        self.shared_cache = shared_cache
+        self.local_ttl_seconds = local_ttl_seconds
+        self.shared_ttl_seconds = shared_ttl_seconds
+
+    async def get_task_by_id(
+        self, owner_id: EntityId, task_id: EntityId
+    ) -> Optional[DomainTask]:
+        task = await self.local_cache.get(task_id)
+        if task:
+            return self._owned(task, owner_id)
+
+        local_generation = await self.local_cache.generation()
+        shared_generation = None
+        if self.shared_cache:
+            shared_generation = await self.shared_cache.generation()
+            task = await self.shared_cache.get(task_id)
+            if task:
+                await self.local_cache.set(
+                    task, self.local_ttl_seconds, local_generation
+                )
+                return self._owned(task, owner_id)
+
+        task = await self.repository.get_task_by_id(owner_id, task_id)
+        if task:
+            await self._store(task, local_generation, shared_generation)
+        return task
+
+    async def get_all_tasks(self, owner_id: EntityId) -> List[DomainTask]:
+        return await self.repository.get_all_tasks(owner_id)
+
+    async def get_tasks_page(
+        self,
+        owner_id: EntityId,
+        limit: int,
+        cursor: Optional[PageCursor] = None,
+        query: Optional[TaskQuery] = None
+    ) -> TaskPage:
+        return await self.repository.get_tasks_page(
+            owner_id, limit, cursor, query
+        )
+
+    async def get_task_stamp(
+        self, owner_id: EntityId, task_id: EntityId
+    ) -> Optional[TaskStamp]:
+        # Always from the database: it is what tells whether a copy is stale
+        return await self.repository.get_task_stamp(owner_id, task_id)
+
+    async def get_tasks_page_stamps(
+        self,
+        owner_id: EntityId,
+        limit: int,
+        cursor: Optional[PageCursor] = None,
+        query: Optional[TaskQuery] = None
+    ) -> TaskStampPage:
+        return await self.repository.get_tasks_page_stamps(
+            owner_id, limit, cursor, query
+        )
+
+    def stream_tasks(
+        self, owner_id: EntityId, fetch_size: int
+    ) -> AsyncIterator[DomainTask]:
+        return self.repository.stream_tasks(owner_id, fetch_size)
+
+    async def create_task(self, task: DomainTask) -> DomainTask:
+        created_task = await self.repository.create_task(task)
+        await self._invalidate([created_task.id])
+        return created_task
+
+    async def create_tasks(self, tasks: List[DomainTask]) -> List[DomainTask]:
+        created_tasks = await self.repository.create_tasks(tasks)
+        await self._invalidate([task.id for task in created_tasks])
+        return created_tasks
+
+    async def copy_tasks(self, tasks: List[DomainTask]) -> int:
+        # Fresh ids only: nothing cached can be stale
+        return await self.repository.copy_tasks(tasks)
+
+    async def update_task(self, task: DomainTask) -> Optional[DomainTask]:
+        try:
+            return await self.repository.update_task(task)
+        finally:
+            await self._invalidate([task.id])
+
+    async def update_task_fields(
+        self,
+        owner_id: EntityId,
+        task_id: EntityId,
+        changes: TaskUpdate,
+        expected_version: Optional[int] = None
+    ) -> Optional[DomainTask]:
+        try:
+            return await self.repository.update_task_fields(
+                owner_id, task_id, changes, expected_version
+            )
+        finally:
+            await self._invalidate([task_id])
+
+    async def update_changed_task_fields(
+        self,
+        owner_id: EntityId,
+        task_id: EntityId,
+        changes: TaskUpdate,
+        expected_version: Optional[int] = None
+    ) -> Optional[DomainTask]:
+        updated_task = await self.repository.update_changed_task_fields(
+            owner_id, task_id, changes, expected_version
+        )
+        # Nothing written means nothing cached went stale
+        if updated_task:
+            await self._invalidate([task_id])
+        return updated_task
+
+    async def update_tasks_state(
+        self, owner_id: EntityId, task_ids: List[EntityId], state: State
+    ) -> List[EntityId]:
+        try:
+            return await self.repository.update_tasks_state(
+                owner_id, task_ids, state
+            )
+        finally:
+            await self._invalidate(task_ids)
+
+    async def delete_task(self, owner_id: EntityId, task_id: EntityId) -> bool:
+        try:
+            return await self.repository.delete_task(owner_id, task_id)
+        finally:
+            await self._invalidate([task_id])
+
+    async def count_tasks_by_state(self, owner_id: EntityId) -> TaskStats:
+        return await self.repository.count_tasks_by_state(owner_id)
+
+    @staticmethod
+    def _owned(
+        task: DomainTask, owner_id: EntityId
+    ) -> Optional[DomainTask]:
+        return task if task.owner_id == owner_id else None
+
+    async def _store(
+        self,
+        task: DomainTask,
+        local_generation: int,
+        shared_generation: Optional[int],
+    ) -> None:
+        await self.local_cache.set(
+            task, self.local_ttl_seconds, local_generation
+        )
+        if self.shared_cache:
+            await self.shared_cache.set(
+                task, self.shared_ttl_seconds, shared_generation
+            )
+
+    async def _invalidate(self, task_ids: List[EntityId]) -> None:
+        await self.local_cache.delete(task_ids)
+        if self.shared_cache:
+            await self.shared_cache.delete(task_ids)
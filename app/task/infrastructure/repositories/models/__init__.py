@@ -1,5 +1,7 @@
 from .task_model import TaskModel
+from .task_state_count_model import TaskStateCountModel
 
 __all__ = [
-    "TaskModel"
+    "TaskModel",
+    "TaskStateCountModel",
 ]
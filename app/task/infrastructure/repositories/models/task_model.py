@@ -8,12 +8,26 @@ from typing import Optional
 from uuid import UUID as UUIDType
 from uuid import uuid4
 
-from sqlalchemy import DateTime, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    DDL,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
 
+# Text search configuration of search_vector. "simple" lowercases and
+# splits words without language-specific stemming or stop words.
+SEARCH_CONFIG = "simple"
+
 
 class TaskModel(Base):
     """
@@ -25,8 +39,9 @@ class TaskModel(Base):
     __tablename__ = "tasks"
 
     # Primary key
+    # The primary key index serves lookups by id, freshness checks included
     id: Mapped[UUIDType] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid4, index=True
+        UUID(as_uuid=True), primary_key=True, default=uuid4
     )
 
     title: Mapped[str] = mapped_column(
@@ -38,6 +53,32 @@ class TaskModel(Base):
         String(20), index=True, nullable=False
     )
 
+    # Every query filters on owner_id; the composite indexes below lead
+    # with it, so no single-column index is needed
+    owner_id: Mapped[UUIDType] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # Full-text document kept up to date by PostgreSQL: title words rank
+    # above description words. Deferred so plain reads never load it.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A')"
+            f" || setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
+    # Optimistic concurrency: every UPDATE sets version = version + 1, and
+    # conditional writes compare-and-set on it (WHERE version = :expected)
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=datetime.utcnow, nullable=False
@@ -51,3 +92,64 @@ class TaskModel(Base):
 
     def __repr__(self) -> str:
         return f"<TaskModel(id={self.id}, title={self.title})>"
+
+
+# Keyset pagination of one owner's tasks, one index per sort field
+# (see SORT_COLUMNS in the repository); each also serves the ascending
+# order with a backward scan:
+#   WHERE owner_id = :owner ORDER BY <column> DESC, id DESC
+# No INCLUDE columns: updated_at and version change on every UPDATE, and
+# an index holding either one would rule out HOT updates.
+Index(
+    "ix_tasks_owner_id_created_at_id",
+    TaskModel.owner_id,
+    TaskModel.created_at.desc(),
+    TaskModel.id.desc(),
+)
+
+Index(
+    "ix_tasks_owner_id_updated_at_id",
+    TaskModel.owner_id,
+    TaskModel.updated_at.desc(),
+    TaskModel.id.desc(),
+)
+
+Index(
+    "ix_tasks_owner_id_title_id",
+    TaskModel.owner_id,
+    TaskModel.title,
+    TaskModel.id,
+)
+
+# Per-owner state counts, and state-filtered pages in the default order
+Index(
+    "ix_tasks_owner_id_state_created_at_id",
+    TaskModel.owner_id,
+    TaskModel.state,
+    TaskModel.created_at.desc(),
+    TaskModel.id.desc(),
+)
+
+# Full-text search: search_vector @@ websearch_to_tsquery(...)
+Index(
+    "ix_tasks_search_vector",
+    TaskModel.search_vector,
+    postgresql_using="gin",
+)
+
+# Fuzzy title matching: :q <% title (pg_trgm word similarity)
+Index(
+    "ix_tasks_title_trgm",
+    TaskModel.title,
+    postgresql_using="gin",
+    postgresql_ops={"title": "gin_trgm_ops"},
+)
+
+# gin_trgm_ops comes from the pg_trgm extension
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(
+        dialect="postgresql"
+    ),
+)
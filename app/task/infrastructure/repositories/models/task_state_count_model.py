@@ -0,0 +1,144 @@
+"""
+Task State Count ORM Model
+Per-owner, per-state task counters maintained by triggers on tasks.
+"""
+
+from uuid import UUID as UUIDType
+
+from sqlalchemy import DDL, BigInteger, String, event
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.task.infrastructure.repositories.models.task_model import TaskModel
+
+
+class TaskStateCountModel(Base):
+    """
+    Task state count table model.
+    Maps to 'task_state_counts' table in database. One row per owner and
+    state holding how many of the owner's tasks are in that state, so
+    statistics never count over tasks.
+
+    owner_id has no foreign key on purpose: deleting a user cascades to
+    tasks, and the delete trigger below must still be able to update the
+    owner's rows whatever order the cascade runs in.
+    """
+
+    __tablename__ = "task_state_counts"
+
+    owner_id: Mapped[UUIDType] = mapped_column(
+        UUID(as_uuid=True), primary_key=True
+    )
+    state: Mapped[str] = mapped_column(String(20), primary_key=True)
+
+    task_count: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<TaskStateCountModel(owner_id={self.owner_id}, "
+            f"state={self.state}, task_count={self.task_count})>"
+        )
+
+
+task_state_counts_table = TaskStateCountModel.__table__
+
+# Created after tasks: the triggers and the backfill below read it
+task_state_counts_table.add_is_dependent_on(TaskModel.__table__)
+
+# Statement-level triggers with transition tables: a multi-row INSERT,
+# COPY, bulk UPDATE or cascaded DELETE adjusts each (owner, state) row
+# once per statement, in the same transaction, rather than once per task.
+# Updates that leave every state unchanged write nothing.
+APPLY_COUNTS_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION task_state_counts_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO task_state_counts AS c (owner_id, state, task_count)
+        SELECT owner_id, state, count(*)
+        FROM new_rows
+        GROUP BY owner_id, state
+        ORDER BY owner_id, state
+        ON CONFLICT (owner_id, state)
+        DO UPDATE SET task_count = c.task_count + EXCLUDED.task_count;
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO task_state_counts AS c (owner_id, state, task_count)
+        SELECT owner_id, state, sum(delta)
+        FROM (
+            SELECT owner_id, state, 1 AS delta FROM new_rows
+            UNION ALL
+            SELECT owner_id, state, -1 AS delta FROM old_rows
+        ) AS changes
+        GROUP BY owner_id, state
+        HAVING sum(delta) <> 0
+        ORDER BY owner_id, state
+        ON CONFLICT (owner_id, state)
+        DO UPDATE SET task_count = c.task_count + EXCLUDED.task_count;
+    ELSE
+        UPDATE task_state_counts AS c
+        SET task_count = c.task_count - removed.task_count
+        FROM (
+            SELECT owner_id, state, count(*) AS task_count
+            FROM old_rows
+            GROUP BY owner_id, state
+        ) AS removed
+        WHERE c.owner_id = removed.owner_id AND c.state = removed.state;
+
+        DELETE FROM task_state_counts AS c
+        USING (SELECT DISTINCT owner_id, state FROM old_rows) AS removed
+        WHERE c.owner_id = removed.owner_id
+          AND c.state = removed.state
+          AND c.task_count = 0;
+    END IF;
+    RETURN NULL;
+END;
+$$
+""")
+
+# Transition tables allow a single event per trigger
+COUNT_TRIGGERS = [
+    DDL(
+        "CREATE TRIGGER task_state_counts_insert AFTER INSERT ON tasks "
+        "REFERENCING NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION task_state_counts_apply()"
+    ),
+    DDL(
+        "CREATE TRIGGER task_state_counts_update AFTER UPDATE ON tasks "
+        "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION task_state_counts_apply()"
+    ),
+    DDL(
+        "CREATE TRIGGER task_state_counts_delete AFTER DELETE ON tasks "
+        "REFERENCING OLD TABLE AS old_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION task_state_counts_apply()"
+    ),
+]
+
+# Counts for tasks that existed before the table. Runs after the triggers
+# are created: CREATE TRIGGER blocks writes to tasks until the surrounding
+# create_all transaction commits, so no task is missed or counted twice.
+BACKFILL_COUNTS = DDL("""
+INSERT INTO task_state_counts (owner_id, state, task_count)
+SELECT owner_id, state, count(*)
+FROM tasks
+GROUP BY owner_id, state
+""")
+
+for statement in (APPLY_COUNTS_FUNCTION, *COUNT_TRIGGERS, BACKFILL_COUNTS):
+    event.listen(
+        task_state_counts_table,
+        "after_create",
+        statement.execute_if(dialect="postgresql"),
+    )
+
+# The triggers go with tasks; the function outlives both tables otherwise
+event.listen(
+    Base.metadata,
+    "after_drop",
+    DDL("DROP FUNCTION IF EXISTS task_state_counts_apply()").execute_if(
+        dialect="postgresql"
+    ),
+)
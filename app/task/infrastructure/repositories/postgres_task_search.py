@@ -0,0 +1,80 @@
+"""
+PostgreSQL Task Search
+TaskSearchPort implementation over the tasks table's text search indexes.
+"""
+
+import logging
+
+from sqlalchemy import String, func, literal, literal_column, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.value_objects import EntityId
+from app.core.decorators.exception_repository_handlers import exception_repository_handlers
+from app.task.domain.entities import TaskSearchHit, TaskSearchPage
+from app.task.domain.ports import TaskSearchPort
+from app.task.infrastructure.repositories.models import TaskModel
+from app.task.infrastructure.repositories.models.task_model import SEARCH_CONFIG
+from app.task.infrastructure.repositories.task_repository import (
+    TaskRepository,
+    task_columns,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresTaskSearch(TaskSearchPort):
+    """
+    Ranked search with one indexed statement:
+
+      * words: search_vector @@ websearch_to_tsquery(:q), served by the
+        GIN index on the generated search_vector column (title words
+        weigh more than description words);
+      * fuzzy titles: :q <% title, pg_trgm word similarity served by the
+        trigram GIN index on title, which tolerates typos and partial
+        words.
+
+    The two GIN lookups are OR-ed as a bitmap, narrowed to the owner, and
+    ranked by ts_rank_cd plus the title's word similarity.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @exception_repository_handlers("search tasks")
+    async def search_tasks(
+        self, owner_id: EntityId, text: str, limit: int, offset: int = 0
+    ) -> TaskSearchPage:
+        # The configuration is a constant, rendered inline like in the
+        # search_vector expression so both use the same one
+        tsquery = func.websearch_to_tsquery(
+            literal_column(f"'{SEARCH_CONFIG}'::regconfig"), text
+        )
+        rank = (
+            func.ts_rank_cd(TaskModel.search_vector, tsquery)
+            + func.word_similarity(text, TaskModel.title)
+        ).label("rank")
+
+        # One extra row tells whether another page exists
+        stmt = (
+            select(*task_columns, rank)
+            .where(
+                TaskModel.owner_id == owner_id.value,
+                or_(
+                    TaskModel.search_vector.bool_op("@@")(tsquery),
+                    literal(text, String).bool_op("<%")(TaskModel.title),
+                ),
+            )
+            .order_by(rank.desc(), TaskModel.id)
+            .limit(limit + 1)
+            .offset(offset)
+        )
+        result = await self.session.execute(stmt)
+        rows = result.all()
+
+        hits = [
+            TaskSearchHit(task=TaskRepository._to_entity(row), rank=row.rank)
+            for row in rows[:limit]
+        ]
+        next_offset = offset + limit if len(rows) > limit else None
+
+        return TaskSearchPage(hits=hits, next_offset=next_offset)
@@ -3,40 +3,222 @@ Task Repository Implementation
 Concrete implementation of TaskRepository using SQLAlchemy.
 """
 
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 import logging
 
 from app.core.decorators.exception_repository_handlers import exception_repository_handlers
-from sqlalchemy import select
+from sqlalchemy import (
+    Select,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.task.domain.ports import TaskRepositoryPort
-from app.task.infrastructure.repositories.models import TaskModel
-from app.task.domain.entities import Task as DomainTask
-from app.task.domain.value_objects import Title, Description, State
+from app.task.infrastructure.repositories.models import (
+    TaskModel,
+    TaskStateCountModel,
+)
+from app.task.domain.entities import (
+    Task as DomainTask,
+    TaskPage,
+    TaskStamp,
+    TaskStampPage,
+    TaskStats,
+)
+from app.task.domain.value_objects import (
+    Title,
+    Description,
+    State,
+    TaskStatus,
+    PageCursor,
+    TaskQuery,
+    TaskUpdate,
+)
 from app.common.value_objects import EntityId
+from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Core table: write statements go through it with RETURNING so they cost a
+# single round trip and never touch the session identity map.
+tasks_table = TaskModel.__table__
+
+# Columns a task is read from and written to; generated columns such as
+# search_vector are maintained by PostgreSQL and never sent or returned.
+# TASK_INSERT_COLUMNS in the settings bounds the bulk INSERT batch by it.
+task_columns = tuple(
+    column for column in tasks_table.c if column.computed is None
+)
+
+# SET clause shared by every UPDATE: each write moves the task to a new
+# version, which is what compare-and-set writes check against
+NEXT_VERSION = {"version": tasks_table.c.version + 1}
+
+# TaskQuery sort fields -> columns; each has an (owner_id, column, id) index
+SORT_COLUMNS = {
+    "created_at": TaskModel.created_at,
+    "updated_at": TaskModel.updated_at,
+    "title": TaskModel.title,
+}
+
+
+def select_tasks_page(
+    owner_id: EntityId,
+    query: TaskQuery,
+    limit: int,
+    cursor: Optional[PageCursor] = None
+) -> Select:
+    """
+    SELECT of one page of the owner's tasks matching query.
+
+    owner_id = :owner is always the leading index condition and the rows
+    are ordered by (sort column, id) in a single direction, so one of the
+    (owner_id, <column>, id) indexes yields them in order, scanned forward
+    or backward, and the keyset condition becomes an index range bound.
+    State and date filters are applied on top of that range scan.
+    """
+    sort_column = SORT_COLUMNS[query.sort_field]
+
+    conditions = [TaskModel.owner_id == owner_id.value]
+    if query.states:
+        conditions.append(
+            TaskModel.state.in_([state.value for state in query.states])
+        )
+    if query.created_from:
+        conditions.append(TaskModel.created_at >= query.created_from)
+    if query.created_to:
+        conditions.append(TaskModel.created_at <= query.created_to)
+    if query.updated_from:
+        conditions.append(TaskModel.updated_at >= query.updated_from)
+    if query.updated_to:
+        conditions.append(TaskModel.updated_at <= query.updated_to)
+
+    if cursor:
+        key = tuple_(sort_column, TaskModel.id)
+        position = tuple_(cursor.value, cursor.id)
+        conditions.append(key < position if query.descending else key > position)
+
+    if query.descending:
+        order_by = (sort_column.desc(), TaskModel.id.desc())
+    else:
+        order_by = (sort_column.asc(), TaskModel.id.asc())
+
+    return select(TaskModel).where(*conditions).order_by(*order_by).limit(limit)
 
 
 class TaskRepository(TaskRepositoryPort):
     """SQLAlchemy implementation of task repository."""
 
+    # Batches of this size or larger are loaded with COPY
+    COPY_THRESHOLD = settings.TASKS_BULK_COPY_THRESHOLD
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
     @exception_repository_handlers("create task")
     async def create_task(self, task: DomainTask) -> DomainTask:
-        db_task = self._to_model(task)
-        self.session.add(db_task)
+        stmt = (
+            insert(tasks_table)
+            .values(**self._to_values(task))
+            .returning(*task_columns)
+        )
+        result = await self.session.execute(stmt)
+        row = result.one()
+        await self.session.commit()
+
+        return self._to_entity(row)
+
+    @exception_repository_handlers("create tasks")
+    async def create_tasks(self, tasks: List[DomainTask]) -> List[DomainTask]:
+        if not tasks:
+            return []
+
+        if len(tasks) >= self.COPY_THRESHOLD:
+            await self._copy_tasks(tasks)
+            # COPY has no RETURNING: read the rows back in the same
+            # transaction so both paths return the stored values
+            created_tasks = await self._get_tasks_by_ids(
+                [task.id for task in tasks]
+            )
+            await self.session.commit()
+            return created_tasks
+
+        stmt = (
+            insert(tasks_table)
+            .values([self._to_values(task) for task in tasks])
+            .returning(*task_columns)
+        )
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        await self.session.commit()
+
+        return [self._to_entity(row) for row in rows]
+
+    @exception_repository_handlers("copy tasks")
+    async def copy_tasks(self, tasks: List[DomainTask]) -> int:
+        if not tasks:
+            return 0
+
+        await self._copy_tasks(tasks)
         await self.session.commit()
-        await self.session.refresh(db_task)
+        return len(tasks)
 
-        return self._to_entity(db_task)
+    async def _copy_tasks(self, tasks: List[DomainTask]) -> None:
+        """Load tasks with asyncpg COPY on the session's connection."""
+        columns = [column.name for column in task_columns]
+        records = [
+            tuple(values[column] for column in columns)
+            for values in (self._to_values(task) for task in tasks)
+        ]
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        # Joins the session transaction as a savepoint when one is already
+        # open on the driver connection, otherwise opens its own.
+        async with driver_connection.transaction():
+            await driver_connection.copy_records_to_table(
+                tasks_table.name, records=records, columns=columns
+            )
+
+    async def _get_tasks_by_ids(
+        self, task_ids: List[EntityId]
+    ) -> List[DomainTask]:
+        """Stored tasks with the given ids, in the order given."""
+        ids_param = bindparam(
+            "ids",
+            value=[task_id.value for task_id in task_ids],
+            type_=ARRAY(UUID(as_uuid=True)),
+        )
+        stmt = select(*task_columns).where(tasks_table.c.id == any_(ids_param))
+        result = await self.session.execute(stmt)
+        rows = {row.id: row for row in result.all()}
+
+        return [
+            self._to_entity(rows[task_id.value])
+            for task_id in task_ids
+            if task_id.value in rows
+        ]
 
     @exception_repository_handlers("get task by id")
-    async def get_task_by_id(self, task_id: EntityId) -> Optional[DomainTask]:
-        stmt = select(TaskModel).where(TaskModel.id == task_id.value)
+    async def get_task_by_id(
+        self, owner_id: EntityId, task_id: EntityId
+    ) -> Optional[DomainTask]:
+        stmt = select(TaskModel).where(
+            TaskModel.id == task_id.value,
+            TaskModel.owner_id == owner_id.value,
+        )
         result = await self.session.execute(stmt)
         task_model = result.scalar_one_or_none()
 
@@ -45,60 +227,285 @@ class TaskRepository(TaskRepositoryPort):
         return None
 
     @exception_repository_handlers("get all tasks")
-    async def get_all_tasks(self) -> List[DomainTask]:
-        stmt = select(TaskModel).order_by(TaskModel.created_at.desc())
+    async def get_all_tasks(self, owner_id: EntityId) -> List[DomainTask]:
+        stmt = (
+            select(TaskModel)
+            .where(TaskModel.owner_id == owner_id.value)
+            .order_by(TaskModel.created_at.desc(), TaskModel.id.desc())
+        )
         result = await self.session.execute(stmt)
         task_models = result.scalars().all()
 
         return [self._to_entity(task_model) for task_model in task_models]
 
+    @exception_repository_handlers("get tasks page")
+    async def get_tasks_page(
+        self,
+        owner_id: EntityId,
+        limit: int,
+        cursor: Optional[PageCursor] = None,
+        query: Optional[TaskQuery] = None
+    ) -> TaskPage:
+        # Keyset pagination over the owner's slice of the index matching
+        # the sort. Fetch one extra row to know whether another page exists.
+        query = query or TaskQuery()
+        stmt = select_tasks_page(owner_id, query, limit + 1, cursor)
+
+        result = await self.session.execute(stmt)
+        task_models = result.scalars().all()
+
+        tasks = [self._to_entity(task_model) for task_model in task_models[:limit]]
+        next_cursor = None
+        if len(task_models) > limit:
+            last = task_models[limit - 1]
+            next_cursor = PageCursor(
+                value=getattr(last, query.sort_field),
+                id=last.id,
+                sort=query.sort,
+            )
+
+        return TaskPage(tasks=tasks, next_cursor=next_cursor)
+
+    @exception_repository_handlers("get task stamp")
+    async def get_task_stamp(
+        self, owner_id: EntityId, task_id: EntityId
+    ) -> Optional[TaskStamp]:
+        # Primary key lookup of three columns, not the whole task
+        stmt = select(
+            TaskModel.id, TaskModel.updated_at, TaskModel.version
+        ).where(
+            TaskModel.id == task_id.value,
+            TaskModel.owner_id == owner_id.value,
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+
+        if row:
+            return self._to_stamp(row)
+        return None
+
+    @exception_repository_handlers("get tasks page stamps")
+    async def get_tasks_page_stamps(
+        self,
+        owner_id: EntityId,
+        limit: int,
+        cursor: Optional[PageCursor] = None,
+        query: Optional[TaskQuery] = None
+    ) -> TaskStampPage:
+        # The get_tasks_page statement reduced to (id, updated_at, version):
+        # same index scan, but no task bodies decoded or sent
+        query = query or TaskQuery()
+        stmt = select_tasks_page(
+            owner_id, query, limit + 1, cursor
+        ).with_only_columns(
+            TaskModel.id, TaskModel.updated_at, TaskModel.version
+        )
+
+        result = await self.session.execute(stmt)
+        rows = result.all()
+
+        return TaskStampPage(
+            stamps=[self._to_stamp(row) for row in rows[:limit]],
+            has_more=len(rows) > limit,
+        )
+
+    @exception_repository_handlers("stream tasks")
+    async def stream_tasks(
+        self, owner_id: EntityId, fetch_size: int
+    ) -> AsyncIterator[DomainTask]:
+        # Server-side cursor: only fetch_size rows are held in memory at a
+        # time. Plain column rows skip the ORM identity map entirely.
+        stmt = (
+            select(*task_columns)
+            .where(tasks_table.c.owner_id == owner_id.value)
+            .order_by(tasks_table.c.created_at, tasks_table.c.id)
+            .execution_options(yield_per=fetch_size)
+        )
+        result = await self.session.stream(stmt)
+        async for row in result:
+            yield self._to_entity(row)
+
     @exception_repository_handlers("update task")
-    async def update_task(self, task: DomainTask) -> DomainTask:
-        stmt = select(TaskModel).where(TaskModel.id == task.id.value)
+    async def update_task(self, task: DomainTask) -> Optional[DomainTask]:
+        # Every field is written back, so only over the version it was read at
+        return await self._update_returning(
+            task.owner_id,
+            task.id,
+            {
+                "title": task.title.value,
+                "description": task.description.value,
+                "state": task.state.value,
+            },
+            expected_version=task.version,
+        )
+
+    @exception_repository_handlers("update task fields")
+    async def update_task_fields(
+        self,
+        owner_id: EntityId,
+        task_id: EntityId,
+        changes: TaskUpdate,
+        expected_version: Optional[int] = None
+    ) -> Optional[DomainTask]:
+        return await self._update_returning(
+            owner_id, task_id, changes.to_dict(), expected_version
+        )
+
+    @exception_repository_handlers("update changed task fields")
+    async def update_changed_task_fields(
+        self,
+        owner_id: EntityId,
+        task_id: EntityId,
+        changes: TaskUpdate,
+        expected_version: Optional[int] = None
+    ) -> Optional[DomainTask]:
+        return await self._update_returning(
+            owner_id,
+            task_id,
+            changes.to_dict(),
+            expected_version,
+            only_if_changed=True,
+        )
+
+    @exception_repository_handlers("update tasks state")
+    async def update_tasks_state(
+        self, owner_id: EntityId, task_ids: List[EntityId], state: State
+    ) -> List[EntityId]:
+        # One set-based statement: UPDATE ... WHERE id = ANY(:ids) RETURNING id
+        ids_param = bindparam(
+            "ids",
+            value=[task_id.value for task_id in task_ids],
+            type_=ARRAY(UUID(as_uuid=True)),
+        )
+        stmt = (
+            update(tasks_table)
+            .where(
+                tasks_table.c.id == any_(ids_param),
+                tasks_table.c.owner_id == owner_id.value,
+            )
+            .values(state=state.value, **NEXT_VERSION)
+            .returning(tasks_table.c.id)
+        )
         result = await self.session.execute(stmt)
-        task_model = result.scalar_one_or_none()
+        updated_ids = result.scalars().all()
+        await self.session.commit()
 
-        if task_model:
-            task_model.title = task.title.value
-            task_model.description = task.description.value
-            task_model.state = task.state.value
+        return [EntityId(value=updated_id) for updated_id in updated_ids]
 
-            await self.session.commit()
-            await self.session.refresh(task_model)
+    async def _update_returning(
+        self,
+        owner_id: EntityId,
+        task_id: EntityId,
+        values: dict,
+        expected_version: Optional[int] = None,
+        only_if_changed: bool = False
+    ) -> Optional[DomainTask]:
+        """
+        UPDATE tasks SET ..., version = version + 1
+        WHERE id = :id AND owner_id = :owner [AND version = :expected]
+              [AND (<column> IS DISTINCT FROM :value OR ...)]
+        RETURNING *
 
-            return self._to_entity(task_model)
+        With expected_version this is a compare-and-set: a concurrent
+        write has already moved the version, so no row matches and no
+        lock is held beyond the single statement.
+
+        With only_if_changed the row is left alone, with no new row
+        version, WAL record or index entries and no updated_at/version
+        bump, when it already holds every value.
+        """
+        conditions = [
+            tasks_table.c.id == task_id.value,
+            tasks_table.c.owner_id == owner_id.value,
+        ]
+        if expected_version is not None:
+            conditions.append(tasks_table.c.version == expected_version)
+        if only_if_changed:
+            conditions.append(or_(*(
+                self._stored(tasks_table.c[name]).is_distinct_from(value)
+                for name, value in values.items()
+            )))
+
+        stmt = (
+            update(tasks_table)
+            .where(*conditions)
+            .values(**values, **NEXT_VERSION)
+            .returning(*task_columns)
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+        await self.session.commit()
+
+        if row:
+            return self._to_entity(row)
         return None
 
     @exception_repository_handlers("delete task")
-    async def delete_task(self, task_id: EntityId) -> bool:
-        stmt = select(TaskModel).where(TaskModel.id == task_id.value)
+    async def delete_task(self, owner_id: EntityId, task_id: EntityId) -> bool:
+        stmt = (
+            delete(tasks_table)
+            .where(
+                tasks_table.c.id == task_id.value,
+                tasks_table.c.owner_id == owner_id.value,
+            )
+            .returning(tasks_table.c.id)
+        )
         result = await self.session.execute(stmt)
-        task_model = result.scalar_one_or_none()
+        deleted_id = result.scalar_one_or_none()
+        await self.session.commit()
 
-        if task_model:
-            await self.session.delete(task_model)
-            await self.session.commit()
-            return True
-        return False
+        return deleted_id is not None
 
-    def _to_entity(self, model: TaskModel) -> DomainTask:
-        """Convert ORM model to domain entity."""
+    @exception_repository_handlers("count tasks by state")
+    async def count_tasks_by_state(self, owner_id: EntityId) -> TaskStats:
+        # Primary key lookup on the trigger-maintained counters: at most
+        # one row per state, whatever the number of tasks
+        stmt = select(
+            TaskStateCountModel.state, TaskStateCountModel.task_count
+        ).where(TaskStateCountModel.owner_id == owner_id.value)
+        result = await self.session.execute(stmt)
+
+        by_state = {status.value: 0 for status in TaskStatus}
+        for state, task_count in result.all():
+            by_state[state] = task_count
+        return TaskStats(by_state=by_state)
+
+    @staticmethod
+    def _to_entity(model: TaskModel) -> DomainTask:
+        """Convert ORM model (or a RETURNING row) to domain entity."""
         return DomainTask(
             title=Title(value=model.title),
             description=Description(value=model.description or ""),
             state=State(value=model.state),
+            owner_id=EntityId(value=model.owner_id),
             id=EntityId(value=model.id),
             created_at=model.created_at,
             updated_at=model.updated_at,
+            version=model.version,
         )
 
-    def _to_model(self, entity: DomainTask) -> TaskModel:
-        """Convert domain entity to ORM model."""
-        return TaskModel(
-            id=entity.id.value,
-            title=entity.title.value,
-            description=entity.description.value,
-            state=entity.state.value,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
+    @staticmethod
+    def _stored(column):
+        """Column as _to_entity reads it: a NULL description is ''."""
+        return func.coalesce(column, "") if column.nullable else column
+
+    @staticmethod
+    def _to_stamp(row) -> TaskStamp:
+        return TaskStamp(
+            id=EntityId(value=row.id),
+            updated_at=row.updated_at,
+            version=row.version,
         )
+
+    def _to_values(self, entity: DomainTask) -> dict:
+        """Convert domain entity to a column -> value mapping."""
+        return {
+            "id": entity.id.value,
+            "title": entity.title.value,
+            "description": entity.description.value,
+            "state": entity.state.value,
+            "owner_id": entity.owner_id.value,
+            "created_at": entity.created_at,
+            "updated_at": entity.updated_at,
+            "version": entity.version,
+        }
@@ -0,0 +1,206 @@
+"""
+Dependency injection overhead benchmark.
+
+Resolves the task controller through the previous per-request dependency
+graph (one Depends node per repository and use case) and through the
+application container, and reports the time per request spent in
+FastAPI routing + dependency resolution. The database session dependency
+is overridden with a stub so no database is needed.
+
+Requires httpx. From the project root:
+
+    python -m benchmarks.bench_dependency_injection
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Annotated
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.container import AppContainer
+from app.core.database import async_session_factory, get_async_session
+from app.task.application import (
+    RegisterTaskUseCase,
+    GetAllTasksUseCase,
+    GetTaskUseCase,
+    DeleteTaskUseCase,
+    UpdateTaskUseCase,
+    RegisterTasksBulkUseCase,
+    UpdateTasksStateUseCase,
+    ExportTasksUseCase,
+    ImportTasksUseCase,
+    SearchTasksUseCase,
+    GetTaskStatsUseCase,
+)
+from app.task.domain.ports import TaskRepositoryPort
+from app.task.infrastructure.dependencies import get_task_controller
+from app.task.infrastructure.presentation.controllers import TaskController
+from app.task.infrastructure.repositories import (
+    PostgresTaskSearch,
+    TaskRepository,
+)
+
+REQUESTS = 5_000
+settings = get_settings()
+
+
+# --- Previous per-request graph ----------------------------------------------
+
+async def legacy_task_repository(
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> TaskRepositoryPort:
+    return TaskRepository(session)
+
+
+async def legacy_register(
+    repo: Annotated[TaskRepositoryPort, Depends(legacy_task_repository)]
+) -> RegisterTaskUseCase:
+    return RegisterTaskUseCase(repo)
+
+
+async def legacy_get_all(
+    repo: Annotated[TaskRepositoryPort, Depends(legacy_task_repository)]
+) -> GetAllTasksUseCase:
+    return GetAllTasksUseCase(repo)
+
+
+async def legacy_get(
+    repo: Annotated[TaskRepositoryPort, Depends(legacy_task_repository)]
+) -> GetTaskUseCase:
+    return GetTaskUseCase(repo)
+
+
+async def legacy_delete(
+    repo: Annotated[TaskRepositoryPort, Depends(legacy_task_repository)]
+) -> DeleteTaskUseCase:
+    return DeleteTaskUseCase(repo)
+
+
+async def legacy_update(
+    repo: Annotated[TaskRepositoryPort, Depends(legacy_task_repository)]
+) -> UpdateTaskUseCase:
+    return UpdateTaskUseCase(repo)
+
+
+async def legacy_bulk(
+    repo: Annotated[TaskRepositoryPort, Depends(legacy_task_repository)]
+) -> RegisterTasksBulkUseCase:
+    return RegisterTasksBulkUseCase(repo, settings.TASKS_BULK_MAX_ITEMS)
+
+
+async def legacy_state(
+    repo: Annotated[TaskRepositoryPort, Depends(legacy_task_repository)]
+) -> UpdateTasksStateUseCase:
+    return UpdateTasksStateUseCase(repo, settings.TASKS_BULK_MAX_ITEMS)
+
+
+@asynccontextmanager
+async def legacy_repository_scope():
+    async with async_session_factory() as session:
+        yield TaskRepository(session)
+
+
+async def legacy_export() -> ExportTasksUseCase:
+    return ExportTasksUseCase(
+        legacy_repository_scope, settings.TASKS_EXPORT_FETCH_SIZE
+    )
+
+
+async def legacy_import(
+    repo: Annotated[TaskRepositoryPort, Depends(legacy_task_repository)]
+) -> ImportTasksUseCase:
+    return ImportTasksUseCase(
+        repo,
+        settings.TASKS_IMPORT_CHUNK_SIZE,
+        settings.TASKS_IMPORT_MAX_REJECTED,
+    )
+
+
+async def legacy_search(
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> SearchTasksUseCase:
+    return SearchTasksUseCase(PostgresTaskSearch(session))
+
+
+async def legacy_stats(
+    repo: Annotated[TaskRepositoryPort, Depends(legacy_task_repository)]
+) -> GetTaskStatsUseCase:
+    return GetTaskStatsUseCase(repo)
+
+
+async def legacy_task_controller(
+    register: Annotated[RegisterTaskUseCase, Depends(legacy_register)],
+    get_all: Annotated[GetAllTasksUseCase, Depends(legacy_get_all)],
+    get: Annotated[GetTaskUseCase, Depends(legacy_get)],
+    delete: Annotated[DeleteTaskUseCase, Depends(legacy_delete)],
+    update: Annotated[UpdateTaskUseCase, Depends(legacy_update)],
+    bulk: Annotated[RegisterTasksBulkUseCase, Depends(legacy_bulk)],
+    state: Annotated[UpdateTasksStateUseCase, Depends(legacy_state)],
+    export: Annotated[ExportTasksUseCase, Depends(legacy_export)],
+    import_: Annotated[ImportTasksUseCase, Depends(legacy_import)],
+    search: Annotated[SearchTasksUseCase, Depends(legacy_search)],
+    stats: Annotated[GetTaskStatsUseCase, Depends(legacy_stats)],
+) -> TaskController:
+    return TaskController(
+        register, get_all, get, delete, update, bulk, state, export, import_,
+        search, stats,
+    )
+
+
+# --- Benchmark app -------------------------------------------------------------
+
+async def stub_session():
+    yield None
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.state.container = AppContainer(settings)
+    app.dependency_overrides[get_async_session] = stub_session
+
+    @app.get("/legacy")
+    async def legacy(
+        controller: Annotated[TaskController, Depends(legacy_task_controller)]
+    ):
+        return None
+
+    @app.get("/container")
+    async def container(
+        controller: Annotated[TaskController, Depends(get_task_controller)]
+    ):
+        return None
+
+    return app
+
+
+async def measure(client: httpx.AsyncClient, path: str) -> float:
+    for _ in range(200):
+        await client.get(path)
+
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        await client.get(path)
+    return (time.perf_counter() - started) / REQUESTS
+
+
+async def main() -> None:
+    app = build_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        legacy = await measure(client, "/legacy")
+        container = await measure(client, "/container")
+
+    print(f"legacy graph: {legacy * 1e6:8.1f} us/request")
+    print(f"container:    {container * 1e6:8.1f} us/request")
+    print(f"saved:        {(legacy - container) * 1e6:8.1f} us/request")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
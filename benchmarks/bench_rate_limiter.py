@@ -0,0 +1,108 @@
+"""
+Rate limiter microbenchmark.
+
+Measures the per-request cost of the rate limit check with 100k distinct
+clients already tracked, for the token bucket limiter and for the previous
+timestamp-list algorithm (which rescanned every client on each request).
+
+Runs without a database. From the project root:
+
+    python -m benchmarks.bench_rate_limiter
+"""
+
+import asyncio
+import random
+import time
+from typing import Dict, List
+
+from app.core.rate_limiting import (
+    InMemoryRateLimitStorage,
+    TokenBucketRateLimiter,
+)
+
+CLIENTS = 100_000
+CALLS = 100
+PERIOD = 60
+TOKEN_BUCKET_REQUESTS = 200_000
+LEGACY_REQUESTS = 50
+
+
+def client_ip(index: int) -> str:
+    return f"10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}"
+
+
+class LegacyRateLimiter:
+    """The previous algorithm: cleanup of every client, then list filter."""
+
+    def __init__(self, calls: int, period: int):
+        self.calls = calls
+        self.period = period
+        self.clients: Dict[str, List[float]] = {}
+
+    def hit(self, ip: str, current_time: float) -> bool:
+        for key in list(self.clients.keys()):
+            self.clients[key] = [
+                req_time
+                for req_time in self.clients[key]
+                if current_time - req_time < self.period
+            ]
+            if not self.clients[key]:
+                del self.clients[key]
+
+        if ip in self.clients:
+            recent = [
+                req_time
+                for req_time in self.clients[ip]
+                if current_time - req_time < self.period
+            ]
+            if len(recent) >= self.calls:
+                return False
+            self.clients[ip] = recent + [current_time]
+        else:
+            self.clients[ip] = [current_time]
+        return True
+
+
+async def bench_token_bucket() -> float:
+    limiter = TokenBucketRateLimiter(
+        storage=InMemoryRateLimitStorage(max_entries=CLIENTS * 2),
+        calls=CALLS,
+        period=PERIOD,
+    )
+    for index in range(CLIENTS):
+        await limiter.hit(client_ip(index))
+
+    targets = [client_ip(random.randrange(CLIENTS)) for _ in range(TOKEN_BUCKET_REQUESTS)]
+    started = time.perf_counter()
+    for ip in targets:
+        await limiter.hit(ip)
+    elapsed = time.perf_counter() - started
+    return elapsed / TOKEN_BUCKET_REQUESTS
+
+
+def bench_legacy() -> float:
+    limiter = LegacyRateLimiter(calls=CALLS, period=PERIOD)
+    now = time.time()
+    for index in range(CLIENTS):
+        limiter.clients[client_ip(index)] = [now]
+
+    targets = [client_ip(random.randrange(CLIENTS)) for _ in range(LEGACY_REQUESTS)]
+    started = time.perf_counter()
+    for ip in targets:
+        limiter.hit(ip, time.time())
+    elapsed = time.perf_counter() - started
+    return elapsed / LEGACY_REQUESTS
+
+
+def main() -> None:
+    token_bucket = asyncio.run(bench_token_bucket())
+    legacy = bench_legacy()
+
+    print(f"clients tracked: {CLIENTS:,}")
+    print(f"token bucket:    {token_bucket * 1e6:10.2f} us/request")
+    print(f"legacy:          {legacy * 1e6:10.2f} us/request")
+    print(f"speedup:         {legacy / token_bucket:10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
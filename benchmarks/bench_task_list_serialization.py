@@ -0,0 +1,103 @@
+"""
+Task list serialization benchmark.
+
+Serves the same 10k in-memory tasks through the standard path
+(GetAllTasksResponse + response_model validation + JSONResponse) and
+through the fast path (plain dicts encoded by orjson), and
+reports latency per response. No database is needed.
+
+Requires httpx. From the project root:
+
+    python -m benchmarks.bench_task_list_serialization
+"""
+
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI, Response
+
+from app.task.domain.entities import Task
+from app.task.domain.value_objects import Title, Description, State
+from app.task.infrastructure.presentation.dtos import (
+    GetAllTasksResponse,
+    TaskResponse,
+)
+from app.task.infrastructure.presentation.serializers import render_tasks_page
+
+TASKS = 10_000
+REQUESTS = 50
+MESSAGE = "Tasks retrieved successfully"
+
+
+def build_tasks() -> list:
+    return [
+        Task(
+            title=Title(f"Task {index}"),
+            description=Description(f"Description for task {index}"),
+            state=State("pending" if index % 2 else "completed"),
+        )
+        for index in range(TASKS)
+    ]
+
+
+def build_app(tasks: list) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/standard", response_model=GetAllTasksResponse)
+    async def standard() -> GetAllTasksResponse:
+        return GetAllTasksResponse(
+            message=MESSAGE,
+            tasks=[
+                TaskResponse(
+                    id=task.id.value,
+                    title=task.title.value,
+                    description=task.description.value,
+                    state=task.state.value,
+                )
+                for task in tasks
+            ],
+            next_cursor=None,
+        )
+
+    @app.get("/fast", response_model=GetAllTasksResponse)
+    async def fast():
+        return Response(
+            content=render_tasks_page(MESSAGE, tasks, None),
+            media_type="application/json",
+        )
+
+    return app
+
+
+async def measure(client: httpx.AsyncClient, path: str) -> float:
+    for _ in range(5):
+        await client.get(path)
+
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        await client.get(path)
+    return (time.perf_counter() - started) / REQUESTS
+
+
+async def main() -> None:
+    app = build_app(build_tasks())
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        standard_body = (await client.get("/standard")).json()
+        fast_body = (await client.get("/fast")).json()
+        assert standard_body == fast_body, "fast path body differs"
+
+        standard = await measure(client, "/standard")
+        fast = await measure(client, "/fast")
+
+    print(f"{TASKS} tasks per response")
+    print(f"standard: {standard * 1e3:8.2f} ms/response")
+    print(f"fast:     {fast * 1e3:8.2f} ms/response")
+    print(f"speedup:  {standard / fast:8.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,197 @@
+"""
+Task repository round-trip benchmark.
+
+Counts the statements each TaskRepository write path sends to PostgreSQL
+(plus BEGIN and COMMIT) and compares them with the previous ORM implementation
+(add/commit/refresh, select/delete/commit).
+
+Requires a reachable DATABASE_URL. Run from the project root:
+
+    python -m benchmarks.bench_task_round_trips
+"""
+
+import asyncio
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, Iterator, List
+
+from sqlalchemy import delete, event, insert, select
+
+from app.core.database import async_session_factory, engine, init_database
+from app.common.value_objects import EntityId
+from app.task.domain.entities import Task
+from app.task.domain.value_objects import Description, State, Title
+from app.auth.infrastructure.repositories.models import UserModel
+from app.task.infrastructure.repositories import TaskRepository
+from app.task.infrastructure.repositories.models import TaskModel
+
+ITERATIONS = 200
+
+
+class RoundTripCounter:
+    """Counts statements and transaction boundaries sent on the engine."""
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.begins = 0
+        self.commits = 0
+
+    def on_begin(self, *args) -> None:
+        self.begins += 1
+
+    def on_execute(self, *args) -> None:
+        self.statements += 1
+
+    def on_commit(self, *args) -> None:
+        self.commits += 1
+
+    @property
+    def round_trips(self) -> int:
+        return self.statements + self.begins + self.commits
+
+
+@contextmanager
+def count_round_trips() -> Iterator[RoundTripCounter]:
+    counter = RoundTripCounter()
+    sync_engine = engine.sync_engine
+    listeners = [
+        ("begin", counter.on_begin),
+        ("before_cursor_execute", counter.on_execute),
+        ("commit", counter.on_commit),
+    ]
+    for name, listener in listeners:
+        event.listen(sync_engine, name, listener)
+    try:
+        yield counter
+    finally:
+        for name, listener in listeners:
+            event.remove(sync_engine, name, listener)
+
+
+def new_task(owner_id: EntityId) -> Task:
+    return Task(
+        title=Title(value=f"bench {uuid.uuid4()}"),
+        description=Description(value="round trip benchmark"),
+        state=State(value="pending"),
+        owner_id=owner_id,
+    )
+
+
+async def create_owner() -> EntityId:
+    """Throwaway user owning the benchmark tasks."""
+    owner_id = uuid.uuid4()
+    async with async_session_factory() as session:
+        await session.execute(
+            insert(UserModel).values(
+                id=owner_id,
+                email=f"bench-{owner_id}@example.com",
+                hashed_password="!",
+            )
+        )
+        await session.commit()
+    return EntityId(owner_id)
+
+
+async def delete_owner(owner_id: EntityId) -> None:
+    async with async_session_factory() as session:
+        await session.execute(
+            delete(UserModel).where(UserModel.id == owner_id.value)
+        )
+        await session.commit()
+
+
+# --- Previous ORM implementation -----------------------------------------
+
+async def legacy_create(session, task: Task) -> None:
+    model = TaskModel(
+        id=task.id.value,
+        title=task.title.value,
+        description=task.description.value,
+        state=task.state.value,
+        owner_id=task.owner_id.value,
+        created_at=task.created_at,
+        updated_at=task.updated_at,
+    )
+    session.add(model)
+    await session.commit()
+    await session.refresh(model)
+
+
+async def legacy_delete(session, task: Task) -> None:
+    result = await session.execute(
+        select(TaskModel).where(
+            TaskModel.id == task.id.value,
+            TaskModel.owner_id == task.owner_id.value,
+        )
+    )
+    model = result.scalar_one_or_none()
+    if model:
+        await session.delete(model)
+        await session.commit()
+
+
+# --- Runner ---------------------------------------------------------------
+
+async def measure(
+    name: str, operation: Callable[[object, Task], Awaitable[None]],
+    tasks: List[Task],
+) -> Dict[str, float]:
+    async with async_session_factory() as session:
+        with count_round_trips() as counter:
+            started = time.perf_counter()
+            for task in tasks:
+                await operation(session, task)
+            elapsed = time.perf_counter() - started
+
+    return {
+        "name": name,
+        "round_trips_per_call": counter.round_trips / len(tasks),
+        "statements_per_call": counter.statements / len(tasks),
+        "ms_per_call": elapsed * 1000 / len(tasks),
+    }
+
+
+async def main() -> None:
+    await init_database()
+
+    owner_id = await create_owner()
+    legacy_tasks = [new_task(owner_id) for _ in range(ITERATIONS)]
+    returning_tasks = [new_task(owner_id) for _ in range(ITERATIONS)]
+
+    results = [
+        await measure("create (ORM add/commit/refresh)", legacy_create, legacy_tasks),
+        await measure(
+            "create (INSERT ... RETURNING)",
+            lambda session, task: TaskRepository(session).create_task(task),
+            returning_tasks,
+        ),
+        await measure(
+            "delete (ORM select/delete/commit)",
+            legacy_delete,
+            legacy_tasks,
+        ),
+        await measure(
+            "delete (DELETE ... RETURNING)",
+            lambda session, task: TaskRepository(session).delete_task(
+                task.owner_id, task.id
+            ),
+            returning_tasks,
+        ),
+    ]
+
+    print(f"{'operation':<38}{'round trips':>12}{'statements':>12}{'ms/call':>10}")
+    for result in results:
+        print(
+            f"{result['name']:<38}"
+            f"{result['round_trips_per_call']:>12.1f}"
+            f"{result['statements_per_call']:>12.1f}"
+            f"{result['ms_per_call']:>10.2f}"
+        )
+
+    await delete_owner(owner_id)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
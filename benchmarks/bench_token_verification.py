@@ -0,0 +1,67 @@
+"""
+Access token verification benchmark.
+
+Calls the get_current_token_claims dependency directly with the same
+bearer token, first against the plain JWTTokenService and then against the
+CachingTokenService, and reports the time per call and the cache hit
+rate. No database is needed.
+
+From the project root:
+
+    python -m benchmarks.bench_token_verification
+"""
+
+import asyncio
+import time
+import uuid
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.auth.infrastructure.adapters import CachingTokenService, JWTTokenService
+from app.auth.infrastructure.dependencies import get_current_token_claims
+from app.common.value_objects import EntityId
+from app.core.config import get_settings
+from app.core.container import AppContainer
+
+CALLS = 50_000
+settings = get_settings()
+
+
+async def measure(container: AppContainer, credentials) -> float:
+    for _ in range(1_000):
+        await get_current_token_claims(credentials, container)
+
+    started = time.perf_counter()
+    for _ in range(CALLS):
+        await get_current_token_claims(credentials, container)
+    return (time.perf_counter() - started) / CALLS
+
+
+async def main() -> None:
+    container = AppContainer(settings)
+    # Revocation checks are not loaded without a database; time only the
+    # signature verification and its cache
+    container.auth.token_revocation = None
+    jwt_service = JWTTokenService()
+    access_token = await jwt_service.create_access_token(EntityId(uuid.uuid4()))
+    credentials = HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials=access_token.token
+    )
+
+    container.auth.token_service = jwt_service
+    uncached = await measure(container, credentials)
+
+    token_cache = CachingTokenService(
+        jwt_service, max_entries=settings.TOKEN_CACHE_MAX_ENTRIES
+    )
+    container.auth.token_service = token_cache
+    cached = await measure(container, credentials)
+
+    print(f"jwt verify: {uncached * 1e6:8.2f} us/call")
+    print(f"cached:     {cached * 1e6:8.2f} us/call")
+    print(f"speedup:    {uncached / cached:8.2f}x")
+    print(f"hit rate:   {token_cache.stats()['hit_rate']:8.4f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
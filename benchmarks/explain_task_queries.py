@@ -0,0 +1,205 @@
+"""
+Task listing index check.
+
+Seeds OWNERS users with TASKS_PER_OWNER tasks each, then runs
+EXPLAIN (FORMAT JSON) on the GET /tasks query that select_tasks_page builds
+for every combination of state filter, created/updated date range, sort
+key and cursor. Fails (exit status 1) if any plan reads tasks with a
+sequential scan instead of an index.
+
+Requires a reachable DATABASE_URL. Run from the project root:
+
+    python -m benchmarks.explain_task_queries
+"""
+
+import asyncio
+import itertools
+import json
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import delete, insert, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.core.database import async_session_factory, engine, init_database
+from app.common.value_objects import EntityId
+from app.auth.infrastructure.repositories.models import UserModel
+from app.task.domain.entities import Task
+from app.task.domain.value_objects import (
+    Description,
+    PageCursor,
+    SORT_KEYS,
+    State,
+    TaskQuery,
+    Title,
+)
+from app.task.infrastructure.repositories import TaskRepository
+from app.task.infrastructure.repositories.task_repository import (
+    select_tasks_page,
+)
+
+OWNERS = 200
+TASKS_PER_OWNER = 500
+PAGE_SIZE = 20
+
+NOW = datetime.now(timezone.utc)
+WORDS = ["report", "invoice", "deploy", "review", "meeting", "backup", "audit"]
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) <statement>, keeping its bind parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: ClauseElement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+# --- Data -----------------------------------------------------------------
+
+def new_task(owner_id: EntityId) -> Task:
+    created_at = NOW - timedelta(minutes=random.randint(0, 525_600))
+    return Task(
+        title=Title(value=f"{random.choice(WORDS)} {uuid.uuid4().hex[:8]}"),
+        description=Description(value="index check"),
+        state=State(value=random.choice(["pending", "completed"])),
+        owner_id=owner_id,
+        created_at=created_at,
+        updated_at=created_at + timedelta(minutes=random.randint(0, 10_000)),
+    )
+
+
+async def seed() -> List[EntityId]:
+    owner_ids = [EntityId(uuid.uuid4()) for _ in range(OWNERS)]
+    async with async_session_factory() as session:
+        await session.execute(
+            insert(UserModel),
+            [
+                {
+                    "id": owner_id.value,
+                    "email": f"explain-{owner_id}@example.com",
+                    "hashed_password": "!",
+                }
+                for owner_id in owner_ids
+            ],
+        )
+        await session.commit()
+
+        repository = TaskRepository(session)
+        for owner_id in owner_ids:
+            await repository.copy_tasks(
+                [new_task(owner_id) for _ in range(TASKS_PER_OWNER)]
+            )
+
+        await session.execute(text("ANALYZE tasks"))
+    return owner_ids
+
+
+async def cleanup(owner_ids: List[EntityId]) -> None:
+    # Tasks go with their owner (ON DELETE CASCADE)
+    async with async_session_factory() as session:
+        await session.execute(
+            delete(UserModel).where(
+                UserModel.id.in_([owner_id.value for owner_id in owner_ids])
+            )
+        )
+        await session.commit()
+
+
+# --- Plans ----------------------------------------------------------------
+
+def combinations() -> Iterator[Tuple[Dict[str, Any], bool]]:
+    """(filters, with_cursor) for every filter combination and sort key."""
+    for states, created, updated, sort, with_cursor in itertools.product(
+        [None, ["pending"]], [False, True], [False, True], SORT_KEYS,
+        [False, True],
+    ):
+        filters: Dict[str, Any] = {"states": states, "sort": sort}
+        if created:
+            filters.update(
+                created_from=NOW - timedelta(days=90),
+                created_to=NOW - timedelta(days=30),
+            )
+        if updated:
+            filters["updated_from"] = NOW - timedelta(days=7)
+        yield filters, with_cursor
+
+
+def cursor_for(query: TaskQuery) -> PageCursor:
+    value: Any = "m" if query.sort_field == "title" else NOW - timedelta(days=60)
+    return PageCursor(value=value, id=uuid.uuid4(), sort=query.sort)
+
+
+def scans(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Every plan node reading the tasks table."""
+    if plan.get("Relation Name") == "tasks" or "Index Name" in plan:
+        yield plan
+    for child in plan.get("Plans", []):
+        yield from scans(child)
+
+
+async def explain(
+    session, owner_id: EntityId, query: TaskQuery, cursor: Optional[PageCursor]
+) -> List[Dict[str, Any]]:
+    stmt = select_tasks_page(owner_id, query, PAGE_SIZE + 1, cursor)
+    result = await session.execute(Explain(stmt))
+    document = result.scalar_one()
+    if isinstance(document, str):
+        document = json.loads(document)
+    return list(scans(document[0]["Plan"]))
+
+
+def describe(filters: Dict[str, Any], with_cursor: bool) -> str:
+    parts = [f"sort={filters['sort']}"]
+    if filters.get("states"):
+        parts.append("state")
+    if "created_from" in filters:
+        parts.append("created")
+    if "updated_from" in filters:
+        parts.append("updated")
+    if with_cursor:
+        parts.append("cursor")
+    return " ".join(parts)
+
+
+async def main() -> int:
+    await init_database()
+    owner_ids = await seed()
+    owner_id = random.choice(owner_ids)
+    failures = 0
+
+    try:
+        async with async_session_factory() as session:
+            print(f"{'query':<48}{'plan':<60}")
+            for filters, with_cursor in combinations():
+                query = TaskQuery.from_dict(filters)
+                cursor = cursor_for(query) if with_cursor else None
+                nodes = await explain(session, owner_id, query, cursor)
+
+                seq_scan = any(node["Node Type"] == "Seq Scan" for node in nodes)
+                failures += seq_scan
+                plan = ", ".join(
+                    f"{node['Node Type']} {node.get('Index Name', '')}".strip()
+                    for node in nodes
+                )
+                marker = "FAIL " if seq_scan else ""
+                print(f"{describe(filters, with_cursor):<48}{marker}{plan}")
+    finally:
+        await cleanup(owner_ids)
+        await engine.dispose()
+
+    print(f"\n{failures} queries without an index")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
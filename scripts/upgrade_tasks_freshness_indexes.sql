@@ -0,0 +1,20 @@
+-- Conditional GET: one task's freshness check is a primary key lookup,
+-- so ix_tasks_id, which duplicated the primary key, goes.
+--
+-- Does nothing once ix_tasks_id is gone, or before tasks exists.
+
+-- Covering (id) INCLUDE (owner_id, updated_at) index of earlier builds:
+-- a second unique-by-id btree that every write had to maintain
+DROP INDEX IF EXISTS ix_tasks_id_owner_id_updated_at;
+
+SELECT to_regclass('tasks') IS NOT NULL
+   AND to_regclass('ix_tasks_id') IS NOT NULL
+   AS needs_upgrade \gset
+
+\if :needs_upgrade
+
+DROP INDEX ix_tasks_id;
+
+\else
+\echo 'tasks freshness indexes: nothing to do'
+\endif
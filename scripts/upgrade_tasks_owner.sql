@@ -0,0 +1,59 @@
+-- Tasks scoped to their owner: tasks.owner_id and its indexes.
+--
+-- Tasks created before this change have no owner. They are all given to
+-- the user whose email is passed in owner_email; the script stops
+-- without changing anything if there are such tasks and no such user.
+--
+--   make db-upgrade TASKS_OWNER_EMAIL=admin@example.com
+--   psql -v ON_ERROR_STOP=1 --single-transaction \
+--        -v owner_email=admin@example.com -f scripts/upgrade_tasks_owner.sql
+--
+-- Does nothing once tasks.owner_id exists, or before tasks does.
+
+\if :{?owner_email}
+\else
+\set owner_email ''
+\endif
+
+SELECT to_regclass('tasks') IS NOT NULL AND NOT EXISTS (
+    SELECT 1 FROM information_schema.columns
+    WHERE table_schema = current_schema()
+      AND table_name = 'tasks'
+      AND column_name = 'owner_id'
+) AS needs_upgrade \gset
+
+\if :needs_upgrade
+
+-- Nullable first, so the existing rows can be backfilled
+ALTER TABLE tasks ADD COLUMN owner_id UUID;
+
+UPDATE tasks
+SET owner_id = (SELECT id FROM users WHERE email = :'owner_email');
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM tasks WHERE owner_id IS NULL) THEN
+        RAISE EXCEPTION 'tasks without an owner'
+            USING HINT = 'Pass the email of an existing user in owner_email '
+                         '(make db-upgrade TASKS_OWNER_EMAIL=...).';
+    END IF;
+END
+$$;
+
+ALTER TABLE tasks ALTER COLUMN owner_id SET NOT NULL;
+
+ALTER TABLE tasks
+    ADD CONSTRAINT tasks_owner_id_fkey
+    FOREIGN KEY (owner_id) REFERENCES users (id) ON DELETE CASCADE;
+
+-- Global pagination index, replaced by the per-owner one
+DROP INDEX IF EXISTS ix_tasks_created_at_id;
+
+CREATE INDEX ix_tasks_owner_id_created_at_id
+    ON tasks (owner_id, created_at DESC, id DESC);
+
+CREATE INDEX ix_tasks_owner_id_state ON tasks (owner_id, state);
+
+\else
+\echo 'tasks.owner_id: nothing to do'
+\endif
@@ -0,0 +1,33 @@
+-- Task search: pg_trgm, the tasks.search_vector generated column and
+-- the full-text and trigram indexes.
+--
+-- Adding a stored generated column rewrites tasks, holding off reads and
+-- writes to it until the transaction commits.
+--
+-- Does nothing once tasks.search_vector exists, or before tasks does.
+
+SELECT to_regclass('tasks') IS NOT NULL AND NOT EXISTS (
+    SELECT 1 FROM information_schema.columns
+    WHERE table_schema = current_schema()
+      AND table_name = 'tasks'
+      AND column_name = 'search_vector'
+) AS needs_upgrade \gset
+
+\if :needs_upgrade
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Same expression as TaskModel.search_vector (SEARCH_CONFIG = 'simple')
+ALTER TABLE tasks ADD COLUMN search_vector TSVECTOR
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+    ) STORED NOT NULL;
+
+CREATE INDEX ix_tasks_search_vector ON tasks USING gin (search_vector);
+
+CREATE INDEX ix_tasks_title_trgm ON tasks USING gin (title gin_trgm_ops);
+
+\else
+\echo 'tasks.search_vector: nothing to do'
+\endif
@@ -0,0 +1,25 @@
+-- Per-owner indexes for every GET /tasks sort key, and state filters in
+-- the default order.
+--
+-- Does nothing once the indexes exist, or before tasks does.
+
+SELECT to_regclass('tasks') IS NOT NULL AS needs_upgrade \gset
+
+\if :needs_upgrade
+
+CREATE INDEX IF NOT EXISTS ix_tasks_owner_id_updated_at_id
+    ON tasks (owner_id, updated_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS ix_tasks_owner_id_title_id
+    ON tasks (owner_id, title, id);
+
+-- Widened to (owner_id, state, created_at DESC, id DESC); state counts
+-- use its prefix
+CREATE INDEX IF NOT EXISTS ix_tasks_owner_id_state_created_at_id
+    ON tasks (owner_id, state, created_at DESC, id DESC);
+
+DROP INDEX IF EXISTS ix_tasks_owner_id_state;
+
+\else
+\echo 'tasks sort indexes: nothing to do'
+\endif
@@ -0,0 +1,69 @@
+-- Optimistic concurrency: the tasks.version column.
+--
+-- The column has a constant default, so adding it does not rewrite
+-- tasks; existing tasks start at version 1.
+--
+-- Does nothing once tasks.version exists, or before tasks does.
+
+-- Covering (id) INCLUDE (owner_id, updated_at, version) index of earlier
+-- builds: one task's check is a primary key lookup
+DROP INDEX IF EXISTS ix_tasks_id_owner_id_updated_at_version;
+
+SELECT to_regclass('tasks') IS NOT NULL AND NOT EXISTS (
+    SELECT 1 FROM information_schema.columns
+    WHERE table_schema = current_schema()
+      AND table_name = 'tasks'
+      AND column_name = 'version'
+) AS needs_upgrade \gset
+
+\if :needs_upgrade
+
+ALTER TABLE tasks ADD COLUMN version INTEGER NOT NULL DEFAULT 1;
+
+\else
+\echo 'tasks.version: nothing to do'
+\endif
+
+-- Page indexes of earlier builds carried INCLUDE (updated_at[, version]).
+-- Both columns change on every UPDATE, so those indexes ruled out HOT
+-- updates: rebuild any such index without its INCLUDE columns.
+
+SELECT to_regclass('tasks') IS NOT NULL AS has_tasks \gset
+
+\if :has_tasks
+
+DO $$
+DECLARE
+    index_name TEXT;
+BEGIN
+    FOR index_name IN
+        SELECT c.relname
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE i.indrelid = 'tasks'::regclass
+          AND i.indnatts > i.indnkeyatts
+          AND c.relname IN (
+              'ix_tasks_owner_id_created_at_id',
+              'ix_tasks_owner_id_updated_at_id',
+              'ix_tasks_owner_id_title_id',
+              'ix_tasks_owner_id_state_created_at_id'
+          )
+    LOOP
+        EXECUTE format('DROP INDEX %I', index_name);
+    END LOOP;
+END
+$$;
+
+CREATE INDEX IF NOT EXISTS ix_tasks_owner_id_created_at_id
+    ON tasks (owner_id, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS ix_tasks_owner_id_updated_at_id
+    ON tasks (owner_id, updated_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS ix_tasks_owner_id_title_id
+    ON tasks (owner_id, title, id);
+
+CREATE INDEX IF NOT EXISTS ix_tasks_owner_id_state_created_at_id
+    ON tasks (owner_id, state, created_at DESC, id DESC);
+
+\endif